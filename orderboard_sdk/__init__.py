@@ -28,6 +28,11 @@ Usage:
 """
 
 from .client import OrderBoardClient
+from .models import Order, OrderFrame
+from .relay import DisplayRelay
+from .fake import FakeOrderBoard
+from .watcher import AgingWatcher, AgingAlert
+from .sketch import WaitSketch, WaitEstimator
 
 __version__ = "1.0.0"
-__all__ = ["OrderBoardClient"]
+__all__ = ["OrderBoardClient", "Order", "OrderFrame", "DisplayRelay", "FakeOrderBoard", "AgingWatcher", "AgingAlert", "WaitSketch", "WaitEstimator"]
@@ -5,11 +5,17 @@ Python client for interacting with the Ghost Kitchen Order Board API.
 """
 
 import json
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from urllib.request import Request, urlopen
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
 
+from .models import Order, OrderFrame
+
+# Order results are plain dicts by default, models with typed=True
+OrderResult = Union[Dict[str, Any], Order]
+OrderListResult = Union[List[Dict[str, Any]], OrderFrame]
+
 
 class OrderBoardError(Exception):
     """Base exception for OrderBoard SDK errors."""
@@ -27,6 +33,8 @@ class OrderBoardClient:
         api_key: Your API key for authentication
         base_url: Base URL of the Order Board API (default: http://localhost:8000)
         timeout: Request timeout in seconds (default: 30)
+        typed: Return Order objects and OrderFrame lists instead of plain
+            dicts (default: False)
     
     Example:
         client = OrderBoardClient(
@@ -35,10 +43,23 @@ class OrderBoardClient:
         )
     """
     
-    def __init__(self, api_key: str, base_url: str = "http://localhost:8000", timeout: int = 30):
+    def __init__(self, api_key: str, base_url: str = "http://localhost:8000", timeout: int = 30, typed: bool = False):
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
+        self.typed = typed
+    
+    def _order(self, data: Optional[Dict[str, Any]]):
+        """Wrap a single order result according to the typed setting."""
+        if self.typed and data is not None:
+            return Order.from_dict(data)
+        return data
+    
+    def _orders(self, rows: List[Dict[str, Any]]):
+        """Wrap a list result according to the typed setting."""
+        if self.typed:
+            return OrderFrame(rows)
+        return rows
     
     def _make_request(self, method: str, endpoint: str, data: Dict = None, params: Dict = None) -> Dict:
         """Make an HTTP request to the API."""
@@ -87,7 +108,7 @@ class OrderBoardClient:
         status: str = "preparing",
         shelf_location: Optional[str] = None,
         notes: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> OrderResult:
         """
         Create a new order.
         
@@ -128,7 +149,7 @@ class OrderBoardClient:
         if not response.get('success'):
             raise OrderBoardError(response.get('error', 'Failed to create order'))
         
-        return response.get('order')
+        return self._order(response.get('order'))
     
     def update_order(
         self,
@@ -139,7 +160,7 @@ class OrderBoardClient:
         status: Optional[str] = None,
         shelf_location: Optional[str] = None,
         notes: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> OrderResult:
         """
         Update an existing order.
         
@@ -188,9 +209,9 @@ class OrderBoardClient:
         if not response.get('success'):
             raise OrderBoardError(response.get('error', 'Failed to update order'))
         
-        return response.get('order')
+        return self._order(response.get('order'))
     
-    def mark_ready(self, order_id: str, shelf_location: str) -> Dict[str, Any]:
+    def mark_ready(self, order_id: str, shelf_location: str) -> OrderResult:
         """
         Convenience method to mark an order as ready with a shelf location.
         
@@ -206,7 +227,7 @@ class OrderBoardClient:
         """
         return self.update_order(order_id=order_id, status="ready", shelf_location=shelf_location)
     
-    def get_order(self, order_id: str = None, id: int = None) -> Dict[str, Any]:
+    def get_order(self, order_id: str = None, id: int = None) -> OrderResult:
         """
         Get a single order by ID.
         
@@ -234,7 +255,7 @@ class OrderBoardClient:
         if not response.get('success'):
             raise OrderBoardError(response.get('error', 'Failed to get order'))
         
-        return response.get('order')
+        return self._order(response.get('order'))
     
     def list_orders(
         self,
@@ -242,7 +263,7 @@ class OrderBoardClient:
         platform: Optional[str] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> OrderListResult:
         """
         List orders with optional filters.
         
@@ -253,7 +274,7 @@ class OrderBoardClient:
             offset: Pagination offset
         
         Returns:
-            List of order data
+            List of order data (OrderFrame when typed=True)
         
         Example:
             # Get all ready orders
@@ -277,9 +298,46 @@ class OrderBoardClient:
         if not response.get('success'):
             raise OrderBoardError(response.get('error', 'Failed to list orders'))
         
-        return response.get('orders', [])
+        return self._orders(response.get('orders', []))
+    
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        include_archived: bool = True
+    ) -> OrderListResult:
+        """
+        Search active and archived orders by name, display name or order ID.
+        
+        Each word matches as a prefix, so "john d", "JOHN D" and "A1B2" all
+        work. Active orders are ranked ahead of archived (picked up) ones.
+        
+        Args:
+            query: Search text
+            limit: Maximum number of results (1-50, default 10)
+            include_archived: Also search picked-up orders (default: True)
+        
+        Returns:
+            Ranked list of matching orders (OrderFrame when typed=True)
+        
+        Example:
+            for o in client.search("john d", limit=5):
+                print(f"{o['display_name']} {o['order_id']} {o['status']}")
+        """
+        params = {'q': query}
+        if limit:
+            params['limit'] = limit
+        if not include_archived:
+            params['include_archived'] = 0
+        
+        response = self._make_request('GET', 'search-orders.php', params=params)
+        
+        if not response.get('success'):
+            raise OrderBoardError(response.get('error', 'Failed to search orders'))
+        
+        return self._orders(response.get('orders', []))
     
-    def delete_order(self, order_id: str = None, id: int = None) -> Dict[str, Any]:
+    def delete_order(self, order_id: str = None, id: int = None) -> OrderResult:
         """
         Delete an order (marks as picked up and archives).
         
@@ -306,16 +364,16 @@ class OrderBoardClient:
         if not response.get('success'):
             raise OrderBoardError(response.get('error', 'Failed to delete order'))
         
-        return response.get('order')
+        return self._order(response.get('order'))
     
-    def get_display_orders(self) -> List[Dict[str, Any]]:
+    def get_display_orders(self) -> OrderListResult:
         """
         Get orders formatted for display board.
         
         This endpoint is public and does not require authentication.
         
         Returns:
-            List of display-formatted orders
+            List of display-formatted orders (OrderFrame when typed=True)
         
         Example:
             display_orders = client.get_display_orders()
@@ -328,7 +386,7 @@ class OrderBoardClient:
         if not response.get('success'):
             raise OrderBoardError(response.get('error', 'Failed to get display orders'))
         
-        return response.get('orders', [])
+        return self._orders(response.get('orders', []))
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -348,3 +406,44 @@ class OrderBoardClient:
             raise OrderBoardError(response.get('error', 'Failed to get stats'))
         
         return response.get('stats')
+    
+    def get_eta(self, order_id: str = None, id: int = None, hour: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get wait-time quantiles and ETAs for active orders.
+        
+        PREPARING orders are estimated until READY, READY orders until pickup.
+        Estimates come from per-platform, per-hour sketches of past prep and
+        shelf dwell times, conditioned on how long the order has already waited.
+        
+        Args:
+            order_id: Only estimate this order (e.g., "ORD-XXXX")
+            id: Database ID (alternative to order_id)
+            hour: Report quantiles for this local hour (0-23) instead of all hours
+        
+        Returns:
+            Dict with 'hour', 'wait_times' ({'prep'|'dwell': {platform:
+            {'samples', 'p50', 'p75', 'p90'}}}) and 'orders' (one ETA per order,
+            with metric, elapsed_seconds, eta_seconds, eta_at and basis)
+        
+        Example:
+            eta = client.get_eta(order_id="ORD-A1B2C3D4")
+            print(f"Ready in ~{eta['orders'][0]['eta_seconds'] // 60} min")
+        """
+        params = {}
+        if order_id:
+            params['order_id'] = order_id
+        elif id:
+            params['id'] = id
+        if hour is not None:
+            params['hour'] = hour
+        
+        response = self._make_request('GET', 'eta.php', params=params)
+        
+        if not response.get('success'):
+            raise OrderBoardError(response.get('error', 'Failed to get ETAs'))
+        
+        return {
+            'hour': response.get('hour'),
+            'wait_times': response.get('wait_times', {}),
+            'orders': response.get('orders', [])
+        }
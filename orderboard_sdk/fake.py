@@ -0,0 +1,921 @@
+"""
+Ghost Kitchen Order Board SDK - Fake Server
+
+In-process stand-in for the PHP Order Board, for testing code built on the
+SDK or the SMCP plugin without PHP or a SQLite file.
+
+Every /api/*.php endpoint is implemented with the same validation, error
+messages, status codes, ordering (READY first, then created_at DESC) and
+display-name rules as the real server. State lives in memory behind a
+lock and is indexed so list, lookup and search don't scan every order.
+
+Usage:
+    with FakeOrderBoard() as board:        # listens on an ephemeral port
+        client = board.client()
+        client.create_order("John Doe", "doordash")
+
+    python -m orderboard_sdk.fake --port 8000
+"""
+
+import argparse
+import bisect
+import calendar
+import heapq
+import json
+import re
+import secrets
+import threading
+import time
+import unicodedata
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import chain, islice
+from typing import Optional, Dict, Any, List, Tuple, Callable, Iterable
+from urllib.parse import urlsplit, parse_qsl
+
+from .client import OrderBoardClient
+from .sketch import WaitEstimator
+
+
+PLATFORMS = ('doordash', 'ubereats', 'grubhub')
+STATUSES = ('preparing', 'ready')
+SHELF_LOCATIONS = ('A', 'B', 'C', 'D', 'E', 'F')
+
+# Allowed methods per endpoint (OPTIONS is always answered)
+ENDPOINTS = {
+    'create-order': ('POST',),
+    'update-order': ('POST', 'PUT'),
+    'list-orders': ('GET',),
+    'get-order': ('GET',),
+    'search-orders': ('GET',),
+    'delete-order': ('DELETE', 'POST'),
+    'display': ('GET',),
+    'stats': ('GET',),
+    'eta': ('GET',)
+}
+
+# FTS5 column weights used by searchOrders() (order_id, customer_name, display_name)
+_SEARCH_WEIGHTS = (10.0, 5.0, 5.0)
+
+_ASCII_UPPER = {c: c - 32 for c in range(ord('a'), ord('z') + 1)}
+
+
+class _Response(Exception):
+    """JSON response; raised to end a request early, like errorResponse() calling exit."""
+
+    def __init__(self, payload: Dict[str, Any], status: int = 200):
+        super().__init__(payload.get('error', ''))
+        self.payload = payload
+        self.status = status
+
+
+def _error(message: str, status: int = 400) -> _Response:
+    return _Response({'success': False, 'error': message}, status)
+
+
+def _php_upper(value: str) -> str:
+    """strtoupper(): ASCII letters only, like PHP 8."""
+    return value.translate(_ASCII_UPPER)
+
+
+def _php_empty(value: Any) -> bool:
+    """PHP empty() for JSON-decoded values."""
+    return value is None or value is False or value == 0 or value == '' or value == '0' or value == [] or value == {}
+
+
+def _php_int(value: Any) -> int:
+    """PHP (int) cast for request values."""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        match = re.match(r'\s*[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?', value)
+        return int(float(match.group(0))) if match else 0
+    return 0
+
+
+def _php_str(value: Any) -> Any:
+    """Coerce scalars the way SQLite3 text binding does; leave None alone."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return '1' if value else ''
+    return str(value)
+
+
+def _php_bool(value: str) -> bool:
+    """filter_var($v, FILTER_VALIDATE_BOOLEAN)."""
+    return value.strip().lower() in ('1', 'true', 'on', 'yes')
+
+
+def format_customer_name(name: str) -> str:
+    """Same rule as formatCustomerName(): "John Doe" -> "JOHN D", "Madonna" -> "MADONNA"."""
+    name = name.strip(' \t\n\r\0\x0b')
+    parts = re.split(r'[ \t\n\r\f\v]+', name)
+    if len(parts) >= 2:
+        return _php_upper(parts[0]) + ' ' + _php_upper(parts[-1][:1])
+    return _php_upper(name)
+
+
+def _fold(token: str) -> str:
+    """Case- and diacritic-fold a token like the FTS5 unicode61 tokenizer."""
+    decomposed = unicodedata.normalize('NFKD', token)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def _tokens(text: Optional[str]) -> List[str]:
+    return [_fold(t) for t in re.findall(r'[^\W_]+', text or '')]
+
+
+class _SearchIndex:
+    """
+    Prefix index over order_id, customer_name and display name.
+
+    Tokens are kept in a sorted vocabulary so a prefix maps to a contiguous
+    slice found by bisection; postings map each token to document keys.
+    """
+
+    def __init__(self):
+        self._vocab = []  # type: List[str]
+        self._postings = {}  # type: Dict[str, set]
+        self._docs = {}  # type: Dict[tuple, Tuple[set, ...]]
+
+    def add(self, key: tuple, order_id: str, customer_name: str) -> None:
+        columns = (
+            set(_tokens(order_id)),
+            set(_tokens(customer_name)),
+            set(_tokens(format_customer_name(customer_name)))
+        )
+        self._docs[key] = columns
+        for token in set().union(*columns):
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = set()
+                bisect.insort(self._vocab, token)
+            posting.add(key)
+
+    def remove(self, key: tuple) -> None:
+        columns = self._docs.pop(key, None)
+        if columns is None:
+            return
+        for token in set().union(*columns):
+            posting = self._postings[token]
+            posting.discard(key)
+            if not posting:
+                del self._postings[token]
+                del self._vocab[bisect.bisect_left(self._vocab, token)]
+
+    def _prefix(self, prefix: str) -> Iterable[str]:
+        i = bisect.bisect_left(self._vocab, prefix)
+        while i < len(self._vocab) and self._vocab[i].startswith(prefix):
+            yield self._vocab[i]
+            i += 1
+
+    def match(self, terms: List[str]) -> Dict[tuple, float]:
+        """
+        Return {key: score} for documents matching every term as a prefix.
+
+        Scores weigh which columns matched (order_id over names) and favour
+        whole-token matches; an approximation of the server's bm25() rank.
+        """
+        matched = None
+        for term in terms:
+            docs = set()
+            for token in self._prefix(term):
+                docs |= self._postings[token]
+            matched = docs if matched is None else matched & docs
+            if not matched:
+                return {}
+
+        scores = {}
+        for key in matched:
+            score = 0.0
+            for term in terms:
+                for weight, column in zip(_SEARCH_WEIGHTS, self._docs[key]):
+                    if term in column:
+                        score += weight * 2
+                    elif any(token.startswith(term) for token in column):
+                        score += weight
+            scores[key] = score
+        return scores
+
+
+class FakeOrderBoard:
+    """
+    In-memory Order Board serving the real HTTP API.
+
+    Args:
+        api_keys: Valid API keys (default: one generated key, see api_key)
+        clock: Returns the current UNIX time; override to control timestamps
+        rate_limit: Requests per window per API key, like RATE_LIMIT_ENABLED
+            with RATE_LIMIT_REQUESTS (default: disabled, as on the server)
+        rate_limit_window: Rate limit window in seconds (default: 60)
+        max_display_orders: Orders in the display feed (default: 12)
+        refresh_interval: refresh_interval reported by the display feed
+            in milliseconds (default: 5000)
+
+    Example:
+        with FakeOrderBoard() as board:
+            client = board.client()
+            order = client.create_order("John Doe", "doordash")
+            assert order['display_name'] == "JOHN D"
+    """
+
+    def __init__(
+        self,
+        api_keys: Optional[Iterable[str]] = None,
+        clock: Callable[[], float] = time.time,
+        rate_limit: Optional[int] = None,
+        rate_limit_window: int = 60,
+        max_display_orders: int = 12,
+        refresh_interval: int = 5000
+    ):
+        self.clock = clock
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.max_display_orders = max_display_orders
+        self.refresh_interval = refresh_interval
+        self._keys = {}  # type: Dict[str, int]
+        for key in (api_keys if api_keys is not None else [self._generate_key()]):
+            self._keys[key] = len(self._keys) + 1
+        self._lock = threading.RLock()
+        self._server = None  # type: Optional[ThreadingHTTPServer]
+        self._thread = None  # type: Optional[threading.Thread]
+        self.reset()
+
+    # -- state -----------------------------------------------------------
+
+    def reset(self) -> None:
+        """Drop all orders, history, usage counters and rate limit windows."""
+        with self._lock:
+            self._orders = {}  # type: Dict[int, Dict[str, Any]]
+            self._by_order_id = {}  # type: Dict[str, int]
+            # (status, platform) -> sorted [(created_at, id)]
+            self._sorted = {(s, p): [] for s in STATUSES for p in PLATFORMS}
+            self._history = {}  # type: Dict[int, Dict[str, Any]]
+            self._search = _SearchIndex()
+            self.wait_times = WaitEstimator()
+            self._next_id = 1
+            self._next_history_id = 1
+            self.api_usage = {}  # type: Dict[Tuple[str, str], List[int]]
+            self._rate_windows = {}  # type: Dict[str, Tuple[float, int]]
+
+    @staticmethod
+    def _generate_key() -> str:
+        return 'gkob_' + secrets.token_hex(24)
+
+    @property
+    def api_key(self) -> str:
+        """The first valid API key."""
+        return next(iter(self._keys))
+
+    def create_api_key(self) -> str:
+        """Add and return a new valid API key."""
+        key = self._generate_key()
+        with self._lock:
+            self._keys[key] = len(self._keys) + 1
+        return key
+
+    def _now(self) -> str:
+        """CURRENT_TIMESTAMP: UTC, second precision."""
+        return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(self.clock()))
+
+    def _index(self, order: Dict[str, Any]) -> None:
+        bisect.insort(self._sorted[(order['status'], order['platform'])], (order['created_at'], order['id']))
+
+    def _unindex(self, order: Dict[str, Any]) -> None:
+        keys = self._sorted[(order['status'], order['platform'])]
+        del keys[bisect.bisect_left(keys, (order['created_at'], order['id']))]
+
+    # -- core functions (mirror public/includes/functions.php) ------------
+
+    def create_order(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """createOrder(): raises ValueError for validation, RuntimeError for constraint failures."""
+        if _php_empty(data.get('customer_name')):
+            raise ValueError('Customer name is required')
+        platform = data.get('platform')
+        if _php_empty(platform) or str(platform).lower() not in PLATFORMS:
+            raise ValueError('Valid platform is required (doordash, ubereats, grubhub)')
+
+        order_id = _php_str(data['order_id']) if data.get('order_id') is not None else None
+        status = data['status'] if data.get('status') is not None else 'preparing'
+        shelf = _php_upper(_php_str(data['shelf_location'])) if data.get('shelf_location') is not None else None
+        if not _php_empty(shelf) and shelf not in SHELF_LOCATIONS:
+            raise ValueError('Invalid shelf location (A-F)')
+
+        with self._lock:
+            if order_id is None:
+                order_id = 'ORD-' + secrets.token_hex(4).upper()
+            # Table constraints: UNIQUE order_id and the status/shelf CHECKs
+            if order_id in self._by_order_id or status not in STATUSES or (shelf is not None and shelf not in SHELF_LOCATIONS):
+                raise RuntimeError('Failed to create order')
+
+            now = self._now()
+            order = {
+                'id': self._next_id,
+                'order_id': order_id,
+                'customer_name': _php_str(data['customer_name']),
+                'platform': str(platform).lower(),
+                'status': status,
+                'shelf_location': shelf,
+                'notes': _php_str(data.get('notes')),
+                'created_at': now,
+                'updated_at': now,
+                'ready_at': None,
+                'picked_up_at': None
+            }
+            self._next_id += 1
+            self._orders[order['id']] = order
+            self._by_order_id[order_id] = order['id']
+            self._index(order)
+            self._search.add(('active', order['id']), order_id, order['customer_name'])
+            return dict(order)
+
+    def get_order_by_id(self, id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            order = self._orders.get(id)
+            return dict(order) if order else None
+
+    def get_order_by_order_id(self, order_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            id = self._by_order_id.get(order_id)
+            return self.get_order_by_id(id) if id is not None else None
+
+    def update_order(self, id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """updateOrder(): validates every field before changing anything."""
+        with self._lock:
+            order = self._orders.get(id)
+            if order is None:
+                raise ValueError('Order not found')
+
+            updates = {}
+            if data.get('customer_name') is not None:
+                updates['customer_name'] = _php_str(data['customer_name'])
+
+            if data.get('platform') is not None:
+                platform = str(data['platform']).lower()
+                if platform not in PLATFORMS:
+                    raise ValueError('Invalid platform')
+                updates['platform'] = platform
+
+            if data.get('status') is not None:
+                status = str(data['status']).lower()
+                if status not in STATUSES:
+                    raise ValueError('Invalid status (preparing or ready)')
+                updates['status'] = status
+                if status == 'ready' and order['status'] != 'ready':
+                    updates['ready_at'] = self._now()
+
+            if 'shelf_location' in data:
+                location = _php_upper(_php_str(data['shelf_location'])) if not _php_empty(data['shelf_location']) else None
+                if location and location not in SHELF_LOCATIONS:
+                    raise ValueError('Invalid shelf location (A-F)')
+                updates['shelf_location'] = location
+
+            if data.get('notes') is not None:
+                updates['notes'] = _php_str(data['notes'])
+
+            if not updates:
+                return dict(order)
+
+            updates['updated_at'] = self._now()
+            self._unindex(order)
+            order.update(updates)
+            self._index(order)
+            if 'ready_at' in updates:
+                self.wait_times.observe('prep', order['platform'], order['created_at'], order['ready_at'])
+            if 'customer_name' in updates:
+                self._search.remove(('active', id))
+                self._search.add(('active', id), order['order_id'], order['customer_name'])
+            return dict(order)
+
+    def delete_order(self, id: int) -> bool:
+        """deleteOrder(): archive to history as picked up and remove from the board."""
+        with self._lock:
+            order = self._orders.pop(id, None)
+            if order is None:
+                return False
+
+            now = self._now()
+            wait = None
+            if order['ready_at'] is not None:
+                ready = calendar.timegm(time.strptime(order['ready_at'], '%Y-%m-%d %H:%M:%S'))
+                picked = calendar.timegm(time.strptime(now, '%Y-%m-%d %H:%M:%S'))
+                wait = picked - ready
+                self.wait_times.observe('dwell', order['platform'], order['ready_at'], now)
+
+            history = {
+                'id': self._next_history_id,
+                'order_id': order['order_id'],
+                'customer_name': order['customer_name'],
+                'platform': order['platform'],
+                'created_at': order['created_at'],
+                'ready_at': order['ready_at'],
+                'picked_up_at': now,
+                'wait_time_seconds': wait,
+                'archived_at': now
+            }
+            self._next_history_id += 1
+            self._history[history['id']] = history
+
+            del self._by_order_id[order['order_id']]
+            self._unindex(order)
+            self._search.remove(('active', id))
+            self._search.add(('archived', history['id']), order['order_id'], order['customer_name'])
+            return True
+
+    def list_orders(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """listOrders(): READY first, then created_at DESC, with optional limit/offset."""
+        filters = filters or {}
+        if 'offset' in filters and 'limit' not in filters:
+            # The server builds "... OFFSET n" with no LIMIT, which SQLite rejects
+            raise RuntimeError('OFFSET without LIMIT')
+
+        status = filters.get('status')
+        platform = filters.get('platform')
+        statuses = [s for s in ('ready', 'preparing') if status is None or status.lower() == s]
+        platforms = [p for p in PLATFORMS if platform is None or platform.lower() == p]
+
+        with self._lock:
+            keys = []
+            for s in statuses:
+                runs = [reversed(self._sorted[(s, p)]) for p in platforms]
+                keys.append(heapq.merge(*runs, reverse=True))
+            rows = chain.from_iterable(keys)
+
+            offset = filters.get('offset', 0)
+            limit = filters.get('limit')
+            stop = None if limit is None else offset + limit
+            return [dict(self._orders[id]) for _, id in islice(rows, offset, stop)]
+
+    def display_orders(self) -> List[Dict[str, Any]]:
+        """getDisplayOrders()."""
+        now = self.clock()
+        return [{
+            'id': order['id'],
+            'order_id': order['order_id'],
+            'name': format_customer_name(order['customer_name']),
+            'platform': order['platform'],
+            'status': order['status'],
+            'shelf': order['shelf_location'],
+            'created_at': order['created_at'],
+            'eta_at': self.estimate_order_eta(order, now)['eta_at'] if order['status'] == 'preparing' else None
+        } for order in self.list_orders({'limit': self.max_display_orders})]
+
+    def estimate_order_eta(self, order: Dict[str, Any], now: Optional[float] = None) -> Dict[str, Any]:
+        """estimateOrderEta()."""
+        with self._lock:
+            return self.wait_times.estimate(order, self.clock() if now is None else now)
+
+    def wait_time_quantiles(self, hour: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """getWaitTimeQuantiles()."""
+        with self._lock:
+            return self.wait_times.summary(PLATFORMS, hour)
+
+    def search_orders(self, query: str, limit: int = 10, include_archived: bool = True) -> List[Dict[str, Any]]:
+        """searchOrders(): every word matches as a prefix; active orders rank ahead of archived."""
+        terms = [_fold(t) for t in re.findall(r'[^\W_]+', query)]
+        if not terms:
+            raise ValueError('Search query is required')
+
+        with self._lock:
+            scores = self._search.match(terms)
+            rows = []
+            for (source, id), score in scores.items():
+                if source == 'archived' and not include_archived:
+                    continue
+                if source == 'active':
+                    row = dict(self._orders[id], picked_up_at=None)
+                else:
+                    h = self._history[id]
+                    row = dict(h, status='picked_up', shelf_location=None)
+                rows.append((source == 'archived', -score, row))
+
+        # created_at DESC as the final tie-break
+        rows.sort(key=lambda r: r[2]['created_at'] or '', reverse=True)
+        rows.sort(key=lambda r: (r[0], r[1]))
+        return [{
+            'id': row['id'],
+            'order_id': row['order_id'],
+            'customer_name': row['customer_name'],
+            'display_name': format_customer_name(row['customer_name']),
+            'platform': row['platform'],
+            'status': row['status'],
+            'shelf_location': row['shelf_location'],
+            'created_at': row['created_at'],
+            'ready_at': row['ready_at'],
+            'picked_up_at': row['picked_up_at'],
+            'archived': archived
+        } for archived, _, row in rows[:limit]]
+
+    def order_stats(self) -> Dict[str, Any]:
+        """getOrderStats()."""
+        with self._lock:
+            stats = {
+                'active_orders': len(self._orders),
+                'preparing': 0,
+                'ready': 0,
+                'by_platform': {},
+                'today_completed': 0,
+                'avg_wait_time': 0
+            }
+            for (status, platform), keys in self._sorted.items():
+                if keys:
+                    stats[status] += len(keys)
+                    stats['by_platform'][platform] = stats['by_platform'].get(platform, 0) + len(keys)
+
+            today = self._now()[:10]
+            waits = []
+            for history in self._history.values():
+                if history['archived_at'] >= today:
+                    stats['today_completed'] += 1
+                    if history['wait_time_seconds'] is not None:
+                        waits.append(history['wait_time_seconds'])
+
+        # PHP encodes an empty array as [] and round() returns a float
+        stats['by_platform'] = stats['by_platform'] or []
+        if waits:
+            average = sum(waits) / len(waits)
+            if average:
+                stats['avg_wait_time'] = float(int(average + 0.5))
+        return stats
+
+    def track_api_usage(self, endpoint: str, error: bool = False) -> None:
+        """trackApiUsage(): an error call counts as another request, as on the server."""
+        with self._lock:
+            counts = self.api_usage.setdefault((endpoint, time.strftime('%Y-%m-%d', time.localtime(self.clock()))), [0, 0])
+            counts[0] += 1
+            counts[1] += int(error)
+
+    # -- request handling (mirror public/api/*.php) ------------------------
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: bytes = b'',
+        remote_addr: str = '127.0.0.1'
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Handle one request without going through HTTP.
+
+        Args:
+            method: HTTP method
+            path: Request path including the query string
+            headers: Request headers (names are case-insensitive)
+            body: Raw request body
+            remote_addr: Client address used for rate limiting
+
+        Returns:
+            (status, headers, body) tuple
+        """
+        url = urlsplit(path)
+        match = re.fullmatch(r'/api/([a-z-]+)\.php', url.path)
+        endpoint = match.group(1) if match else None
+        if endpoint not in ENDPOINTS:
+            return self._respond({'success': False, 'error': 'Not found'}, 404)
+
+        if method == 'OPTIONS':
+            allowed = ', '.join(ENDPOINTS[endpoint] + ('OPTIONS',))
+            allow_headers = 'Content-Type' if endpoint == 'display' else 'Content-Type, X-API-Key'
+            return 200, {
+                'Access-Control-Allow-Origin': '*',
+                'Access-Control-Allow-Methods': allowed,
+                'Access-Control-Allow-Headers': allow_headers
+            }, b''
+
+        request = _Request(method, dict(parse_qsl(url.query, keep_blank_values=True)), headers or {}, body, remote_addr)
+        handler = getattr(self, '_api_' + endpoint.replace('-', '_'))
+        try:
+            if method not in ENDPOINTS[endpoint]:
+                raise _error('Method not allowed', 405)
+            if endpoint != 'display':
+                self._require_api_key(request)
+            response = handler(request)
+        except _Response as error:
+            response = error
+        return self._respond(response.payload, response.status)
+
+    @staticmethod
+    def _respond(payload: Dict[str, Any], status: int) -> Tuple[int, Dict[str, str], bytes]:
+        return status, {
+            'Content-Type': 'application/json',
+            'Access-Control-Allow-Origin': '*',
+            'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+            'Access-Control-Allow-Headers': 'Content-Type, X-API-Key'
+        }, json.dumps(payload, indent=4).encode('utf-8')
+
+    def _require_api_key(self, request: '_Request') -> None:
+        """requireApiKey() followed by enforceRateLimit()."""
+        key = request.header('X-API-Key')
+        if key is None:
+            key = request.query.get('api_key')
+        if key is None:
+            key = request.json().get('api_key')
+        key_id = self._keys.get(key) if key else None
+        if key_id is None:
+            raise _error('Invalid or missing API key', 401)
+
+        if self.rate_limit is not None:
+            identifier = f'apikey_{key_id}'
+            now = self.clock()
+            with self._lock:
+                start, count = self._rate_windows.get(identifier, (now, 0))
+                if start < now - self.rate_limit_window:
+                    start, count = now, 0
+                if count >= self.rate_limit:
+                    raise _error('Rate limit exceeded', 429)
+                self._rate_windows[identifier] = (start, count + 1)
+
+    def _fail(self, endpoint: str, message: str, status: int = 400) -> _Response:
+        self.track_api_usage(endpoint, True)
+        return _error(message, status)
+
+    def _api_create_order(self, request: '_Request') -> _Response:
+        self.track_api_usage('create-order')
+        data = request.json()
+        if _php_empty(data.get('customer_name')):
+            raise self._fail('create-order', 'Missing required field: customer_name')
+        if _php_empty(data.get('platform')):
+            raise self._fail('create-order', 'Missing required field: platform')
+        try:
+            order = self.create_order(data)
+        except ValueError as e:
+            raise self._fail('create-order', str(e))
+        except RuntimeError:
+            raise self._fail('create-order', 'Internal server error', 500)
+        return _Response({
+            'success': True,
+            'message': 'Order created successfully',
+            'order': {
+                'id': order['id'],
+                'order_id': order['order_id'],
+                'customer_name': order['customer_name'],
+                'display_name': format_customer_name(order['customer_name']),
+                'platform': order['platform'],
+                'status': order['status'],
+                'shelf_location': order['shelf_location'],
+                'created_at': order['created_at']
+            }
+        }, 201)
+
+    def _find(self, endpoint: str, source: Dict[str, Any], missing: str) -> Dict[str, Any]:
+        """Look an order up by id or order_id, as the update/get/delete endpoints do."""
+        if source.get('id') is not None:
+            order = self.get_order_by_id(_php_int(source['id']))
+        elif source.get('order_id') is not None:
+            order = self.get_order_by_order_id(_php_str(source['order_id']))
+        else:
+            raise self._fail(endpoint, missing)
+        if order is None:
+            raise self._fail(endpoint, 'Order not found', 404)
+        return order
+
+    def _api_update_order(self, request: '_Request') -> _Response:
+        self.track_api_usage('update-order')
+        data = request.json()
+        order = self._find('update-order', data, 'Missing required field: id or order_id')
+        try:
+            updated = self.update_order(order['id'], data)
+        except ValueError as e:
+            raise self._fail('update-order', str(e))
+        return _Response({
+            'success': True,
+            'message': 'Order updated successfully',
+            'order': {
+                'id': updated['id'],
+                'order_id': updated['order_id'],
+                'customer_name': updated['customer_name'],
+                'display_name': format_customer_name(updated['customer_name']),
+                'platform': updated['platform'],
+                'status': updated['status'],
+                'shelf_location': updated['shelf_location'],
+                'updated_at': updated['updated_at']
+            }
+        })
+
+    @staticmethod
+    def _list_row(order: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'id': order['id'],
+            'order_id': order['order_id'],
+            'customer_name': order['customer_name'],
+            'display_name': format_customer_name(order['customer_name']),
+            'platform': order['platform'],
+            'status': order['status'],
+            'shelf_location': order['shelf_location'],
+            'notes': order['notes'],
+            'created_at': order['created_at'],
+            'updated_at': order['updated_at'],
+            'ready_at': order['ready_at']
+        }
+
+    def _api_list_orders(self, request: '_Request') -> _Response:
+        self.track_api_usage('list-orders')
+        query = request.query
+        filters = {}
+        if not _php_empty(query.get('status')):
+            filters['status'] = query['status']
+        if not _php_empty(query.get('platform')):
+            filters['platform'] = query['platform']
+        if 'limit' in query:
+            filters['limit'] = max(1, min(100, _php_int(query['limit'])))
+        if 'offset' in query:
+            filters['offset'] = max(0, _php_int(query['offset']))
+        try:
+            orders = [self._list_row(order) for order in self.list_orders(filters)]
+        except RuntimeError:
+            raise self._fail('list-orders', 'Internal server error', 500)
+        return _Response({'success': True, 'orders': orders, 'count': len(orders)})
+
+    def _api_get_order(self, request: '_Request') -> _Response:
+        self.track_api_usage('get-order')
+        order = self._find('get-order', request.query, 'Missing required parameter: id or order_id')
+        return _Response({'success': True, 'order': self._list_row(order)})
+
+    def _api_search_orders(self, request: '_Request') -> _Response:
+        self.track_api_usage('search-orders')
+        query = request.query
+        if query.get('q', '').strip(' \t\n\r\0\x0b') == '':
+            raise self._fail('search-orders', 'Missing required parameter: q')
+        limit = max(1, min(50, _php_int(query['limit']))) if 'limit' in query else 10
+        include_archived = 'include_archived' not in query or _php_bool(query['include_archived'])
+        try:
+            orders = self.search_orders(query['q'], limit, include_archived)
+        except ValueError as e:
+            raise self._fail('search-orders', str(e))
+        return _Response({'success': True, 'query': query['q'], 'orders': orders, 'count': len(orders)})
+
+    def _api_delete_order(self, request: '_Request') -> _Response:
+        self.track_api_usage('delete-order')
+        order = self._find('delete-order', request.json(), 'Missing required field: id or order_id')
+        if not self.delete_order(order['id']):
+            raise self._fail('delete-order', 'Failed to delete order', 500)
+        return _Response({
+            'success': True,
+            'message': 'Order removed (archived as picked up)',
+            'order': {
+                'id': order['id'],
+                'order_id': order['order_id'],
+                'customer_name': order['customer_name']
+            }
+        })
+
+    def _api_display(self, request: '_Request') -> _Response:
+        orders = self.display_orders()
+        return _Response({
+            'success': True,
+            'timestamp': datetime.fromtimestamp(self.clock()).astimezone().isoformat(timespec='seconds'),
+            'refresh_interval': self.refresh_interval,
+            'orders': orders,
+            'count': len(orders)
+        })
+
+    def _api_stats(self, request: '_Request') -> _Response:
+        self.track_api_usage('stats')
+        return _Response({'success': True, 'stats': self.order_stats()})
+
+    def _api_eta(self, request: '_Request') -> _Response:
+        self.track_api_usage('eta')
+        query = request.query
+        hour = None
+        if query.get('hour', '') != '':
+            hour = query['hour'].strip(' \t\n\r\x0b')
+            # FILTER_VALIDATE_INT: optional sign, no leading zeros
+            if not re.fullmatch(r'[+-]?(0|[1-9][0-9]*)', hour) or not 0 <= int(hour) <= 23:
+                raise self._fail('eta', 'Invalid hour. Must be 0-23')
+            hour = int(hour)
+        if 'id' in query or 'order_id' in query:
+            order = self._find('eta', query, '')
+            orders = [order]
+        else:
+            orders = self.list_orders()
+        now = self.clock()
+        etas = [dict({
+            'id': order['id'],
+            'order_id': order['order_id'],
+            'platform': order['platform'],
+            'status': order['status']
+        }, **self.estimate_order_eta(order, now)) for order in orders]
+        return _Response({
+            'success': True,
+            'hour': hour,
+            'wait_times': self.wait_time_quantiles(hour),
+            'orders': etas,
+            'count': len(etas)
+        })
+
+    # -- HTTP server -------------------------------------------------------
+
+    def start(self, host: str = '127.0.0.1', port: int = 0) -> 'FakeOrderBoard':
+        """Start serving in a background thread (port 0 picks a free port)."""
+        if self._server is not None:
+            return self
+        handler = type('FakeHandler', (_FakeHandler,), {'board': self})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the background server."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the running server."""
+        if self._server is None:
+            raise RuntimeError('FakeOrderBoard is not running; call start() first')
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def client(self, **kwargs) -> OrderBoardClient:
+        """Return an OrderBoardClient pointed at this server with a valid key."""
+        kwargs.setdefault('api_key', self.api_key)
+        return OrderBoardClient(base_url=self.base_url, **kwargs)
+
+    def __enter__(self) -> 'FakeOrderBoard':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+class _Request:
+    """Parsed request as seen by an endpoint."""
+    __slots__ = ('method', 'query', 'headers', 'body', 'remote_addr', '_json')
+
+    def __init__(self, method: str, query: Dict[str, str], headers: Dict[str, str], body: bytes, remote_addr: str):
+        self.method = method
+        self.query = query
+        self.headers = {name.lower(): value for name, value in headers.items()}
+        self.body = body
+        self.remote_addr = remote_addr
+        self._json = None
+
+    def header(self, name: str) -> Optional[str]:
+        return self.headers.get(name.lower())
+
+    def json(self) -> Dict[str, Any]:
+        """getJsonBody(): the decoded object, or {} if the body isn't a JSON object."""
+        if self._json is None:
+            try:
+                data = json.loads(self.body.decode('utf-8')) if self.body else None
+            except (ValueError, UnicodeDecodeError):
+                data = None
+            self._json = data if isinstance(data, dict) else {}
+        return self._json
+
+
+class _FakeHandler(BaseHTTPRequestHandler):
+    """Adapts http.server requests onto FakeOrderBoard.handle()."""
+    board = None  # type: FakeOrderBoard
+    protocol_version = 'HTTP/1.1'
+
+    def _dispatch(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        status, headers, payload = self.board.handle(
+            self.command, self.path, dict(self.headers.items()), body, self.client_address[0]
+        )
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_OPTIONS = do_PATCH = _dispatch
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ghost Kitchen Order Board - Fake Server")
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8000, help='Port to listen on (default: 8000, 0 for any free port)')
+    parser.add_argument('--api-key', dest='api_key', action='append', help='Accept this API key (repeatable; default: generate one)')
+    args = parser.parse_args()
+
+    board = FakeOrderBoard(api_keys=args.api_key).start(args.host, args.port)
+    print(f"Fake Order Board on {board.base_url}/api/ (API key: {board.api_key})")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        board.stop()
+
+
+if __name__ == "__main__":
+    main()
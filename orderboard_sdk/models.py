@@ -0,0 +1,350 @@
+"""
+Ghost Kitchen Order Board SDK - Models
+
+Optional typed, compact representations of API results. Enable them with
+``OrderBoardClient(..., typed=True)``; plain dicts remain the default.
+
+    Order       a single order with __slots__ and lazily parsed timestamps
+    OrderFrame  column-oriented storage for bulk results
+"""
+
+import math
+import sys
+from array import array
+from datetime import datetime, timezone
+from itertools import compress
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Callable, Union
+
+
+# Fields that hold timestamps ("YYYY-MM-DD HH:MM:SS", UTC, as stored by SQLite)
+TIMESTAMP_FIELDS = ('created_at', 'updated_at', 'ready_at', 'picked_up_at', 'archived_at', 'eta_at')
+
+# Fields with a small set of repeated values
+CATEGORY_FIELDS = ('platform', 'status', 'shelf_location')
+
+# Every field an Order can carry (list/get rows, display rows, search rows, history rows)
+_FIELDS = (
+    'id', 'order_id', 'customer_name', 'display_name', 'platform', 'status',
+    'shelf_location', 'notes', 'created_at', 'updated_at', 'ready_at',
+    'picked_up_at', 'archived_at', 'wait_time_seconds', 'eta_at', 'eta_seconds', 'archived'
+)
+
+# Display feed uses short keys; map them onto the full field names
+_ALIASES = {'name': 'display_name', 'shelf': 'shelf_location'}
+
+_UNSET = object()
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an API timestamp into an aware UTC datetime (None passes through)."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Order:
+    """
+    Typed order record.
+
+    Platform, status and shelf strings are interned so thousands of orders
+    share one copy of each. Timestamps are kept as the raw API strings and
+    parsed into datetimes on first access.
+
+    Example:
+        order = Order.from_dict(client.get_order(order_id="ORD-A1B2C3D4"))
+        print(order.display_name, order.created_at.isoformat())
+    """
+
+    __slots__ = (
+        'id', 'order_id', 'customer_name', 'display_name', 'platform', 'status',
+        'shelf_location', 'notes', 'wait_time_seconds', 'eta_seconds', 'archived',
+        '_raw_created_at', '_raw_updated_at', '_raw_ready_at', '_raw_picked_up_at', '_raw_archived_at', '_raw_eta_at',
+        '_created_at', '_updated_at', '_ready_at', '_picked_up_at', '_archived_at', '_eta_at'
+    )
+
+    def __init__(
+        self,
+        id: Optional[int] = None,
+        order_id: Optional[str] = None,
+        customer_name: Optional[str] = None,
+        display_name: Optional[str] = None,
+        platform: Optional[str] = None,
+        status: Optional[str] = None,
+        shelf_location: Optional[str] = None,
+        notes: Optional[str] = None,
+        created_at: Optional[str] = None,
+        updated_at: Optional[str] = None,
+        ready_at: Optional[str] = None,
+        picked_up_at: Optional[str] = None,
+        archived_at: Optional[str] = None,
+        wait_time_seconds: Optional[int] = None,
+        eta_at: Optional[str] = None,
+        eta_seconds: Optional[int] = None,
+        archived: Optional[bool] = None
+    ):
+        self.id = id
+        self.order_id = order_id
+        self.customer_name = customer_name
+        self.display_name = display_name
+        self.platform = _intern(platform)
+        self.status = _intern(status)
+        self.shelf_location = _intern(shelf_location)
+        self.notes = notes
+        self.wait_time_seconds = wait_time_seconds
+        self.eta_seconds = eta_seconds
+        self.archived = archived
+        self._raw_created_at = created_at
+        self._raw_updated_at = updated_at
+        self._raw_ready_at = ready_at
+        self._raw_picked_up_at = picked_up_at
+        self._raw_archived_at = archived_at
+        self._raw_eta_at = eta_at
+        self._created_at = _UNSET
+        self._updated_at = _UNSET
+        self._ready_at = _UNSET
+        self._picked_up_at = _UNSET
+        self._archived_at = _UNSET
+        self._eta_at = _UNSET
+
+    def _timestamp(self, field: str) -> Optional[datetime]:
+        cached = getattr(self, '_' + field)
+        if cached is _UNSET:
+            cached = parse_timestamp(getattr(self, '_raw_' + field))
+            setattr(self, '_' + field, cached)
+        return cached
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        return self._timestamp('created_at')
+
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        return self._timestamp('updated_at')
+
+    @property
+    def ready_at(self) -> Optional[datetime]:
+        return self._timestamp('ready_at')
+
+    @property
+    def picked_up_at(self) -> Optional[datetime]:
+        return self._timestamp('picked_up_at')
+
+    @property
+    def archived_at(self) -> Optional[datetime]:
+        return self._timestamp('archived_at')
+
+    @property
+    def eta_at(self) -> Optional[datetime]:
+        return self._timestamp('eta_at')
+
+    @property
+    def is_ready(self) -> bool:
+        return self.status == 'ready'
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Order':
+        """Build an Order from an API dict; unknown keys are ignored."""
+        kwargs = {}
+        for key, value in data.items():
+            key = _ALIASES.get(key, key)
+            if key in _FIELDS:
+                kwargs[key] = value
+        return cls(**kwargs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the order as a plain dict (timestamps as raw API strings)."""
+        data = {}
+        for field in _FIELDS:
+            if field in TIMESTAMP_FIELDS:
+                data[field] = getattr(self, '_raw_' + field)
+            else:
+                data[field] = getattr(self, field)
+        return data
+
+    def __eq__(self, other):
+        if not isinstance(other, Order):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"Order(order_id={self.order_id!r}, platform={self.platform!r}, status={self.status!r})"
+
+
+class _Categories:
+    """Small value table shared by a category column and the frames derived from it."""
+    __slots__ = ('values', 'codes')
+
+    def __init__(self):
+        self.values = []  # type: List[Optional[str]]
+        self.codes = {}  # type: Dict[Optional[str], int]
+
+    def code(self, value: Optional[str]) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(_intern(value))
+            self.codes[value] = code
+        return code
+
+
+class OrderFrame:
+    """
+    Column-oriented container for many orders.
+
+    Integer columns are stored in ``array`` buffers, platform/status/shelf as
+    one-byte codes into a shared value table, and free-text columns as plain
+    lists. Rows only become ``Order`` objects when indexed or iterated.
+
+    Example:
+        frame = client.list_orders()              # with typed=True
+        ready = frame.filter(status="ready")
+        print(ready.count_by("platform"))
+        for platform, orders in frame.group_by("platform").items():
+            print(platform, len(orders))
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, Any]] = ()):
+        self._ids = array('q')
+        self._present = set()  # type: set
+        self._categories = {field: _Categories() for field in CATEGORY_FIELDS}
+        self._codes = {field: array('B') for field in CATEGORY_FIELDS}
+        self._text = {field: [] for field in _FIELDS if field != 'id' and field not in CATEGORY_FIELDS}
+        self._epochs = {}  # type: Dict[str, array]
+        for row in rows:
+            self.append(row)
+
+    @classmethod
+    def from_dicts(cls, rows: Iterable[Dict[str, Any]]) -> 'OrderFrame':
+        return cls(rows)
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """Append one API dict as a new row."""
+        row = {_ALIASES.get(k, k): v for k, v in row.items()}
+        self._present.update(k for k in row if k in _FIELDS)
+        self._ids.append(int(row.get('id') or 0))
+        for field in CATEGORY_FIELDS:
+            self._codes[field].append(self._categories[field].code(row.get(field)))
+        for field, column in self._text.items():
+            column.append(row.get(field))
+        self._epochs.clear()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, index: int) -> Order:
+        if index < 0:
+            index += len(self)
+        kwargs = {'id': self._ids[index] or None}
+        for field in CATEGORY_FIELDS:
+            kwargs[field] = self._categories[field].values[self._codes[field][index]]
+        for field, column in self._text.items():
+            kwargs[field] = column[index]
+        return Order(**kwargs)
+
+    def __iter__(self) -> Iterator[Order]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        return f"OrderFrame({len(self)} rows)"
+
+    @property
+    def columns(self) -> List[str]:
+        """Fields present in the source rows."""
+        return [field for field in _FIELDS if field in self._present]
+
+    def column(self, field: str) -> List[Any]:
+        """Return one column as a list of values."""
+        if field == 'id':
+            return list(self._ids)
+        if field in self._codes:
+            values = self._categories[field].values
+            return [values[code] for code in self._codes[field]]
+        if field in self._text:
+            return list(self._text[field])
+        raise KeyError(field)
+
+    def epochs(self, field: str) -> array:
+        """
+        Return a timestamp column as UNIX seconds (NaN where null).
+
+        Parsed once per column on first use and cached.
+        """
+        if field not in TIMESTAMP_FIELDS:
+            raise KeyError(field)
+        cached = self._epochs.get(field)
+        if cached is None:
+            cached = array('d', (
+                parse_timestamp(value).timestamp() if value else math.nan
+                for value in self._text[field]
+            ))
+            self._epochs[field] = cached
+        return cached
+
+    def mask(self, field: str, value: Union[str, Iterable[str], None]) -> List[bool]:
+        """Boolean mask of rows where a category column equals value (or is one of values)."""
+        codes = self._categories[field].codes
+        values = [value] if isinstance(value, str) or value is None else value
+        wanted = {codes[v] for v in values if v in codes}
+        return [code in wanted for code in self._codes[field]]
+
+    def where(self, mask: Iterable[bool]) -> 'OrderFrame':
+        """Return a new frame with the rows where mask is true."""
+        frame = OrderFrame.__new__(OrderFrame)
+        frame._present = set(self._present)
+        frame._categories = self._categories
+        mask = list(mask)
+        frame._ids = array('q', compress(self._ids, mask))
+        frame._codes = {field: array('B', compress(codes, mask)) for field, codes in self._codes.items()}
+        frame._text = {field: list(compress(column, mask)) for field, column in self._text.items()}
+        frame._epochs = {field: array('d', compress(col, mask)) for field, col in self._epochs.items()}
+        return frame
+
+    def filter(
+        self,
+        status: Optional[str] = None,
+        platform: Optional[str] = None,
+        shelf_location: Optional[str] = None,
+        predicate: Optional[Callable[[Order], bool]] = None
+    ) -> 'OrderFrame':
+        """
+        Filter rows by category columns and/or an arbitrary predicate.
+
+        Category filters compare one-byte codes and never build Order objects.
+        """
+        mask = [True] * len(self)
+        for field, value in (('status', status), ('platform', platform), ('shelf_location', shelf_location)):
+            if value is not None:
+                mask = [a and b for a, b in zip(mask, self.mask(field, value))]
+        if predicate is not None:
+            mask = [keep and predicate(self[i]) for i, keep in enumerate(mask)]
+        return self.where(mask)
+
+    def count_by(self, field: str) -> Dict[Optional[str], int]:
+        """Count rows per value of a category column."""
+        counts = [0] * len(self._categories[field].values)
+        for code in self._codes[field]:
+            counts[code] += 1
+        values = self._categories[field].values
+        return {values[code]: n for code, n in enumerate(counts) if n}
+
+    def group_by(self, field: str) -> Dict[Optional[str], 'OrderFrame']:
+        """Split into one frame per value of a category column."""
+        values = self._categories[field].values
+        groups = {}
+        codes = self._codes[field]
+        for code in sorted(set(codes)):
+            groups[values[code]] = self.where(c == code for c in codes)
+        return groups
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Return rows as plain dicts containing the fields present in the source."""
+        columns = {field: self.column(field) for field in self.columns}
+        return [{field: columns[field][i] for field in columns} for i in range(len(self))]
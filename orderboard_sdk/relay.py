@@ -0,0 +1,257 @@
+"""
+Ghost Kitchen Order Board SDK - Display Relay
+
+Edge relay that fetches the public display feed once and serves it to any
+number of local display screens.
+
+Usage:
+    python -m orderboard_sdk.relay --base-url http://orderboard.local --port 8080
+
+Then point the display screens at http://<relay-host>:8080/api/display.php.
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, Any, List, Tuple
+
+from .client import OrderBoardClient, OrderBoardError
+
+
+DISPLAY_PATHS = ('/api/display.php', '/display.json')
+
+
+class _Payload:
+    """Encoded display response held in memory."""
+    __slots__ = ('orders', 'body', 'stale_body', 'etag', 'fetched_at')
+
+    def __init__(self, orders: List[Dict[str, Any]], refresh_interval: int):
+        self.orders = orders
+        self.fetched_at = time.monotonic()
+        timestamp = datetime.now(timezone.utc).astimezone().isoformat(timespec='seconds')
+        data = {
+            'success': True,
+            'timestamp': timestamp,
+            'refresh_interval': refresh_interval,
+            'orders': orders,
+            'count': len(orders),
+            'stale': False
+        }
+        self.body = json.dumps(data).encode('utf-8')
+        data['stale'] = True
+        self.stale_body = json.dumps(data).encode('utf-8')
+        self.etag = '"' + hashlib.sha1(self.body).hexdigest() + '"'
+
+
+class DisplayRelay:
+    """
+    Caches the display feed and fans one upstream fetch out to many screens.
+
+    Requests arriving while the cached payload is fresh are answered from
+    memory. Once it expires, the first request fetches upstream and any
+    concurrent requests wait on that same fetch instead of issuing their own.
+    If upstream is slow or failing, the last good payload is served with
+    ``"stale": true``.
+
+    Args:
+        client: OrderBoardClient pointed at the Order Board host
+        interval: Seconds a fetched payload stays fresh (default: 5)
+        max_wait: Seconds a request waits on an in-flight fetch before
+            falling back to the stale payload (default: 1)
+        prefetch: Refresh in a background thread every interval so screens
+            never wait on upstream (default: True)
+
+    Example:
+        client = OrderBoardClient(api_key="", base_url="http://orderboard.local")
+        relay = DisplayRelay(client, interval=5)
+        relay.serve(port=8080)
+    """
+
+    def __init__(
+        self,
+        client: OrderBoardClient,
+        interval: float = 5.0,
+        max_wait: float = 1.0,
+        prefetch: bool = True
+    ):
+        if client.typed:
+            raise OrderBoardError("DisplayRelay needs a client with typed=False")
+        self.client = client
+        self.interval = interval
+        self.max_wait = max_wait
+        self.prefetch = prefetch
+        self._payload = None  # type: Optional[_Payload]
+        self._lock = threading.Lock()
+        self._inflight = None  # type: Optional[threading.Event]
+        self._last_error = None  # type: Optional[str]
+        self._stop = threading.Event()
+        self.upstream_fetches = 0
+
+    def _fetch(self, done: threading.Event) -> None:
+        """Fetch upstream once and publish the result to waiting requests."""
+        try:
+            orders = self.client.get_display_orders()
+            current = self._payload
+            if current is None or current.orders != orders:
+                current = _Payload(orders, int(self.interval * 1000))
+            with self._lock:
+                self.upstream_fetches += 1
+                # An unchanged board keeps the encoded bytes and ETag, just renews freshness
+                current.fetched_at = time.monotonic()
+                self._payload = current
+                self._last_error = None
+        except OrderBoardError as e:
+            with self._lock:
+                self._last_error = str(e)
+        finally:
+            with self._lock:
+                self._inflight = None
+            done.set()
+
+    def _start_fetch(self, force: bool = False) -> threading.Event:
+        """
+        Return the in-flight fetch event, starting a fetch if none is running.
+
+        Unless force is set, no fetch is started if another one finished since
+        the caller saw a stale payload; the returned event is already set.
+        """
+        with self._lock:
+            if self._inflight is not None:
+                return self._inflight
+            done = threading.Event()
+            if not force and self.is_fresh():
+                done.set()
+                return done
+            self._inflight = done
+        threading.Thread(target=self._fetch, args=(done,), daemon=True).start()
+        return done
+
+    def is_fresh(self) -> bool:
+        """Whether the cached payload is younger than the refresh interval."""
+        payload = self._payload
+        return payload is not None and time.monotonic() - payload.fetched_at < self.interval
+
+    def get_payload(self) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Get the encoded display response.
+
+        Returns:
+            (body, etag) tuple; body is None if no payload has ever been fetched
+        """
+        if not self.is_fresh():
+            done = self._start_fetch()
+            # With nothing cached yet there is nothing to fall back on, so wait out the client timeout
+            wait = self.max_wait if self._payload is not None else self.client.timeout
+            done.wait(wait)
+
+        payload = self._payload
+        if payload is None:
+            return None, None
+        if self.is_fresh():
+            return payload.body, payload.etag
+        return payload.stale_body, None
+
+    @property
+    def last_error(self) -> Optional[str]:
+        """Error message from the most recent failed upstream fetch, if any."""
+        return self._last_error
+
+    def _prefetch_loop(self) -> None:
+        while not self._stop.is_set():
+            self._start_fetch(force=True).wait(self.client.timeout)
+            self._stop.wait(self.interval)
+
+    def make_server(self, host: str = '0.0.0.0', port: int = 8080) -> ThreadingHTTPServer:
+        """Create (but don't start) the HTTP server for this relay."""
+        handler = type('RelayHandler', (_RelayHandler,), {'relay': self})
+        server = ThreadingHTTPServer((host, port), handler)
+        server.daemon_threads = True
+        return server
+
+    def serve(self, host: str = '0.0.0.0', port: int = 8080) -> None:
+        """Serve the display feed until interrupted."""
+        server = self.make_server(host, port)
+        if self.prefetch:
+            threading.Thread(target=self._prefetch_loop, daemon=True).start()
+        try:
+            server.serve_forever()
+        finally:
+            self._stop.set()
+            server.server_close()
+
+
+class _RelayHandler(BaseHTTPRequestHandler):
+    """Serves the relay's cached payload with the same shape as /api/display.php."""
+    relay = None  # type: DisplayRelay
+
+    def _send(self, status: int, body: bytes = b'', etag: Optional[str] = None) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Cache-Control', 'no-cache')
+        if etag:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body and self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _error(self, message: str, status: int) -> None:
+        body = json.dumps({'success': False, 'error': message}).encode('utf-8')
+        self._send(status, body)
+
+    def do_OPTIONS(self):
+        self._send(200)
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in DISPLAY_PATHS:
+            self._error('Not found', 404)
+            return
+
+        body, etag = self.relay.get_payload()
+        if body is None:
+            self._error(self.relay.last_error or 'Upstream unavailable', 502)
+            return
+
+        if etag and self.headers.get('If-None-Match') == etag:
+            self._send(304, etag=etag)
+            return
+
+        self._send(200, body, etag)
+
+    do_HEAD = do_GET
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ghost Kitchen Order Board - Display Relay")
+    parser.add_argument('--base-url', default='http://localhost:8000', help='Order Board base URL (default: http://localhost:8000)')
+    parser.add_argument('--host', default='0.0.0.0', help='Interface to listen on (default: 0.0.0.0)')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on (default: 8080)')
+    parser.add_argument('--interval', type=float, default=5.0, help='Seconds between upstream fetches (default: 5)')
+    parser.add_argument('--max-wait', type=float, default=1.0, help='Seconds to wait on a slow upstream before serving stale data (default: 1)')
+    parser.add_argument('--timeout', type=int, default=10, help='Upstream request timeout in seconds (default: 10)')
+    parser.add_argument('--no-prefetch', action='store_true', help='Only fetch upstream when a screen asks')
+    args = parser.parse_args()
+
+    # The display feed is public, so no API key is needed
+    client = OrderBoardClient(api_key='', base_url=args.base_url, timeout=args.timeout)
+    relay = DisplayRelay(client, interval=args.interval, max_wait=args.max_wait, prefetch=not args.no_prefetch)
+
+    print(f"Relaying {client.base_url}/api/display.php on http://{args.host}:{args.port}/api/display.php")
+    try:
+        relay.serve(args.host, args.port)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,455 @@
+"""
+Ghost Kitchen Order Board SDK - Retention
+
+Keeps the Order Board SQLite file from growing without bound. Unlike the
+rest of the SDK this works on the database file directly, so run it on the
+host that serves the board.
+
+One compaction run:
+    - rolls stats_order_history rows older than the retention window into
+      per-day, per-platform totals in stats_order_daily
+    - moves those raw rows, and old stats_api_usage rows, into per-month
+      archive databases (archive/orderboard-YYYY-MM.db) that stay queryable
+    - drops expired api_rate_limits entries
+    - checkpoints the WAL and releases free pages with incremental VACUUM
+
+Usage:
+    python -m orderboard_sdk.retention --db db/orderboard.db compact
+    python -m orderboard_sdk.retention --db db/orderboard.db report
+    python -m orderboard_sdk.retention --db db/orderboard.db history --from 2026-01-01 --to 2026-02-01
+    python -m orderboard_sdk.retention --db db/orderboard.db compact --every 3600
+"""
+
+import argparse
+import glob
+import json
+import os
+import sqlite3
+import sys
+import time
+from typing import Optional, Dict, Any, List, Iterator
+
+
+HISTORY_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS {prefix}stats_order_history (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        order_id TEXT NOT NULL,
+        customer_name TEXT NOT NULL,
+        platform TEXT NOT NULL,
+        created_at DATETIME NOT NULL,
+        ready_at DATETIME,
+        picked_up_at DATETIME,
+        wait_time_seconds INTEGER,
+        archived_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+USAGE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS {prefix}stats_api_usage (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        endpoint TEXT NOT NULL,
+        requests INTEGER NOT NULL DEFAULT 0,
+        errors INTEGER NOT NULL DEFAULT 0,
+        date DATE NOT NULL,
+        UNIQUE(endpoint, date)
+    )
+"""
+
+# Must match initializeDatabase() in public/includes/config.php
+DAILY_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS stats_order_daily (
+        date DATE NOT NULL,
+        platform TEXT NOT NULL,
+        orders INTEGER NOT NULL DEFAULT 0,
+        waited_orders INTEGER NOT NULL DEFAULT 0,
+        total_wait_seconds INTEGER NOT NULL DEFAULT 0,
+        max_wait_seconds INTEGER,
+        PRIMARY KEY (date, platform)
+    )
+"""
+
+# The stats page charts the last 7 days straight from stats_order_history
+MIN_HISTORY_DAYS = 7
+
+# Trigger from initializeSearchIndex() that drops an order's search row with its history row
+SEARCH_DELETE_TRIGGER = 'history_search_delete'
+
+HISTORY_COLUMNS = 'id, order_id, customer_name, platform, created_at, ready_at, picked_up_at, wait_time_seconds, archived_at'
+
+
+def default_db_path() -> str:
+    """Database path the PHP app uses: $ORDERBOARD_BASE/db/orderboard.db."""
+    base = os.getenv('ORDERBOARD_BASE') or os.getcwd()
+    return os.path.join(base, 'db', 'orderboard.db')
+
+
+class Retention:
+    """
+    Retention and compaction for an Order Board database.
+
+    Args:
+        db_path: Path to orderboard.db
+        archive_dir: Where monthly archive files go (default: <db dir>/archive)
+        history_days: Days of raw order history to keep in the main file,
+            at least MIN_HISTORY_DAYS (default: 30)
+        usage_days: Days of API usage rows to keep in the main file (default: 90)
+        rate_limit_window: Seconds after which rate limit entries expire (default: 60)
+        vacuum_pages: Free pages to release per run, 0 for all (default: 0)
+
+    Example:
+        retention = Retention("db/orderboard.db", history_days=14)
+        report = retention.compact()
+        print(report["history"]["archived"], "history rows archived")
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        archive_dir: Optional[str] = None,
+        history_days: int = 30,
+        usage_days: int = 90,
+        rate_limit_window: int = 60,
+        vacuum_pages: int = 0
+    ):
+        if history_days < MIN_HISTORY_DAYS:
+            raise ValueError(f"history_days must be at least {MIN_HISTORY_DAYS} to keep the 7-day stats charts")
+        self.db_path = db_path
+        self.archive_dir = archive_dir or os.path.join(os.path.dirname(os.path.abspath(db_path)), 'archive')
+        self.history_days = history_days
+        self.usage_days = usage_days
+        self.rate_limit_window = rate_limit_window
+        self.vacuum_pages = vacuum_pages
+
+    def _connect(self, readonly: bool = False) -> sqlite3.Connection:
+        if not os.path.exists(self.db_path):
+            raise FileNotFoundError(f"Database not found: {self.db_path}")
+        if readonly:
+            db = sqlite3.connect(f'file:{self.db_path}?mode=ro', uri=True, timeout=30, isolation_level=None)
+        else:
+            db = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        db.row_factory = sqlite3.Row
+        return db
+
+    def _prepare(self, db: sqlite3.Connection) -> None:
+        """Create what compaction writes to, for databases older than the daily rollups."""
+        db.execute('PRAGMA journal_mode = WAL')
+        db.execute(DAILY_SCHEMA)
+        db.execute('CREATE INDEX IF NOT EXISTS idx_history_archived ON stats_order_history(archived_at)')
+
+    def archive_path(self, month: str) -> str:
+        """Path of the archive file for a month ("YYYY-MM")."""
+        return os.path.join(self.archive_dir, f'orderboard-{month}.db')
+
+    def archives(self) -> List[str]:
+        """Months that have an archive file, oldest first."""
+        paths = glob.glob(os.path.join(self.archive_dir, 'orderboard-*.db'))
+        return sorted(os.path.basename(p)[len('orderboard-'):-len('.db')] for p in paths)
+
+    def _attach(self, db: sqlite3.Connection, month: str) -> None:
+        os.makedirs(self.archive_dir, exist_ok=True)
+        db.execute('ATTACH DATABASE ? AS arc', (self.archive_path(month),))
+        db.execute(HISTORY_SCHEMA.format(prefix='arc.'))
+        db.execute(USAGE_SCHEMA.format(prefix='arc.'))
+        db.execute('CREATE INDEX IF NOT EXISTS arc.idx_history_archived ON stats_order_history(archived_at)')
+
+    def _compact_history(self, db: sqlite3.Connection, dry_run: bool) -> Dict[str, Any]:
+        cutoff = db.execute("SELECT DATE('now', ?)", (f'-{self.history_days} days',)).fetchone()[0]
+        months = [row[0] for row in db.execute(
+            "SELECT DISTINCT strftime('%Y-%m', archived_at) FROM stats_order_history WHERE archived_at < ? ORDER BY 1",
+            (cutoff,)
+        )]
+        archived = 0
+        days = 0
+        for month in months:
+            where = "archived_at < ? AND strftime('%Y-%m', archived_at) = ?"
+            params = (cutoff, month)
+            if dry_run:
+                archived += db.execute(f"SELECT COUNT(*) FROM stats_order_history WHERE {where}", params).fetchone()[0]
+                continue
+
+            self._attach(db, month)
+            try:
+                # Archive copy is idempotent, so a crash between files only means redoing this month
+                db.execute('BEGIN IMMEDIATE')
+                db.execute(
+                    f"INSERT OR IGNORE INTO arc.stats_order_history ({HISTORY_COLUMNS}) "
+                    f"SELECT {HISTORY_COLUMNS} FROM main.stats_order_history WHERE {where}",
+                    params
+                )
+                days += db.execute(f"""
+                    INSERT INTO stats_order_daily (date, platform, orders, waited_orders, total_wait_seconds, max_wait_seconds)
+                    SELECT DATE(archived_at), platform, COUNT(*), COUNT(wait_time_seconds),
+                           COALESCE(SUM(wait_time_seconds), 0), MAX(wait_time_seconds)
+                    FROM main.stats_order_history WHERE {where}
+                    GROUP BY DATE(archived_at), platform
+                    ON CONFLICT(date, platform) DO UPDATE SET
+                        orders = orders + excluded.orders,
+                        waited_orders = waited_orders + excluded.waited_orders,
+                        total_wait_seconds = total_wait_seconds + excluded.total_wait_seconds,
+                        max_wait_seconds = MAX(COALESCE(max_wait_seconds, excluded.max_wait_seconds), COALESCE(excluded.max_wait_seconds, max_wait_seconds))
+                """, params).rowcount
+                # Archived orders stay searchable (searchOrders() reads them from the archive
+                # files), so their search rows are kept by deleting around the trigger
+                trigger = db.execute(
+                    "SELECT sql FROM main.sqlite_master WHERE type = 'trigger' AND name = ?", (SEARCH_DELETE_TRIGGER,)
+                ).fetchone()
+                if trigger:
+                    db.execute(f'DROP TRIGGER main.{SEARCH_DELETE_TRIGGER}')
+                archived += db.execute(f"DELETE FROM main.stats_order_history WHERE {where}", params).rowcount
+                if trigger:
+                    db.execute(trigger[0])
+                db.execute('COMMIT')
+            except Exception:
+                if db.in_transaction:
+                    db.execute('ROLLBACK')
+                raise
+            finally:
+                db.execute('DETACH DATABASE arc')
+
+        return {'cutoff': cutoff, 'archived': archived, 'summary_rows': days, 'months': months}
+
+    def _compact_usage(self, db: sqlite3.Connection, dry_run: bool) -> Dict[str, Any]:
+        cutoff = db.execute("SELECT DATE('now', ?)", (f'-{self.usage_days} days',)).fetchone()[0]
+        months = [row[0] for row in db.execute(
+            "SELECT DISTINCT strftime('%Y-%m', date) FROM stats_api_usage WHERE date < ? ORDER BY 1",
+            (cutoff,)
+        )]
+        archived = 0
+        for month in months:
+            where = "date < ? AND strftime('%Y-%m', date) = ?"
+            params = (cutoff, month)
+            if dry_run:
+                archived += db.execute(f"SELECT COUNT(*) FROM stats_api_usage WHERE {where}", params).fetchone()[0]
+                continue
+
+            self._attach(db, month)
+            try:
+                db.execute('BEGIN IMMEDIATE')
+                db.execute(f"""
+                    INSERT INTO arc.stats_api_usage (endpoint, requests, errors, date)
+                    SELECT endpoint, requests, errors, date FROM main.stats_api_usage WHERE {where} AND true
+                    ON CONFLICT(endpoint, date) DO UPDATE SET
+                        requests = MAX(requests, excluded.requests),
+                        errors = MAX(errors, excluded.errors)
+                """, params)
+                archived += db.execute(f"DELETE FROM main.stats_api_usage WHERE {where}", params).rowcount
+                db.execute('COMMIT')
+            except Exception:
+                if db.in_transaction:
+                    db.execute('ROLLBACK')
+                raise
+            finally:
+                db.execute('DETACH DATABASE arc')
+
+        return {'cutoff': cutoff, 'archived': archived, 'months': months}
+
+    def _maintain(self, db: sqlite3.Connection) -> Dict[str, Any]:
+        free_before = db.execute('PRAGMA freelist_count').fetchone()[0]
+        auto_vacuum = db.execute('PRAGMA auto_vacuum').fetchone()[0]
+        if auto_vacuum == 2:
+            # executescript steps the pragma to completion; execute() frees only one page per step
+            db.executescript(f'PRAGMA incremental_vacuum({int(self.vacuum_pages)});')
+        busy, wal_pages, checkpointed = db.execute('PRAGMA wal_checkpoint(TRUNCATE)').fetchone()
+        return {
+            'incremental_vacuum': auto_vacuum == 2,
+            'free_pages_before': free_before,
+            'free_pages_after': db.execute('PRAGMA freelist_count').fetchone()[0],
+            'wal_checkpoint': {'busy': bool(busy), 'wal_pages': wal_pages, 'checkpointed': checkpointed}
+        }
+
+    def compact(self, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Run one compaction pass.
+
+        Args:
+            dry_run: Only count what would be archived or pruned
+
+        Returns:
+            Report of what was archived, pruned and reclaimed
+        """
+        started = time.time()
+        size_before = self._file_size()
+        db = self._connect()
+        try:
+            if not dry_run:
+                self._prepare(db)
+            report = {
+                'dry_run': dry_run,
+                'history': self._compact_history(db, dry_run),
+                'api_usage': self._compact_usage(db, dry_run)
+            }
+
+            expired = "window_start < CAST(strftime('%s', 'now') AS INTEGER) - ?"
+            if dry_run:
+                pruned = db.execute(f"SELECT COUNT(*) FROM api_rate_limits WHERE {expired}", (self.rate_limit_window,)).fetchone()[0]
+            else:
+                pruned = db.execute(f"DELETE FROM api_rate_limits WHERE {expired}", (self.rate_limit_window,)).rowcount
+            report['rate_limits'] = {'pruned': pruned}
+
+            if not dry_run:
+                report['maintenance'] = self._maintain(db)
+        finally:
+            db.close()
+
+        report['size_bytes'] = {'before': size_before, 'after': self._file_size()}
+        report['seconds'] = round(time.time() - started, 3)
+        return report
+
+    def enable_incremental_vacuum(self) -> None:
+        """Switch an existing database to auto_vacuum=INCREMENTAL (runs a full VACUUM once)."""
+        db = self._connect()
+        try:
+            db.execute('PRAGMA auto_vacuum = INCREMENTAL')
+            db.execute('VACUUM')
+        finally:
+            db.close()
+
+    def _file_size(self) -> int:
+        return sum(os.path.getsize(p) for p in (self.db_path, self.db_path + '-wal') if os.path.exists(p))
+
+    def report(self) -> Dict[str, Any]:
+        """Row counts, file sizes and archive months, without changing anything."""
+        db = self._connect(readonly=True)
+        try:
+            tables = {row[0] for row in db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            counts = {
+                table: db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] if table in tables else 0
+                for table in ('orders', 'stats_order_history', 'stats_order_daily', 'stats_api_usage', 'api_rate_limits')
+            }
+            oldest = db.execute("SELECT MIN(archived_at) FROM stats_order_history").fetchone()[0]
+            page_size = db.execute('PRAGMA page_size').fetchone()[0]
+            free_pages = db.execute('PRAGMA freelist_count').fetchone()[0]
+            auto_vacuum = db.execute('PRAGMA auto_vacuum').fetchone()[0]
+        finally:
+            db.close()
+
+        return {
+            'db_path': self.db_path,
+            'size_bytes': self._file_size(),
+            'free_bytes': free_pages * page_size,
+            'incremental_vacuum': auto_vacuum == 2,
+            'rows': counts,
+            'oldest_history': oldest,
+            'archives': [
+                {'month': month, 'size_bytes': os.path.getsize(self.archive_path(month))}
+                for month in self.archives()
+            ]
+        }
+
+    def history(self, start: Optional[str] = None, end: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate order history rows from the archives and the main file.
+
+        Args:
+            start: Earliest archived_at to include ("YYYY-MM-DD[ HH:MM:SS]")
+            end: archived_at upper bound, exclusive
+
+        Yields:
+            History rows as dicts, oldest first
+        """
+        where = []
+        params = []
+        if start:
+            where.append('archived_at >= ?')
+            params.append(start)
+        if end:
+            where.append('archived_at < ?')
+            params.append(end)
+        sql = f"SELECT {HISTORY_COLUMNS} FROM stats_order_history"
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY archived_at, id'
+
+        paths = [
+            self.archive_path(month) for month in self.archives()
+            if (not start or month >= start[:7]) and (not end or month <= end[:7])
+        ]
+        paths.append(self.db_path)
+
+        for path in paths:
+            db = sqlite3.connect(f'file:{path}?mode=ro', uri=True, timeout=30)
+            db.row_factory = sqlite3.Row
+            try:
+                for row in db.execute(sql, params):
+                    yield dict(row)
+            finally:
+                db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Ghost Kitchen Order Board - Retention and compaction",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Commands:
+  compact    Archive old history/usage rows, prune rate limits, checkpoint and vacuum
+  report     Show row counts, file sizes and archive months
+  history    Print archived + live order history as JSON lines
+
+Examples:
+  python -m orderboard_sdk.retention --db db/orderboard.db compact --dry-run
+  python -m orderboard_sdk.retention --db db/orderboard.db compact --every 3600
+  python -m orderboard_sdk.retention --db db/orderboard.db history --from 2026-01-01 --to 2026-02-01
+        """
+    )
+    parser.add_argument('--db', default=None, help='Path to orderboard.db (default: $ORDERBOARD_BASE/db/orderboard.db)')
+    parser.add_argument('--archive-dir', help='Directory for monthly archive files (default: <db dir>/archive)')
+    parser.add_argument('--history-days', type=int, default=30, help=f'Days of raw order history to keep, at least {MIN_HISTORY_DAYS} (default: 30)')
+    parser.add_argument('--usage-days', type=int, default=90, help='Days of API usage rows to keep (default: 90)')
+    parser.add_argument('--rate-limit-window', type=int, default=60, help='Seconds before rate limit entries expire (default: 60)')
+
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+
+    compact_parser = subparsers.add_parser('compact', help='Run compaction')
+    compact_parser.add_argument('--dry-run', action='store_true', help='Only report what would change')
+    compact_parser.add_argument('--every', type=float, help='Repeat every N seconds')
+    compact_parser.add_argument('--vacuum-pages', type=int, default=0, help='Free pages to release per run (default: 0 = all)')
+    compact_parser.add_argument('--enable-incremental-vacuum', action='store_true', help='Convert the database to incremental auto-vacuum first (full VACUUM)')
+
+    subparsers.add_parser('report', help='Show sizes and row counts')
+
+    history_parser = subparsers.add_parser('history', help='Query archived and live history')
+    history_parser.add_argument('--from', dest='start', help='Earliest archived_at (YYYY-MM-DD)')
+    history_parser.add_argument('--to', dest='end', help='archived_at upper bound, exclusive (YYYY-MM-DD)')
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    try:
+        retention = Retention(
+            args.db or default_db_path(),
+            archive_dir=args.archive_dir,
+            history_days=args.history_days,
+            usage_days=args.usage_days,
+            rate_limit_window=args.rate_limit_window,
+            vacuum_pages=getattr(args, 'vacuum_pages', 0)
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    try:
+        if args.command == 'report':
+            print(json.dumps(retention.report(), indent=2))
+        elif args.command == 'history':
+            for row in retention.history(args.start, args.end):
+                print(json.dumps(row))
+        elif args.command == 'compact':
+            if args.enable_incremental_vacuum:
+                retention.enable_incremental_vacuum()
+            while True:
+                print(json.dumps(retention.compact(dry_run=args.dry_run), indent=2), flush=True)
+                if not args.every:
+                    break
+                time.sleep(args.every)
+    except (OSError, sqlite3.Error) as e:
+        print(json.dumps({"success": False, "error": str(e)}))
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+Ghost Kitchen Order Board SDK - Wait-Time Sketches
+
+Streaming quantile estimates of prep time (created -> ready) and shelf dwell
+time (ready -> picked up), kept per platform and local hour of day.
+
+Each sketch is a log-bucketed histogram: a duration lands in bucket
+ceil(log_gamma(seconds)), so every quantile is within about 5% of the true
+value and a sketch never holds more than ~110 buckets however many samples
+it has seen. Sketches merge by adding bucket counts, which is how sparse
+hours fall back to the platform-wide and board-wide estimates.
+
+The Order Board server keeps the same sketches in its stats_wait_sketch
+table, fed by triggers (see initializeWaitSketch() in
+public/includes/config.php); the constants below must match the
+WAIT_SKETCH_* settings there.
+"""
+
+import math
+import time
+from datetime import datetime
+from typing import Optional, Dict, Any, Iterable, Tuple
+
+from .models import parse_timestamp
+
+
+# Bucket growth factor (relative accuracy ~ (gamma - 1) / 2)
+GAMMA = 1.1
+
+# Durations are clamped to this many seconds
+MAX_SECONDS = 6 * 3600
+
+# A cell with fewer samples falls back to the wider sketch
+MIN_SAMPLES = 10
+
+# Counts in a cell are halved once its total passes this, so recent samples dominate
+MAX_SAMPLES = 5000
+
+METRICS = ('prep', 'dwell')
+
+QUANTILES = {'p50': 0.5, 'p75': 0.75, 'p90': 0.9}
+
+_LOG_GAMMA = math.log(GAMMA)
+
+
+def _round(value: float) -> int:
+    """Round half away from zero, like PHP's round()."""
+    return int(math.floor(value + 0.5))
+
+
+def bucket(seconds: float) -> int:
+    """Bucket index for a duration (bucket 0 holds anything under a second)."""
+    seconds = min(float(seconds), MAX_SECONDS)
+    if seconds < 1:
+        return 0
+    return int(math.ceil(math.log(seconds) / _LOG_GAMMA - 1e-9))
+
+
+def bucket_value(index: int) -> float:
+    """Representative duration of a bucket (midpoint of its range, relatively)."""
+    if index <= 0:
+        return 0.0
+    return 2 * GAMMA ** index / (GAMMA + 1)
+
+
+def bucket_upper(index: int) -> float:
+    """Largest duration that falls in a bucket."""
+    return GAMMA ** index if index > 0 else 1.0
+
+
+class WaitSketch:
+    """
+    Mergeable log-bucketed histogram of durations in seconds.
+
+    Example:
+        sketch = WaitSketch()
+        for seconds in (300, 420, 480, 900):
+            sketch.add(seconds)
+        print(sketch.quantile(0.5), sketch.remaining(600))
+    """
+
+    __slots__ = ('counts', 'total')
+
+    def __init__(self, counts: Optional[Dict[int, float]] = None):
+        self.counts = {}  # type: Dict[int, float]
+        self.total = 0.0
+        if counts:
+            for index, count in counts.items():
+                self.counts[int(index)] = float(count)
+                self.total += float(count)
+
+    def add(self, seconds: float, weight: float = 1.0) -> None:
+        """Record one duration; negative durations (clock skew) are ignored."""
+        if seconds < 0:
+            return
+        index = bucket(seconds)
+        self.counts[index] = self.counts.get(index, 0.0) + weight
+        self.total += weight
+        if self.total > MAX_SAMPLES:
+            self.decay()
+
+    def decay(self) -> None:
+        """Halve every count, dropping buckets that become negligible."""
+        self.counts = {i: c / 2 for i, c in self.counts.items() if c / 2 >= 0.01}
+        self.total = sum(self.counts.values())
+
+    def merge(self, other: 'WaitSketch') -> 'WaitSketch':
+        """Add another sketch's counts into this one (returns self)."""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0.0) + count
+        self.total += other.total
+        return self
+
+    def quantile(self, q: float, above: float = 0.0) -> Optional[float]:
+        """
+        Duration at quantile q, or None if the sketch is empty.
+
+        With above > 0 the quantile is taken over durations longer than
+        above, i.e. conditioned on the wait having already lasted that long.
+        If the quantile falls in the bucket above is in, the bucket's upper
+        bound is returned, so the result does not move within that bucket.
+        """
+        buckets = sorted((i, c) for i, c in self.counts.items() if bucket_upper(i) > above)
+        mass = sum(c for _, c in buckets)
+        if mass <= 0:
+            return None
+        rank = q * mass
+        seen = 0.0
+        index = buckets[-1][0]
+        for index, count in buckets:
+            seen += count
+            if seen >= rank:
+                break
+        value = bucket_value(index)
+        return value if value >= above else bucket_upper(index)
+
+    def remaining(self, elapsed: float, q: float = 0.5) -> Optional[float]:
+        """Expected seconds left for a wait that has lasted elapsed seconds (0 if overdue)."""
+        if self.total <= 0:
+            return None
+        value = self.quantile(q, above=max(0.0, elapsed))
+        return 0.0 if value is None else max(0.0, value - elapsed)
+
+    def summary(self) -> Dict[str, Any]:
+        """Sample count plus the QUANTILES, rounded to whole seconds."""
+        data = {'samples': int(round(self.total))}
+        for name, q in QUANTILES.items():
+            value = self.quantile(q)
+            data[name] = None if value is None else _round(value)
+        return data
+
+
+class WaitEstimator:
+    """
+    Per-metric, per-platform, per-hour WaitSketch cells.
+
+    Memory is bounded by 2 metrics x platforms x 24 hours x ~110 buckets.
+
+    Example:
+        estimator = WaitEstimator()
+        estimator.record('prep', 'doordash', hour=18, seconds=540)
+        sketch, basis = estimator.sketch('prep', 'doordash', 18)
+        print(basis, sketch.quantile(0.9))
+    """
+
+    def __init__(self):
+        self.cells = {}  # type: Dict[Tuple[str, str, int], WaitSketch]
+
+    def record(self, metric: str, platform: str, hour: int, seconds: float) -> None:
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        cell = self.cells.get((metric, platform, hour))
+        if cell is None:
+            cell = self.cells[(metric, platform, hour)] = WaitSketch()
+        cell.add(seconds)
+
+    def observe(self, metric: str, platform: str, start: str, end: str) -> None:
+        """
+        Record the span between two API timestamps, bucketed by the local
+        hour of start (as the server's triggers do). Negative spans are ignored.
+        """
+        started = parse_timestamp(start).timestamp()
+        seconds = parse_timestamp(end).timestamp() - started
+        if seconds >= 0:
+            self.record(metric, platform, datetime.fromtimestamp(started).hour, seconds)
+
+    def merged(self, metric: str, platform: Optional[str] = None, hour: Optional[int] = None) -> WaitSketch:
+        """Merge every cell matching the metric and the given platform/hour."""
+        sketch = WaitSketch()
+        for (m, p, h), cell in self.cells.items():
+            if m == metric and (platform is None or p == platform) and (hour is None or h == hour):
+                sketch.merge(cell)
+        return sketch
+
+    def sketch(self, metric: str, platform: str, hour: int) -> Tuple[WaitSketch, str]:
+        """
+        Best sketch for an order: its platform and hour, else the platform
+        across all hours, else every platform.
+
+        Returns:
+            (sketch, basis) where basis is 'hour', 'platform', 'all' or 'none'
+        """
+        for basis, kwargs in (
+            ('hour', {'platform': platform, 'hour': hour}),
+            ('platform', {'platform': platform}),
+            ('all', {})
+        ):
+            sketch = self.merged(metric, **kwargs)
+            if sketch.total >= MIN_SAMPLES:
+                return sketch, basis
+        return WaitSketch(), 'none'
+
+    def estimate(self, order: Dict[str, Any], now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        ETA for an active order: when a PREPARING order should be ready, or
+        when a READY order should be picked up.
+
+        The estimate is the median of the matching sketch conditioned on the
+        time already waited, so a slow order's ETA moves out instead of
+        going negative.
+
+        Returns:
+            Dict with metric, elapsed_seconds, eta_seconds, eta_at and basis
+            (eta_seconds/eta_at are None when there is no data)
+        """
+        now = int(time.time() if now is None else now)
+        if order.get('status') == 'ready':
+            metric, stamp = 'dwell', order.get('ready_at') or order.get('updated_at') or order.get('created_at')
+        else:
+            metric, stamp = 'prep', order.get('created_at')
+        started = parse_timestamp(stamp).timestamp() if stamp else now
+        elapsed = max(0.0, now - started)
+
+        sketch, basis = self.sketch(metric, order.get('platform'), datetime.fromtimestamp(started).hour)
+        eta = due = None
+        if sketch.total > 0:
+            value = sketch.quantile(0.5, above=elapsed)
+            if value is None:
+                # Past every recorded duration: due when the longest one ended
+                value = bucket_upper(max(sketch.counts))
+            due = int(started) + _round(value)
+            eta = max(0, due - now)
+        return {
+            'metric': metric,
+            'elapsed_seconds': int(elapsed),
+            'eta_seconds': eta,
+            'eta_at': None if due is None else time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(due)),
+            'basis': basis
+        }
+
+    def summary(self, platforms: Iterable[str], hour: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """{metric: {platform: summary}} over all hours, or just the given hour."""
+        return {
+            metric: {platform: self.merged(metric, platform, hour).summary() for platform in platforms}
+            for metric in METRICS
+        }
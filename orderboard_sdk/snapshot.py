@@ -0,0 +1,535 @@
+"""
+Ghost Kitchen Order Board SDK - Snapshots
+
+Streams orders, stats_order_history and stats_api_usage to NDJSON (gzip when
+the file name ends in .gz) and loads them back, for moving a board between
+hosts or seeding a test board. Like the retention CLI this works on the
+SQLite file directly, so run it on the host that serves the board.
+
+    - export reads every table inside one read transaction, so the snapshot
+      is consistent even while the board is in use, and holds one row in
+      memory at a time
+    - import loads in large transactions with the tables' indexes and
+      triggers dropped, then builds the indexes once at the end; the search
+      index and wait-time sketches are rebuilt by the app on its next request
+    - replay feeds exported history back through the API as live traffic,
+      time-compressed by --speed
+
+Snapshot format: a header line, one line per row, and an end line with the
+row counts, which import uses to detect a truncated file:
+
+    {"format": "orderboard-snapshot", "version": 1, "exported_at": "...", "tables": [...]}
+    {"table": "orders", "row": {"id": 1, "order_id": "ORD-A1B2C3D4", ...}}
+    {"end": true, "counts": {"orders": 12, ...}}
+
+Usage:
+    python -m orderboard_sdk.snapshot --db db/orderboard.db export board.ndjson.gz
+    python -m orderboard_sdk.snapshot --db /srv/new/db/orderboard.db import board.ndjson.gz --replace
+    python -m orderboard_sdk.snapshot replay board.ndjson.gz --base-url http://localhost:8000 --speed 60
+"""
+
+import argparse
+import gzip
+import heapq
+import io
+import json
+import os
+import sqlite3
+import sys
+import time
+from typing import Optional, Dict, Any, List, Iterator, Iterable, Callable, IO
+
+from .client import OrderBoardClient, OrderBoardError
+from .models import parse_timestamp
+from .retention import default_db_path
+
+
+FORMAT = 'orderboard-snapshot'
+VERSION = 1
+
+# Exported in this order; import also loads them in this order
+TABLES = ('orders', 'stats_order_history', 'stats_api_usage')
+
+SHELF_LOCATIONS = ('A', 'B', 'C', 'D', 'E', 'F')
+
+# Derived tables the app recreates and backfills when they are missing
+# (initializeSearchIndex() and initializeWaitSketch() in public/includes/config.php)
+DERIVED_TABLES = ('order_search', 'stats_wait_sketch')
+
+
+def open_snapshot(path: str, mode: str = 'r') -> IO[str]:
+    """Open a snapshot for text reading or writing; "-" is stdin/stdout, *.gz is gzip."""
+    if path == '-':
+        stream = sys.stdin if mode == 'r' else sys.stdout
+        return io.TextIOWrapper(stream.buffer, encoding='utf-8', newline='\n', write_through=True)
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8', newline='\n')
+    return open(path, mode, encoding='utf-8', newline='\n')
+
+
+def read_snapshot(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Parse snapshot lines, yielding the header first, then {"table", "row"} records.
+
+    Raises:
+        ValueError: Not a snapshot, an unsupported version, a malformed
+            line, or truncated (missing end line or row counts that don't
+            match it)
+    """
+    lines = iter(lines)
+    try:
+        header = json.loads(next(lines))
+    except (StopIteration, json.JSONDecodeError):
+        raise ValueError('Not an Order Board snapshot (missing header)')
+    if not isinstance(header, dict) or header.get('format') != FORMAT:
+        raise ValueError('Not an Order Board snapshot (missing header)')
+    if header.get('version') != VERSION:
+        raise ValueError(f"Unsupported snapshot version: {header.get('version')}")
+    yield header
+
+    counts = {table: 0 for table in header.get('tables', [])}
+    for number, line in enumerate(lines, 2):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f'Snapshot line {number} is not valid JSON: {e}')
+        if not isinstance(record, dict):
+            raise ValueError(f'Snapshot line {number} is not a JSON object')
+        if record.get('end'):
+            if record.get('counts') != counts:
+                raise ValueError(f"Snapshot row counts {counts} don't match its end line {record.get('counts')}")
+            return
+        if not isinstance(record.get('table'), str) or not isinstance(record.get('row'), dict):
+            raise ValueError(f'Snapshot line {number} is not a {{"table", "row"}} record')
+        counts[record['table']] = counts.get(record['table'], 0) + 1
+        yield record
+    raise ValueError('Snapshot is truncated (no end line)')
+
+
+def verify(path: str) -> Dict[str, int]:
+    """
+    Read a snapshot through without loading it.
+
+    Returns:
+        Rows per table
+
+    Raises:
+        ValueError: Invalid or truncated snapshot
+    """
+    counts = {}
+    with open_snapshot(path, 'r') as source:
+        for record in read_snapshot(source):
+            if 'table' in record:
+                counts[record['table']] = counts.get(record['table'], 0) + 1
+            else:
+                counts = {table: 0 for table in record['tables']}
+    return counts
+
+
+class Snapshot:
+    """
+    Export and import for an Order Board database.
+
+    Args:
+        db_path: Path to orderboard.db
+        batch_size: Rows per import transaction (default: 50000)
+
+    Example:
+        Snapshot("db/orderboard.db").export("board.ndjson.gz")
+        Snapshot("/srv/new/db/orderboard.db").load("board.ndjson.gz", replace=True)
+    """
+
+    def __init__(self, db_path: str, batch_size: int = 50000):
+        self.db_path = db_path
+        self.batch_size = batch_size
+
+    def _connect(self) -> sqlite3.Connection:
+        if not os.path.exists(self.db_path):
+            raise FileNotFoundError(f"Database not found: {self.db_path} (open the board once so the app creates it)")
+        db = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        db.row_factory = sqlite3.Row
+        db.execute('PRAGMA journal_mode = WAL')
+        return db
+
+    @staticmethod
+    def _columns(db: sqlite3.Connection, table: str) -> List[str]:
+        columns = [row['name'] for row in db.execute(f'PRAGMA table_info({table})')]
+        if not columns:
+            raise ValueError(f"Table not found: {table}")
+        return columns
+
+    def rows(self, tables: Iterable[str] = TABLES) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the snapshot records (header, rows, end line) from one read transaction.
+
+        Rows are streamed from the cursor, so memory use doesn't grow with
+        the table sizes.
+        """
+        tables = list(tables)
+        db = self._connect()
+        try:
+            # Every SELECT below sees the database as of the first one
+            db.execute('BEGIN')
+            columns = {table: self._columns(db, table) for table in tables}
+            yield {
+                'format': FORMAT,
+                'version': VERSION,
+                'exported_at': db.execute("SELECT datetime('now')").fetchone()[0],
+                'tables': tables
+            }
+            counts = {}
+            for table in tables:
+                counts[table] = 0
+                cursor = db.execute(f"SELECT {', '.join(columns[table])} FROM {table} ORDER BY rowid")
+                for row in cursor:
+                    counts[table] += 1
+                    yield {'table': table, 'row': dict(row)}
+            yield {'end': True, 'counts': counts}
+        finally:
+            if db.in_transaction:
+                db.execute('COMMIT')
+            db.close()
+
+    def export(self, path: str, tables: Iterable[str] = TABLES) -> Dict[str, int]:
+        """
+        Write a snapshot to path ("-" for stdout, *.gz for gzip).
+
+        Returns:
+            Rows written per table
+        """
+        counts = {}
+        with open_snapshot(path, 'w') as out:
+            for record in self.rows(tables):
+                out.write(json.dumps(record, separators=(',', ':')) + '\n')
+                if record.get('end'):
+                    counts = record['counts']
+        return counts
+
+    def _defer(self, db: sqlite3.Connection, tables: Iterable[str]) -> List[sqlite3.Row]:
+        """Drop indexes, triggers and derived tables that would slow a bulk load; returns the first two for _restore()."""
+        placeholders = ', '.join('?' for _ in tables)
+        restore = []
+        for row in db.execute(
+            f"SELECT type, name, sql FROM sqlite_master WHERE type IN ('index', 'trigger') "
+            f"AND tbl_name IN ({placeholders}) AND sql IS NOT NULL ORDER BY type",
+            list(tables)
+        ).fetchall():
+            db.execute(f"DROP {row['type'].upper()} {row['name']}")
+            # Triggers feeding a derived table are recreated along with it
+            if not any(derived in row['sql'] for derived in DERIVED_TABLES):
+                restore.append(row)
+        for table in DERIVED_TABLES:
+            db.execute(f'DROP TABLE IF EXISTS {table}')
+        return restore
+
+    @staticmethod
+    def _restore(db: sqlite3.Connection, restore: List[sqlite3.Row]) -> None:
+        """Recreate the dropped indexes (building each once) and triggers, and invalidate cached stats."""
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            existing = {row[0] for row in db.execute("SELECT name FROM sqlite_master")}
+            # A rolled-back first batch leaves everything in place
+            for row in restore:
+                if row['name'] not in existing:
+                    db.execute(row['sql'])
+            if 'app_meta' in existing:
+                db.execute("UPDATE app_meta SET value = value + 1 WHERE key IN ('board_version', 'history_version')")
+            if 'stats_cache' in existing:
+                db.execute('DELETE FROM stats_cache')
+            db.execute('COMMIT')
+        except Exception:
+            db.execute('ROLLBACK')
+            raise
+
+    def load(self, path: str, replace: bool = False) -> Dict[str, Any]:
+        """
+        Load a snapshot into an existing board database.
+
+        Rows keep their ids. Existing rows with the same id or unique key are
+        kept unless replace is set, in which case the snapshot's tables are
+        emptied first; the file is then read through once beforehand, so an
+        invalid snapshot never empties anything (not possible for stdin).
+        Stop the board while importing: its search index and wait-time
+        sketches are dropped and rebuilt by the app on the next request.
+
+        Args:
+            path: Snapshot file ("-" for stdin, *.gz for gzip)
+            replace: Empty the snapshot's tables before loading
+
+        Returns:
+            Rows inserted and skipped per table, and elapsed seconds
+
+        Raises:
+            ValueError: Invalid or truncated snapshot. The batch in
+                progress is rolled back; batches already committed stay
+                loaded.
+        """
+        started = time.time()
+        if replace and path != '-':
+            verify(path)
+        db = self._connect()
+        inserted = {}  # type: Dict[str, int]
+        skipped = {}  # type: Dict[str, int]
+        restore = []  # type: List[sqlite3.Row]
+        try:
+            with open_snapshot(path, 'r') as source:
+                records = read_snapshot(source)
+                tables = [t for t in next(records)['tables'] if t in TABLES]
+                columns = {table: set(self._columns(db, table)) for table in tables}
+
+                db.execute('BEGIN IMMEDIATE')
+                restore = self._defer(db, tables)
+                if replace:
+                    for table in tables:
+                        db.execute(f'DELETE FROM {table}')
+
+                statements = {}  # type: Dict[tuple, str]
+                batch = []  # type: List[tuple]
+                batch_key = None
+                pending = 0
+
+                def flush():
+                    if batch:
+                        table = batch_key[0]
+                        before = db.total_changes
+                        db.executemany(statements[batch_key], batch)
+                        inserted[table] = inserted.get(table, 0) + db.total_changes - before
+                        skipped[table] = skipped.get(table, 0) + len(batch) - (db.total_changes - before)
+                        batch.clear()
+
+                try:
+                    for record in records:
+                        table = record['table']
+                        if table not in columns:
+                            continue
+                        names = tuple(name for name in record['row'] if name in columns[table])
+                        key = (table, names)
+                        if key != batch_key:
+                            flush()
+                            batch_key = key
+                            if key not in statements:
+                                statements[key] = (
+                                    f"INSERT OR IGNORE INTO {table} ({', '.join(names)}) "
+                                    f"VALUES ({', '.join('?' for _ in names)})"
+                                )
+                        batch.append(tuple(record['row'][name] for name in names))
+                        pending += 1
+                        if len(batch) >= 1000:
+                            flush()
+                        if pending >= self.batch_size:
+                            flush()
+                            db.execute('COMMIT')
+                            db.execute('BEGIN IMMEDIATE')
+                            pending = 0
+                    flush()
+                    db.execute('COMMIT')
+                except BaseException:
+                    if db.in_transaction:
+                        db.execute('ROLLBACK')
+                    raise
+                finally:
+                    # Build indexes once over the loaded rows and put the triggers back,
+                    # even when the snapshot turns out to be invalid part way through
+                    self._restore(db, restore)
+            db.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        finally:
+            if db.in_transaction:
+                db.execute('ROLLBACK')
+            db.close()
+
+        return {
+            'inserted': inserted,
+            'skipped': skipped,
+            'seconds': round(time.time() - started, 3)
+        }
+
+
+class Replayer:
+    """
+    Replays exported order history through the API as live traffic.
+
+    Each history row becomes a create, a mark-ready (when it has a ready_at)
+    and a pickup, sent at the row's original times divided by speed.
+    Orders get new server-generated order IDs, so a snapshot can be replayed
+    into the board it came from. Shelves are assigned least-occupied first.
+
+    Args:
+        client: OrderBoardClient for the target board
+        speed: Time compression factor (60 = an hour of history per minute)
+        clock: Monotonic clock (default: time.monotonic)
+        sleep: Sleep function (default: time.sleep)
+
+    Example:
+        client = OrderBoardClient(api_key="your_key", base_url="http://localhost:8000")
+        report = Replayer(client, speed=60).replay(read_snapshot(open_snapshot("board.ndjson.gz")))
+        print(report["requests"], "requests,", report["errors"], "errors")
+    """
+
+    def __init__(
+        self,
+        client: OrderBoardClient,
+        speed: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        if speed <= 0:
+            raise ValueError('speed must be positive')
+        self.client = client
+        self.speed = speed
+        self.clock = clock
+        self.sleep = sleep
+
+    @staticmethod
+    def events(records: Iterable[Dict[str, Any]], limit: Optional[int] = None) -> List[tuple]:
+        """
+        Turn snapshot history rows into a time-ordered event heap.
+
+        Returns:
+            Heap of (time, seq, action, key, row) with action 0 = create,
+            1 = ready, 2 = pickup
+        """
+        heap = []
+        count = 0
+        for record in records:
+            if record.get('table') != 'stats_order_history':
+                continue
+            row = record['row']
+            created = parse_timestamp(row.get('created_at'))
+            if created is None:
+                continue
+            order = {'customer_name': row['customer_name'], 'platform': row['platform']}
+            key = row['id']
+            points = [(created.timestamp(), 0)]
+            for action, column in ((1, 'ready_at'), (2, 'picked_up_at')):
+                stamp = parse_timestamp(row.get(column))
+                if stamp is not None:
+                    points.append((max(stamp.timestamp(), points[-1][0]), action))
+            for at, action in points:
+                heap.append((at, len(heap), action, key, order))
+            count += 1
+            if limit is not None and count >= limit:
+                break
+        heapq.heapify(heap)
+        return heap
+
+    def replay(self, records: Iterable[Dict[str, Any]], limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Send the history in records (as yielded by read_snapshot()) to the board.
+
+        Args:
+            records: Snapshot records; only stats_order_history rows are used
+            limit: Replay at most this many orders
+
+        Returns:
+            Orders, requests and errors sent, plus max_lag (seconds behind
+            schedule at worst) and elapsed seconds
+        """
+        heap = self.events(records, limit)
+        live = {}  # type: Dict[Any, str]
+        shelves = {shelf: 0 for shelf in SHELF_LOCATIONS}
+        on_shelf = {}  # type: Dict[Any, str]
+        report = {'orders': 0, 'requests': 0, 'errors': 0, 'max_lag': 0.0}
+
+        started = self.clock()
+        first = heap[0][0] if heap else 0.0
+        while heap:
+            at, _, action, key, order = heapq.heappop(heap)
+            due = started + (at - first) / self.speed
+            wait = due - self.clock()
+            if wait > 0:
+                self.sleep(wait)
+            else:
+                report['max_lag'] = max(report['max_lag'], -wait)
+
+            if action != 0 and key not in live:
+                continue  # its create failed
+            report['requests'] += 1
+            try:
+                if action == 0:
+                    live[key] = self.client.create_order(order['customer_name'], order['platform'])['order_id']
+                    report['orders'] += 1
+                elif action == 1:
+                    shelf = min(shelves, key=shelves.get)
+                    self.client.mark_ready(live[key], shelf)
+                    shelves[shelf] += 1
+                    on_shelf[key] = shelf
+                else:
+                    self.client.delete_order(order_id=live.pop(key))
+                    if key in on_shelf:
+                        shelves[on_shelf.pop(key)] -= 1
+            except OrderBoardError:
+                report['errors'] += 1
+
+        report['max_lag'] = round(report['max_lag'], 3)
+        report['seconds'] = round(self.clock() - started, 3)
+        return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Ghost Kitchen Order Board - Snapshot export, import and replay",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Commands:
+  export     Write orders, history and API usage as NDJSON (gzip for *.gz, - for stdout)
+  import     Bulk load a snapshot into an existing board database
+  replay     Send a snapshot's order history through the API, time-compressed
+
+Examples:
+  python -m orderboard_sdk.snapshot --db db/orderboard.db export board.ndjson.gz
+  python -m orderboard_sdk.snapshot --db db/orderboard.db export - | ssh new-host 'cat > board.ndjson'
+  python -m orderboard_sdk.snapshot --db db/orderboard.db import board.ndjson.gz --replace
+  python -m orderboard_sdk.snapshot replay board.ndjson.gz --api-key KEY --speed 120 --limit 500
+        """
+    )
+    parser.add_argument('--db', default=None, help='Path to orderboard.db (default: $ORDERBOARD_BASE/db/orderboard.db)')
+
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+
+    export_parser = subparsers.add_parser('export', help='Export a snapshot')
+    export_parser.add_argument('path', help='Output file (*.gz is gzipped, - for stdout)')
+    export_parser.add_argument('--tables', nargs='+', choices=TABLES, default=list(TABLES), help='Tables to export (default: all)')
+
+    import_parser = subparsers.add_parser('import', help='Import a snapshot')
+    import_parser.add_argument('path', help='Snapshot file (*.gz is gzipped, - for stdin)')
+    import_parser.add_argument('--replace', action='store_true', help="Empty the snapshot's tables first")
+    import_parser.add_argument('--batch-size', type=int, default=50000, help='Rows per transaction (default: 50000)')
+
+    replay_parser = subparsers.add_parser('replay', help='Replay order history through the API')
+    replay_parser.add_argument('path', help='Snapshot file (*.gz is gzipped, - for stdin)')
+    replay_parser.add_argument('--base-url', default=os.getenv('ORDERBOARD_BASE_URL', 'http://localhost:8000'), help='Order Board base URL (default: http://localhost:8000 or ORDERBOARD_BASE_URL)')
+    replay_parser.add_argument('--api-key', default=os.getenv('ORDERBOARD_API_KEY'), help='API key (or set ORDERBOARD_API_KEY)')
+    replay_parser.add_argument('--speed', type=float, default=60.0, help='Time compression factor (default: 60, an hour per minute)')
+    replay_parser.add_argument('--limit', type=int, help='Replay at most this many orders')
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    try:
+        if args.command == 'export':
+            counts = Snapshot(args.db or default_db_path()).export(args.path, args.tables)
+            print(json.dumps({'success': True, 'rows': counts}), file=sys.stderr if args.path == '-' else sys.stdout)
+        elif args.command == 'import':
+            report = Snapshot(args.db or default_db_path(), batch_size=args.batch_size).load(args.path, replace=args.replace)
+            print(json.dumps(dict(success=True, **report), indent=2))
+        elif args.command == 'replay':
+            if not args.api_key:
+                raise ValueError('API key required: use --api-key or set ORDERBOARD_API_KEY')
+            client = OrderBoardClient(api_key=args.api_key, base_url=args.base_url)
+            with open_snapshot(args.path, 'r') as source:
+                report = Replayer(client, speed=args.speed).replay(read_snapshot(source), limit=args.limit)
+            print(json.dumps(dict(success=True, **report), indent=2))
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(json.dumps({"success": False, "error": str(e)}))
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
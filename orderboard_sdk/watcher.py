@@ -0,0 +1,191 @@
+"""
+Ghost Kitchen Order Board SDK - Aging Watcher
+
+Raises alerts for orders stuck in PREPARING or sitting READY on a shelf for
+too long.
+
+Each order on the board gets one deadline in a min-heap, scheduled when the
+order appears or changes status. A tick only pops deadlines that have
+passed, so checking costs O(expired) rather than a scan of the whole board.
+
+Usage:
+    watcher = AgingWatcher(
+        client,
+        thresholds={"preparing": 1200, "ready": 600, "doordash:ready": 300},
+        on_expire=lambda alert: print(alert.order['order_id'], alert.age)
+    )
+    watcher.run(interval=5)
+"""
+
+import heapq
+import threading
+import time
+from typing import Optional, Dict, Any, List, Iterable, Callable, NamedTuple
+
+from .client import OrderBoardClient
+from .models import OrderFrame, parse_timestamp
+
+
+# Seconds an order may stay in each status before it is considered stuck
+DEFAULT_THRESHOLDS = {
+    'preparing': 20 * 60,
+    'ready': 10 * 60
+}
+
+
+class AgingAlert(NamedTuple):
+    """An order that has been in its current status longer than its threshold."""
+    order: Dict[str, Any]
+    status: str
+    threshold: float
+    age: float
+
+
+def resolve_threshold(thresholds: Dict[str, float], platform: str, status: str) -> Optional[float]:
+    """
+    Look up the threshold for an order.
+
+    Keys are either a status ("ready") or "platform:status" ("doordash:ready");
+    the platform-specific key wins. Returns None if the status isn't watched.
+    """
+    value = thresholds.get(f"{platform}:{status}")
+    if value is None:
+        value = thresholds.get(status)
+    return value
+
+
+def status_since(order: Dict[str, Any]) -> Optional[float]:
+    """UNIX time at which the order entered its current status."""
+    if order.get('status') == 'ready':
+        stamp = order.get('ready_at') or order.get('updated_at') or order.get('created_at')
+    else:
+        stamp = order.get('created_at')
+    parsed = parse_timestamp(stamp)
+    return parsed.timestamp() if parsed else None
+
+
+class AgingWatcher:
+    """
+    Tracks per-order deadlines and fires callbacks when they expire.
+
+    Args:
+        client: OrderBoardClient used by poll() and run()
+        thresholds: Seconds allowed per status, optionally per platform
+            (default: preparing 20 min, ready 10 min)
+        on_expire: Called with an AgingAlert for each expired deadline
+        repeat: Re-alert every this many seconds while the order stays
+            stuck (default: alert once per status)
+    """
+
+    def __init__(
+        self,
+        client: OrderBoardClient,
+        thresholds: Optional[Dict[str, float]] = None,
+        on_expire: Optional[Callable[[AgingAlert], None]] = None,
+        repeat: Optional[float] = None
+    ):
+        self.client = client
+        self.thresholds = dict(DEFAULT_THRESHOLDS if thresholds is None else thresholds)
+        self.on_expire = on_expire
+        self.repeat = repeat
+        # order_id -> (signature, generation, order dict, threshold, status since)
+        self._orders = {}  # type: Dict[str, tuple]
+        # (deadline, generation, order_id); entries whose generation no longer matches are skipped
+        self._heap = []  # type: List[tuple]
+        self._generation = 0
+
+    def _schedule(self, order_id: str, deadline: float, generation: int) -> None:
+        heapq.heappush(self._heap, (deadline, generation, order_id))
+
+    def observe(self, orders: Iterable[Dict[str, Any]]) -> None:
+        """
+        Feed the current board into the watcher.
+
+        New orders and status changes get a fresh deadline; orders no longer
+        on the board are forgotten. Unchanged orders keep their deadline.
+        """
+        seen = set()
+        for order in orders:
+            order_id = order['order_id']
+            seen.add(order_id)
+            signature = (order.get('status'), order.get('platform'), order.get('ready_at'), order.get('created_at'))
+            current = self._orders.get(order_id)
+            if current is not None and current[0] == signature:
+                continue
+
+            self._generation += 1
+            threshold = resolve_threshold(self.thresholds, order.get('platform'), order.get('status'))
+            since = status_since(order)
+            self._orders[order_id] = (signature, self._generation, order, threshold, since)
+            if threshold is not None and since is not None:
+                self._schedule(order_id, since + threshold, self._generation)
+
+        for order_id in [oid for oid in self._orders if oid not in seen]:
+            del self._orders[order_id]
+
+        # Drop cancelled entries once they outnumber live ones
+        if len(self._heap) > 2 * len(self._orders) + 64:
+            live = {oid: entry[1] for oid, entry in self._orders.items()}
+            self._heap = [e for e in self._heap if live.get(e[2]) == e[1]]
+            heapq.heapify(self._heap)
+
+    def tick(self, now: Optional[float] = None) -> List[AgingAlert]:
+        """Fire and return alerts for every deadline at or before now."""
+        now = time.time() if now is None else now
+        alerts = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, generation, order_id = heapq.heappop(self._heap)
+            current = self._orders.get(order_id)
+            if current is None or current[1] != generation:
+                continue
+            _, _, order, threshold, since = current
+            alert = AgingAlert(order, order.get('status'), threshold, now - since)
+            alerts.append(alert)
+            if self.repeat:
+                self._schedule(order_id, deadline + self.repeat * (1 + int((now - deadline) // self.repeat)), generation)
+
+        if self.on_expire:
+            for alert in alerts:
+                self.on_expire(alert)
+        return alerts
+
+    def next_deadline(self) -> Optional[float]:
+        """UNIX time of the earliest pending deadline, if any."""
+        while self._heap:
+            deadline, generation, order_id = self._heap[0]
+            current = self._orders.get(order_id)
+            if current is not None and current[1] == generation:
+                return deadline
+            heapq.heappop(self._heap)
+        return None
+
+    def refresh(self) -> None:
+        """Fetch the board once and observe it."""
+        orders = self.client.list_orders()
+        if isinstance(orders, OrderFrame):
+            orders = orders.to_dicts()
+        self.observe(orders)
+
+    def poll(self) -> List[AgingAlert]:
+        """Refresh the board and fire any expired deadlines."""
+        self.refresh()
+        return self.tick()
+
+    def run(self, interval: float = 5.0, stop: Optional[threading.Event] = None) -> None:
+        """
+        Refresh the board every interval seconds until stop is set.
+
+        Between refreshes the watcher sleeps until the next deadline, so alerts
+        fire on time rather than on the next refresh.
+        """
+        stop = stop or threading.Event()
+        next_refresh = 0.0
+        while not stop.is_set():
+            now = time.time()
+            if now >= next_refresh:
+                self.refresh()
+                next_refresh = now + interval
+            self.tick(now)
+            deadline = self.next_deadline()
+            wake = next_refresh if deadline is None else min(next_refresh, deadline)
+            stop.wait(max(0.0, wake - time.time()))
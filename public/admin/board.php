@@ -0,0 +1,52 @@
+<?php
+/**
+ * Ghost Kitchen Order Board - Admin Board Feed
+ *
+ * GET /admin/board.php
+ *
+ * JSON feed behind the dashboard's partial refresh (session login required).
+ *
+ * Query Parameters:
+ *     page (optional)  - Page of the orders table (default 1)
+ *     since (optional) - Board version the page was rendered from; if the board
+ *                        hasn't changed, only {"changed": false} is returned
+ */
+
+require_once __DIR__ . '/../includes/dashboard.php';
+
+if (!isLoggedIn()) {
+    errorResponse('Not logged in', 401);
+}
+
+// Make sure the token exists before the session is released for concurrent polls
+generateCsrfToken();
+session_write_close();
+
+if ($_SERVER['REQUEST_METHOD'] !== 'GET') {
+    errorResponse('Method not allowed', 405);
+}
+
+header('Cache-Control: no-store');
+
+$version = getBoardVersion();
+if (isset($_GET['since']) && (int)$_GET['since'] === $version) {
+    jsonResponse([
+        'success' => true,
+        'changed' => false,
+        'version' => $version
+    ]);
+}
+
+$board = getDashboardPage((int)($_GET['page'] ?? 1));
+
+jsonResponse([
+    'success' => true,
+    'changed' => true,
+    'version' => $board['version'],
+    'stats' => $board['stats'],
+    'total' => $board['total'],
+    'page' => $board['page'],
+    'pages' => $board['pages'],
+    'rows_html' => renderOrderRows($board['orders']),
+    'pager_html' => renderPager($board['page'], $board['pages'])
+]);
@@ -6,6 +6,7 @@
 require_once __DIR__ . '/../includes/auth.php';
 require_once __DIR__ . '/../includes/csrf.php';
 require_once __DIR__ . '/../includes/functions.php';
+require_once __DIR__ . '/../includes/dashboard.php';
 
 requireLogin();
 
@@ -57,9 +58,9 @@ if ($_SERVER['REQUEST_METHOD'] === 'POST' && validateCsrfToken()) {
     }
 }
 
-// Get current orders and stats
-$orders = listOrders();
-$stats = getOrderStats();
+// Get the current page of orders and stats (later refreshes come from board.php)
+$board = getDashboardPage((int)($_GET['page'] ?? 1));
+$stats = $board['stats'];
 ?>
 <!DOCTYPE html>
 <html lang="en">
@@ -115,25 +116,25 @@ $stats = getOrderStats();
             <!-- Stats Cards -->
             <div class="col-md-3 mb-4">
                 <div class="card stat-card">
-                    <div class="stat-value"><?= $stats['active_orders'] ?></div>
+                    <div class="stat-value" data-stat="active_orders"><?= $stats['active_orders'] ?></div>
                     <div class="stat-label">Active Orders</div>
                 </div>
             </div>
             <div class="col-md-3 mb-4">
                 <div class="card stat-card">
-                    <div class="stat-value"><?= $stats['preparing'] ?? 0 ?></div>
+                    <div class="stat-value" data-stat="preparing"><?= $stats['preparing'] ?></div>
                     <div class="stat-label">Preparing</div>
                 </div>
             </div>
             <div class="col-md-3 mb-4">
                 <div class="card stat-card">
-                    <div class="stat-value" style="color: var(--accent-success)"><?= $stats['ready'] ?? 0 ?></div>
+                    <div class="stat-value" data-stat="ready" style="color: var(--accent-success)"><?= $stats['ready'] ?></div>
                     <div class="stat-label">Ready</div>
                 </div>
             </div>
             <div class="col-md-3 mb-4">
                 <div class="card stat-card">
-                    <div class="stat-value"><?= $stats['today_completed'] ?></div>
+                    <div class="stat-value" data-stat="today_completed"><?= $stats['today_completed'] ?></div>
                     <div class="stat-label">Completed Today</div>
                 </div>
             </div>
@@ -184,137 +185,84 @@ $stats = getOrderStats();
             
             <!-- Orders List -->
             <div class="col-lg-8 mb-4">
-                <div class="card">
+                <div class="card" id="order-board"
+                     data-feed="board.php"
+                     data-version="<?= $board['version'] ?>"
+                     data-page="<?= $board['page'] ?>"
+                     data-refresh="<?= ADMIN_REFRESH_INTERVAL ?>">
                     <div class="card-header d-flex justify-content-between align-items-center">
                         <span><i class="bi bi-list-ul me-2"></i>Active Orders</span>
-                        <span class="badge bg-secondary"><?= count($orders) ?> orders</span>
+                        <span class="badge bg-secondary"><span data-stat="active_orders"><?= $board['total'] ?></span> orders</span>
                     </div>
                     <div class="card-body p-0">
-                        <?php if (empty($orders)): ?>
-                            <div class="text-center py-5 text-secondary">
-                                <i class="bi bi-inbox" style="font-size: 3rem;"></i>
-                                <p class="mt-2">No active orders</p>
-                            </div>
-                        <?php else: ?>
-                            <div class="table-responsive">
-                                <table class="table table-hover mb-0">
-                                    <thead>
-                                        <tr>
-                                            <th>Order ID</th>
-                                            <th>Customer</th>
-                                            <th>Platform</th>
-                                            <th>Status</th>
-                                            <th>Shelf</th>
-                                            <th>Actions</th>
-                                        </tr>
-                                    </thead>
-                                    <tbody>
-                                        <?php foreach ($orders as $order): ?>
-                                            <tr>
-                                                <td>
-                                                    <code><?= htmlspecialchars($order['order_id']) ?></code>
-                                                </td>
-                                                <td>
-                                                    <strong><?= htmlspecialchars(formatCustomerName($order['customer_name'])) ?></strong>
-                                                    <br><small class="text-secondary"><?= htmlspecialchars($order['customer_name']) ?></small>
-                                                </td>
-                                                <td>
-                                                    <span class="badge badge-<?= $order['platform'] ?>">
-                                                        <?= ucfirst($order['platform']) ?>
-                                                    </span>
-                                                </td>
-                                                <td>
-                                                    <span class="badge badge-<?= $order['status'] ?>">
-                                                        <?= strtoupper($order['status']) ?>
-                                                    </span>
-                                                </td>
-                                                <td>
-                                                    <?php if ($order['shelf_location']): ?>
-                                                        <span class="shelf-badge"><?= $order['shelf_location'] ?></span>
-                                                    <?php else: ?>
-                                                        <span class="text-secondary">—</span>
-                                                    <?php endif; ?>
-                                                </td>
-                                                <td class="order-actions">
-                                                    <?php if ($order['status'] === 'preparing'): ?>
-                                                        <!-- Mark Ready Modal Trigger -->
-                                                        <button type="button" class="btn btn-sm btn-success" 
-                                                                data-bs-toggle="modal" 
-                                                                data-bs-target="#readyModal<?= $order['id'] ?>">
-                                                            <i class="bi bi-check-lg"></i> Ready
-                                                        </button>
-                                                    <?php endif; ?>
-                                                    
-                                                    <!-- Delete Button -->
-                                                    <form method="POST" action="" class="d-inline" 
-                                                          onsubmit="return confirm('Remove this order (mark as picked up)?')">
-                                                        <?= csrfField() ?>
-                                                        <input type="hidden" name="action" value="delete">
-                                                        <input type="hidden" name="order_id" value="<?= $order['id'] ?>">
-                                                        <button type="submit" class="btn btn-sm btn-outline-danger">
-                                                            <i class="bi bi-x-lg"></i>
-                                                        </button>
-                                                    </form>
-                                                </td>
-                                            </tr>
-                                            
-                                            <!-- Mark Ready Modal -->
-                                            <?php if ($order['status'] === 'preparing'): ?>
-                                            <div class="modal fade" id="readyModal<?= $order['id'] ?>" tabindex="-1">
-                                                <div class="modal-dialog modal-sm">
-                                                    <div class="modal-content">
-                                                        <div class="modal-header">
-                                                            <h5 class="modal-title">Mark Ready</h5>
-                                                            <button type="button" class="btn-close" data-bs-dismiss="modal"></button>
-                                                        </div>
-                                                        <form method="POST" action="">
-                                                            <?= csrfField() ?>
-                                                            <input type="hidden" name="action" value="mark_ready">
-                                                            <input type="hidden" name="order_id" value="<?= $order['id'] ?>">
-                                                            <div class="modal-body">
-                                                                <p><strong><?= htmlspecialchars(formatCustomerName($order['customer_name'])) ?></strong></p>
-                                                                <label class="form-label">Select Shelf Location</label>
-                                                                <div class="d-flex gap-2 flex-wrap">
-                                                                    <?php foreach (['A', 'B', 'C', 'D', 'E', 'F'] as $shelf): ?>
-                                                                        <div class="form-check">
-                                                                            <input class="form-check-input" type="radio" 
-                                                                                   name="shelf_location" value="<?= $shelf ?>" 
-                                                                                   id="shelf<?= $order['id'] . $shelf ?>" required>
-                                                                            <label class="form-check-label shelf-badge" 
-                                                                                   for="shelf<?= $order['id'] . $shelf ?>"
-                                                                                   style="background: var(--bg-input); cursor: pointer;">
-                                                                                <?= $shelf ?>
-                                                                            </label>
-                                                                        </div>
-                                                                    <?php endforeach; ?>
-                                                                </div>
-                                                            </div>
-                                                            <div class="modal-footer">
-                                                                <button type="button" class="btn btn-secondary" data-bs-dismiss="modal">Cancel</button>
-                                                                <button type="submit" class="btn btn-success">
-                                                                    <i class="bi bi-check-lg"></i> Mark Ready
-                                                                </button>
-                                                            </div>
-                                                        </form>
-                                                    </div>
-                                                </div>
-                                            </div>
-                                            <?php endif; ?>
-                                        <?php endforeach; ?>
-                                    </tbody>
-                                </table>
-                            </div>
-                        <?php endif; ?>
+                        <div class="table-responsive">
+                            <table class="table table-hover mb-0">
+                                <thead>
+                                    <tr>
+                                        <th>Order ID</th>
+                                        <th>Customer</th>
+                                        <th>Platform</th>
+                                        <th>Status</th>
+                                        <th>Shelf</th>
+                                        <th>Actions</th>
+                                    </tr>
+                                </thead>
+                                <tbody id="order-rows">
+                                    <?= renderOrderRows($board['orders']) ?>
+                                </tbody>
+                            </table>
+                        </div>
+                        <nav id="order-pager" aria-label="Order pages">
+                            <?= renderPager($board['page'], $board['pages']) ?>
+                        </nav>
                     </div>
                 </div>
             </div>
         </div>
     </div>
     
+    <!-- Mark Ready Modal (shared by every row; filled in from the clicked button) -->
+    <div class="modal fade" id="readyModal" tabindex="-1">
+        <div class="modal-dialog modal-sm">
+            <div class="modal-content">
+                <div class="modal-header">
+                    <h5 class="modal-title">Mark Ready</h5>
+                    <button type="button" class="btn-close" data-bs-dismiss="modal"></button>
+                </div>
+                <form method="POST" action="">
+                    <?= csrfField() ?>
+                    <input type="hidden" name="action" value="mark_ready">
+                    <input type="hidden" name="order_id" value="">
+                    <div class="modal-body">
+                        <p><strong class="ready-display-name"></strong></p>
+                        <label class="form-label">Select Shelf Location</label>
+                        <div class="d-flex gap-2 flex-wrap">
+                            <?php foreach (['A', 'B', 'C', 'D', 'E', 'F'] as $shelf): ?>
+                                <div class="form-check">
+                                    <input class="form-check-input" type="radio" 
+                                           name="shelf_location" value="<?= $shelf ?>" 
+                                           id="shelf<?= $shelf ?>" required>
+                                    <label class="form-check-label shelf-badge" 
+                                           for="shelf<?= $shelf ?>"
+                                           style="background: var(--bg-input); cursor: pointer;">
+                                        <?= $shelf ?>
+                                    </label>
+                                </div>
+                            <?php endforeach; ?>
+                        </div>
+                    </div>
+                    <div class="modal-footer">
+                        <button type="button" class="btn btn-secondary" data-bs-dismiss="modal">Cancel</button>
+                        <button type="submit" class="btn btn-success">
+                            <i class="bi bi-check-lg"></i> Mark Ready
+                        </button>
+                    </div>
+                </form>
+            </div>
+        </div>
+    </div>
+    
     <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/js/bootstrap.bundle.min.js"></script>
-    <script>
-        // Auto-refresh page every 30 seconds
-        setTimeout(() => location.reload(), 30000);
-    </script>
+    <script src="/js/admin.js"></script>
 </body>
 </html>
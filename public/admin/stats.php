@@ -11,38 +11,11 @@ requireLogin();
 
 $stats = getOrderStats();
 
-// Get API usage stats
-$db = getDB();
-$apiUsage = [];
-$result = $db->query("SELECT endpoint, SUM(requests) as total_requests, SUM(errors) as total_errors 
-                       FROM stats_api_usage 
-                       WHERE date >= date('now', '-7 days')
-                       GROUP BY endpoint 
-                       ORDER BY total_requests DESC");
-while ($row = $result->fetchArray(SQLITE3_ASSOC)) {
-    $apiUsage[] = $row;
-}
-
-// Get order history (last 7 days)
-$orderHistory = [];
-$result = $db->query("SELECT DATE(archived_at) as date, COUNT(*) as count, AVG(wait_time_seconds) as avg_wait
-                       FROM stats_order_history 
-                       WHERE archived_at >= date('now', '-7 days')
-                       GROUP BY DATE(archived_at)
-                       ORDER BY date DESC");
-while ($row = $result->fetchArray(SQLITE3_ASSOC)) {
-    $orderHistory[] = $row;
-}
-
-// Platform breakdown
-$platformStats = [];
-$result = $db->query("SELECT platform, COUNT(*) as count 
-                       FROM stats_order_history 
-                       WHERE archived_at >= date('now', '-7 days')
-                       GROUP BY platform");
-while ($row = $result->fetchArray(SQLITE3_ASSOC)) {
-    $platformStats[$row['platform']] = $row['count'];
-}
+// 7-day chart series, precomputed and cached until history is written
+$series = getStatsChartSeries();
+$apiUsage = $series['api_usage'];
+$orderHistory = $series['order_history'];
+$platformStats = $series['platform_stats'];
 ?>
 <!DOCTYPE html>
 <html lang="en">
@@ -0,0 +1,81 @@
+<?php
+/**
+ * Ghost Kitchen Order Board API - Wait Times and ETAs
+ * 
+ * GET /api/eta.php
+ * 
+ * Query Parameters:
+ *     api_key (required) - API key
+ *     id (optional) - Only estimate this order (database ID)
+ *     order_id (optional) - Only estimate this order (order ID string)
+ *     hour (optional) - Report wait-time quantiles for this local hour (0-23) instead of all hours
+ */
+
+require_once __DIR__ . '/../includes/auth.php';
+require_once __DIR__ . '/../includes/functions.php';
+
+// Handle OPTIONS for CORS
+if ($_SERVER['REQUEST_METHOD'] === 'OPTIONS') {
+    header('Access-Control-Allow-Origin: *');
+    header('Access-Control-Allow-Methods: GET, OPTIONS');
+    header('Access-Control-Allow-Headers: Content-Type, X-API-Key');
+    exit;
+}
+
+// Only allow GET
+if ($_SERVER['REQUEST_METHOD'] !== 'GET') {
+    errorResponse('Method not allowed', 405);
+}
+
+// Require API key
+$apiKey = requireApiKey();
+enforceRateLimit();
+
+// Track API usage
+trackApiUsage('eta');
+
+$hour = null;
+if (isset($_GET['hour']) && $_GET['hour'] !== '') {
+    $hour = filter_var($_GET['hour'], FILTER_VALIDATE_INT, ['options' => ['min_range' => 0, 'max_range' => 23]]);
+    if ($hour === false) {
+        trackApiUsage('eta', true);
+        errorResponse('Invalid hour. Must be 0-23');
+    }
+}
+
+try {
+    if (isset($_GET['id']) || isset($_GET['order_id'])) {
+        $order = isset($_GET['id']) ? getOrderById((int)$_GET['id']) : getOrderByOrderId($_GET['order_id']);
+        if (!$order) {
+            trackApiUsage('eta', true);
+            errorResponse('Order not found', 404);
+        }
+        $orders = [$order];
+    } else {
+        $orders = listOrders();
+    }
+    
+    $now = time();
+    $sketches = ['prep' => getWaitSketches('prep'), 'dwell' => getWaitSketches('dwell')];
+    $etas = [];
+    foreach ($orders as $order) {
+        $etas[] = [
+            'id' => $order['id'],
+            'order_id' => $order['order_id'],
+            'platform' => $order['platform'],
+            'status' => $order['status']
+        ] + estimateOrderEta($order, $now, $sketches);
+    }
+    
+    jsonResponse([
+        'success' => true,
+        'hour' => $hour,
+        'wait_times' => getWaitTimeQuantiles($hour),
+        'orders' => $etas,
+        'count' => count($etas)
+    ]);
+    
+} catch (Exception $e) {
+    trackApiUsage('eta', true);
+    errorResponse('Internal server error', 500);
+}
@@ -0,0 +1,61 @@
+<?php
+/**
+ * Ghost Kitchen Order Board API - Search Orders
+ * 
+ * GET /api/search-orders.php
+ * 
+ * Query Parameters:
+ *     api_key (required) - API key
+ *     q (required) - Customer name, display name ("JOHN D") or order ID; words match as prefixes
+ *     limit (optional) - Max results (1-50, default 10)
+ *     include_archived (optional) - Include picked-up orders (default 1)
+ */
+
+require_once __DIR__ . '/../includes/auth.php';
+require_once __DIR__ . '/../includes/functions.php';
+
+// Handle OPTIONS for CORS
+if ($_SERVER['REQUEST_METHOD'] === 'OPTIONS') {
+    header('Access-Control-Allow-Origin: *');
+    header('Access-Control-Allow-Methods: GET, OPTIONS');
+    header('Access-Control-Allow-Headers: Content-Type, X-API-Key');
+    exit;
+}
+
+// Only allow GET
+if ($_SERVER['REQUEST_METHOD'] !== 'GET') {
+    errorResponse('Method not allowed', 405);
+}
+
+// Require API key
+$apiKey = requireApiKey();
+enforceRateLimit();
+
+// Track API usage
+trackApiUsage('search-orders');
+
+if (!isset($_GET['q']) || trim($_GET['q']) === '') {
+    trackApiUsage('search-orders', true);
+    errorResponse('Missing required parameter: q');
+}
+
+$limit = isset($_GET['limit']) ? max(1, min(50, (int)$_GET['limit'])) : 10;
+$includeArchived = !isset($_GET['include_archived']) || filter_var($_GET['include_archived'], FILTER_VALIDATE_BOOLEAN);
+
+try {
+    $orders = searchOrders($_GET['q'], $limit, $includeArchived);
+    
+    jsonResponse([
+        'success' => true,
+        'query' => $_GET['q'],
+        'orders' => $orders,
+        'count' => count($orders)
+    ]);
+    
+} catch (InvalidArgumentException $e) {
+    trackApiUsage('search-orders', true);
+    errorResponse($e->getMessage(), 400);
+} catch (Exception $e) {
+    trackApiUsage('search-orders', true);
+    errorResponse('Internal server error', 500);
+}
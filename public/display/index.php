@@ -1,3 +1,10 @@
+<?php
+/**
+ * Ghost Kitchen Order Board - Driver Display
+ */
+
+require_once __DIR__ . '/../includes/config.php';
+?>
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -16,7 +23,7 @@
     <meta name="apple-mobile-web-app-capable" content="yes">
     <meta name="mobile-web-app-capable" content="yes">
 </head>
-<body>
+<body data-relay-origins="<?php echo htmlspecialchars(json_encode(DISPLAY_RELAY_ORIGINS)); ?>">
     <!-- Header -->
     <header class="display-header">
         <h1>ORDER PICKUP</h1>
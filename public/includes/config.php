@@ -29,6 +29,7 @@ if (is_dir($logsDir) || @mkdir($logsDir, 0755, true)) {
 // Database configuration
 define('DB_PATH', $basePath . '/db/orderboard.db');
 define('DB_TIMEOUT', 30);
+define('ARCHIVE_DIR', dirname(DB_PATH) . '/archive'); // monthly history archives written by the retention CLI
 
 // Application settings
 define('SITE_NAME', 'Ghost Kitchen Order Board');
@@ -58,6 +59,23 @@ define('SHELF_LOCATIONS', ['A', 'B', 'C', 'D', 'E', 'F']);
 // Display settings
 define('DISPLAY_REFRESH_INTERVAL', 5000); // milliseconds
 define('MAX_DISPLAY_ORDERS', 12); // max orders shown on display
+// Display relay origins a screen may read via ?feed= (comma-separated, e.g. http://relay-host:8080)
+$relayOrigins = getenv('ORDERBOARD_RELAY_ORIGINS');
+define('DISPLAY_RELAY_ORIGINS', array_values(array_filter(array_map(
+    function ($origin) { return rtrim(trim($origin), '/'); },
+    explode(',', $relayOrigins === false ? '' : $relayOrigins)
+))));
+
+// Admin dashboard settings
+define('ADMIN_PAGE_SIZE', 25); // orders per dashboard page
+define('ADMIN_REFRESH_INTERVAL', 5000); // milliseconds between board version checks
+define('STATS_USAGE_CACHE_TTL', 60); // seconds the API usage chart is cached
+
+// Wait-time sketches (keep in sync with orderboard_sdk/sketch.py)
+define('WAIT_SKETCH_GAMMA', 1.1); // bucket growth factor, ~5% relative accuracy
+define('WAIT_SKETCH_MAX_SECONDS', 21600); // durations are clamped to 6 hours
+define('WAIT_SKETCH_MIN_SAMPLES', 10); // sparser cells fall back to wider sketches
+define('WAIT_SKETCH_MAX_SAMPLES', 5000); // a cell's counts are halved past this
 
 /**
  * Show configuration/database error and exit (avoids 500 with no info)
@@ -106,6 +124,8 @@ function getDB(): SQLite3 {
             showConfigError('Database unavailable: ' . DB_PATH);
         }
         $db->busyTimeout(DB_TIMEOUT * 1000);
+        // Only takes effect on a new database; existing ones are converted by the retention CLI
+        $db->exec('PRAGMA auto_vacuum = INCREMENTAL');
         $db->exec('PRAGMA journal_mode = WAL');
         $db->exec('PRAGMA foreign_keys = ON');
         
@@ -192,10 +212,61 @@ function initializeDatabase(SQLite3 $db): void {
         )
     ");
     
+    // Daily per-platform totals rolled up from old history by the retention CLI
+    $db->exec("
+        CREATE TABLE IF NOT EXISTS stats_order_daily (
+            date DATE NOT NULL,
+            platform TEXT NOT NULL,
+            orders INTEGER NOT NULL DEFAULT 0,
+            waited_orders INTEGER NOT NULL DEFAULT 0,
+            total_wait_seconds INTEGER NOT NULL DEFAULT 0,
+            max_wait_seconds INTEGER,
+            PRIMARY KEY (date, platform)
+        )
+    ");
+    
+    // Change counters bumped by triggers, so readers can cheaply tell whether anything changed
+    $db->exec("
+        CREATE TABLE IF NOT EXISTS app_meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0
+        )
+    ");
+    $db->exec("INSERT OR IGNORE INTO app_meta (key, value) VALUES ('board_version', 0), ('history_version', 0)");
+    foreach (['INSERT', 'UPDATE', 'DELETE'] as $event) {
+        $suffix = strtolower($event);
+        $db->exec("
+            CREATE TRIGGER IF NOT EXISTS orders_version_$suffix AFTER $event ON orders BEGIN
+                UPDATE app_meta SET value = value + 1 WHERE key = 'board_version';
+            END
+        ");
+    }
+    foreach (['INSERT', 'DELETE'] as $event) {
+        $suffix = strtolower($event);
+        $db->exec("
+            CREATE TRIGGER IF NOT EXISTS history_version_$suffix AFTER $event ON stats_order_history BEGIN
+                UPDATE app_meta SET value = value + 1 WHERE key = 'history_version';
+            END
+        ");
+    }
+    
+    // Precomputed chart series for admin/stats.php
+    $db->exec("
+        CREATE TABLE IF NOT EXISTS stats_cache (
+            cache_key TEXT PRIMARY KEY,
+            version TEXT NOT NULL,
+            payload TEXT NOT NULL
+        )
+    ");
+    
     // Create indexes
     $db->exec("CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status)");
     $db->exec("CREATE INDEX IF NOT EXISTS idx_orders_platform ON orders(platform)");
     $db->exec("CREATE INDEX IF NOT EXISTS idx_orders_created ON orders(created_at)");
+    $db->exec("CREATE INDEX IF NOT EXISTS idx_history_archived ON stats_order_history(archived_at)");
+    
+    initializeSearchIndex($db);
+    initializeWaitSketch($db);
     
     // Create default admin user if none exists
     $result = $db->querySingle("SELECT COUNT(*) FROM admin_users");
@@ -208,6 +279,197 @@ function initializeDatabase(SQLite3 $db): void {
     }
 }
 
+/**
+ * SQL statements adding one duration sample to stats_wait_sketch
+ *
+ * Buckets come from the wait_sketch_buckets lookup table, so no SQL math
+ * functions are needed. Once a cell holds more than WAIT_SKETCH_MAX_SAMPLES
+ * its counts are halved, keeping the estimate weighted towards recent orders.
+ */
+function waitSketchSampleSql(string $metric, string $platform, string $start, string $end): string {
+    $seconds = "MIN(strftime('%s', $end) - strftime('%s', $start), " . WAIT_SKETCH_MAX_SECONDS . ")";
+    $hour = "CAST(strftime('%H', $start, 'localtime') AS INTEGER)";
+    $cell = "metric = '$metric' AND platform = $platform AND hour = $hour";
+    
+    return "
+        INSERT INTO stats_wait_sketch (metric, platform, hour, bucket, count)
+        SELECT '$metric', $platform, $hour, MIN(bucket), 1
+        FROM wait_sketch_buckets WHERE upper >= $seconds
+        ON CONFLICT(metric, platform, hour, bucket) DO UPDATE SET count = count + 1;
+        UPDATE stats_wait_sketch SET count = count / 2
+        WHERE $cell AND (SELECT SUM(count) FROM stats_wait_sketch WHERE $cell) > " . WAIT_SKETCH_MAX_SAMPLES . ";
+        DELETE FROM stats_wait_sketch WHERE $cell AND count < 0.01;
+    ";
+}
+
+/**
+ * Create the wait-time sketch tables and the triggers that feed them
+ *
+ * Prep time (created -> ready) is sampled when an order turns READY, shelf
+ * dwell (ready -> picked up) when it is archived. On first creation the
+ * sketches are seeded from stats_order_history.
+ */
+function initializeWaitSketch(SQLite3 $db): void {
+    $exists = $db->querySingle("SELECT COUNT(*) FROM sqlite_master WHERE name = 'stats_wait_sketch'");
+    if ($exists) {
+        return;
+    }
+    
+    $db->exec("
+        CREATE TABLE IF NOT EXISTS wait_sketch_buckets (
+            bucket INTEGER PRIMARY KEY,
+            upper REAL NOT NULL
+        )
+    ");
+    $db->exec("CREATE UNIQUE INDEX IF NOT EXISTS idx_wait_sketch_upper ON wait_sketch_buckets(upper)");
+    $stmt = $db->prepare("INSERT OR REPLACE INTO wait_sketch_buckets (bucket, upper) VALUES (:bucket, :upper)");
+    $last = (int)ceil(log(WAIT_SKETCH_MAX_SECONDS) / log(WAIT_SKETCH_GAMMA));
+    for ($bucket = 0; $bucket <= $last; $bucket++) {
+        $stmt->bindValue(':bucket', $bucket, SQLITE3_INTEGER);
+        $stmt->bindValue(':upper', pow(WAIT_SKETCH_GAMMA, $bucket), SQLITE3_FLOAT);
+        $stmt->execute();
+        $stmt->reset();
+    }
+    
+    $db->exec("
+        CREATE TABLE IF NOT EXISTS stats_wait_sketch (
+            metric TEXT NOT NULL CHECK(metric IN ('prep', 'dwell')),
+            platform TEXT NOT NULL,
+            hour INTEGER NOT NULL,
+            bucket INTEGER NOT NULL,
+            count REAL NOT NULL,
+            PRIMARY KEY (metric, platform, hour, bucket)
+        ) WITHOUT ROWID
+    ");
+    
+    $prep = waitSketchSampleSql('prep', 'NEW.platform', 'NEW.created_at', 'NEW.ready_at');
+    $db->exec("
+        CREATE TRIGGER IF NOT EXISTS wait_sketch_prep AFTER UPDATE OF status ON orders
+        WHEN NEW.status = 'ready' AND OLD.status != 'ready' AND NEW.ready_at IS NOT NULL
+             AND NEW.ready_at >= NEW.created_at
+        BEGIN
+            $prep
+        END
+    ");
+    
+    $dwell = waitSketchSampleSql('dwell', 'NEW.platform', 'NEW.ready_at', 'NEW.picked_up_at');
+    $db->exec("
+        CREATE TRIGGER IF NOT EXISTS wait_sketch_dwell AFTER INSERT ON stats_order_history
+        WHEN NEW.ready_at IS NOT NULL AND NEW.picked_up_at >= NEW.ready_at
+        BEGIN
+            $dwell
+        END
+    ");
+    
+    // Seed from history already on file
+    foreach ([['prep', 'created_at', 'ready_at'], ['dwell', 'ready_at', 'picked_up_at']] as [$metric, $start, $end]) {
+        $seconds = "MIN(strftime('%s', h.$end) - strftime('%s', h.$start), " . WAIT_SKETCH_MAX_SECONDS . ")";
+        $db->exec("
+            INSERT INTO stats_wait_sketch (metric, platform, hour, bucket, count)
+            SELECT '$metric', h.platform, CAST(strftime('%H', h.$start, 'localtime') AS INTEGER),
+                   (SELECT MIN(bucket) FROM wait_sketch_buckets WHERE upper >= $seconds) AS bucket,
+                   COUNT(*)
+            FROM stats_order_history h
+            WHERE h.$start IS NOT NULL AND h.$end IS NOT NULL AND h.$end >= h.$start
+            GROUP BY 1, 2, 3, 4
+        ");
+    }
+}
+
+/**
+ * SQL expression equivalent to formatCustomerName() for a column reference
+ */
+function customerNameSql(string $column): string {
+    $name = "trim(replace(replace(replace($column, char(9), ' '), char(10), ' '), char(13), ' '))";
+    // rtrim() with every non-space character strips the last word, leaving its start offset
+    $lastWord = "substr($name, length(rtrim($name, replace($name, ' ', ''))) + 1)";
+    return "CASE WHEN instr($name, ' ') = 0 THEN upper($name) "
+         . "ELSE upper(substr($name, 1, instr($name, ' ') - 1)) || ' ' || upper(substr($lastWord, 1, 1)) END";
+}
+
+/**
+ * Initialize the order search index (FTS5)
+ *
+ * One row per active order (rowid = orders.id) and per archived order
+ * (rowid = -stats_order_history.id), kept in sync by triggers. The retention
+ * CLI keeps the rows of history it moves into ARCHIVE_DIR, and
+ * searchOrders() reads those orders from the archive files.
+ *
+ * If this SQLite build lacks FTS5, the library version is recorded in
+ * app_meta (search_unavailable) so later requests skip the attempt until
+ * SQLite is upgraded.
+ */
+function initializeSearchIndex(SQLite3 $db): void {
+    $exists = $db->querySingle("SELECT COUNT(*) FROM sqlite_master WHERE name = 'order_search'");
+    if ($exists) {
+        return;
+    }
+    
+    $sqliteVersion = SQLite3::version()['versionNumber'];
+    if ((int)$db->querySingle("SELECT value FROM app_meta WHERE key = 'search_unavailable'") === $sqliteVersion) {
+        return;
+    }
+    
+    $created = @$db->exec("
+        CREATE VIRTUAL TABLE order_search USING fts5(
+            order_id,
+            customer_name,
+            display_name,
+            source UNINDEXED,
+            prefix = '1 2 3'
+        )
+    ");
+    if (!$created) {
+        error_log('OrderBoard: SQLite FTS5 unavailable, order search disabled');
+        $stmt = $db->prepare("INSERT OR REPLACE INTO app_meta (key, value) VALUES ('search_unavailable', :version)");
+        $stmt->bindValue(':version', $sqliteVersion, SQLITE3_INTEGER);
+        $stmt->execute();
+        return;
+    }
+    
+    $newName = customerNameSql('NEW.customer_name');
+    
+    $db->exec("
+        CREATE TRIGGER IF NOT EXISTS orders_search_insert AFTER INSERT ON orders BEGIN
+            INSERT INTO order_search (rowid, order_id, customer_name, display_name, source)
+            VALUES (NEW.id, NEW.order_id, NEW.customer_name, $newName, 'active');
+        END
+    ");
+    $db->exec("
+        CREATE TRIGGER IF NOT EXISTS orders_search_update AFTER UPDATE OF order_id, customer_name ON orders BEGIN
+            DELETE FROM order_search WHERE rowid = OLD.id;
+            INSERT INTO order_search (rowid, order_id, customer_name, display_name, source)
+            VALUES (NEW.id, NEW.order_id, NEW.customer_name, $newName, 'active');
+        END
+    ");
+    $db->exec("
+        CREATE TRIGGER IF NOT EXISTS orders_search_delete AFTER DELETE ON orders BEGIN
+            DELETE FROM order_search WHERE rowid = OLD.id;
+        END
+    ");
+    $db->exec("
+        CREATE TRIGGER IF NOT EXISTS history_search_insert AFTER INSERT ON stats_order_history BEGIN
+            INSERT INTO order_search (rowid, order_id, customer_name, display_name, source)
+            VALUES (-NEW.id, NEW.order_id, NEW.customer_name, $newName, 'archived');
+        END
+    ");
+    $db->exec("
+        CREATE TRIGGER IF NOT EXISTS history_search_delete AFTER DELETE ON stats_order_history BEGIN
+            DELETE FROM order_search WHERE rowid = -OLD.id;
+        END
+    ");
+    
+    // Backfill rows that existed before the index
+    $db->exec("
+        INSERT INTO order_search (rowid, order_id, customer_name, display_name, source)
+        SELECT id, order_id, customer_name, " . customerNameSql('customer_name') . ", 'active' FROM orders
+    ");
+    $db->exec("
+        INSERT INTO order_search (rowid, order_id, customer_name, display_name, source)
+        SELECT -id, order_id, customer_name, " . customerNameSql('customer_name') . ", 'archived' FROM stats_order_history
+    ");
+}
+
 /**
  * JSON response helper
  */
@@ -0,0 +1,103 @@
+<?php
+/**
+ * Ghost Kitchen Order Board - Admin Dashboard Rendering
+ *
+ * Shared by admin/index.php (first render) and admin/board.php (partial refresh),
+ * so both produce identical markup.
+ */
+
+require_once __DIR__ . '/csrf.php';
+require_once __DIR__ . '/functions.php';
+
+/**
+ * Get one page of the dashboard: counters, the page's orders and the board version
+ *
+ * The version is read first, so if a write lands mid-request the data is
+ * newer than the version and the next poll simply fetches again.
+ */
+function getDashboardPage(int $page, int $pageSize = ADMIN_PAGE_SIZE): array {
+    $version = getBoardVersion();
+    $stats = getBoardSummary();
+    $total = $stats['active_orders'];
+    $pages = max(1, (int)ceil($total / $pageSize));
+    $page = min(max(1, $page), $pages);
+
+    return [
+        'version' => $version,
+        'stats' => $stats,
+        'orders' => listOrders(['limit' => $pageSize, 'offset' => ($page - 1) * $pageSize]),
+        'total' => $total,
+        'page' => $page,
+        'pages' => $pages
+    ];
+}
+
+/**
+ * Render table rows for a page of orders
+ */
+function renderOrderRows(array $orders): string {
+    if (empty($orders)) {
+        return '<tr><td colspan="6" class="text-center py-5 text-secondary">'
+             . '<i class="bi bi-inbox" style="font-size: 3rem;"></i>'
+             . '<p class="mt-2 mb-0">No active orders</p></td></tr>';
+    }
+
+    $csrf = csrfField();
+    $html = '';
+
+    foreach ($orders as $order) {
+        $displayName = htmlspecialchars(formatCustomerName($order['customer_name']));
+        $platform = htmlspecialchars($order['platform']);
+        $status = htmlspecialchars($order['status']);
+        $shelf = $order['shelf_location']
+            ? '<span class="shelf-badge">' . htmlspecialchars($order['shelf_location']) . '</span>'
+            : '<span class="text-secondary">—</span>';
+
+        $readyButton = '';
+        if ($order['status'] === 'preparing') {
+            $readyButton = '<button type="button" class="btn btn-sm btn-success" data-bs-toggle="modal" '
+                         . 'data-bs-target="#readyModal" data-order-id="' . (int)$order['id'] . '" '
+                         . 'data-display-name="' . $displayName . '">'
+                         . '<i class="bi bi-check-lg"></i> Ready</button> ';
+        }
+
+        $html .= '<tr>'
+            . '<td><code>' . htmlspecialchars($order['order_id']) . '</code></td>'
+            . '<td><strong>' . $displayName . '</strong>'
+            . '<br><small class="text-secondary">' . htmlspecialchars($order['customer_name']) . '</small></td>'
+            . '<td><span class="badge badge-' . $platform . '">' . ucfirst($platform) . '</span></td>'
+            . '<td><span class="badge badge-' . $status . '">' . strtoupper($status) . '</span></td>'
+            . '<td>' . $shelf . '</td>'
+            . '<td class="order-actions">' . $readyButton
+            . '<form method="POST" action="" class="d-inline" onsubmit="return confirm(\'Remove this order (mark as picked up)?\')">'
+            . $csrf
+            . '<input type="hidden" name="action" value="delete">'
+            . '<input type="hidden" name="order_id" value="' . (int)$order['id'] . '">'
+            . '<button type="submit" class="btn btn-sm btn-outline-danger"><i class="bi bi-x-lg"></i></button>'
+            . '</form></td>'
+            . '</tr>';
+    }
+
+    return $html;
+}
+
+/**
+ * Render the pager below the orders table (empty when everything fits on one page)
+ */
+function renderPager(int $page, int $pages): string {
+    if ($pages <= 1) {
+        return '';
+    }
+
+    $link = function (int $target, string $label, bool $disabled) {
+        $class = $disabled ? 'page-item disabled' : 'page-item';
+        return '<li class="' . $class . '"><a class="page-link" href="?page=' . $target . '" data-page="' . $target . '">'
+             . $label . '</a></li>';
+    };
+
+    return '<ul class="pagination pagination-sm justify-content-center my-2">'
+         . $link(max(1, $page - 1), '&laquo;', $page <= 1)
+         . '<li class="page-item disabled"><span class="page-link">Page ' . $page . ' of ' . $pages . '</span></li>'
+         . $link(min($pages, $page + 1), '&raquo;', $page >= $pages)
+         . '</ul>';
+}
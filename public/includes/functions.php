@@ -291,6 +291,7 @@ function listOrders(array $filters = []): array {
  */
 function getDisplayOrders(): array {
     $orders = listOrders(['limit' => MAX_DISPLAY_ORDERS]);
+    $sketches = ['prep' => getWaitSketches('prep')];
     
     $displayOrders = [];
     foreach ($orders as $order) {
@@ -301,13 +302,135 @@ function getDisplayOrders(): array {
             'platform' => $order['platform'],
             'status' => $order['status'],
             'shelf' => $order['shelf_location'],
-            'created_at' => $order['created_at']
+            'created_at' => $order['created_at'],
+            'eta_at' => $order['status'] === STATUS_PREPARING ? estimateOrderEta($order, null, $sketches)['eta_at'] : null
         ];
     }
     
     return $displayOrders;
 }
 
+/**
+ * Load history rows by id from the monthly archive files, newest month first
+ */
+function getArchivedHistory(array $ids): array {
+    $rows = [];
+    $paths = glob(ARCHIVE_DIR . '/orderboard-*.db') ?: [];
+    rsort($paths);
+    
+    foreach ($paths as $path) {
+        $wanted = array_diff($ids, array_keys($rows));
+        if (empty($wanted)) {
+            break;
+        }
+        try {
+            $archive = new SQLite3($path, SQLITE3_OPEN_READONLY);
+        } catch (Exception $e) {
+            error_log('OrderBoard: cannot open archive ' . $path . ': ' . $e->getMessage());
+            continue;
+        }
+        $result = $archive->query("SELECT id, order_id, customer_name, platform, created_at, ready_at, picked_up_at
+                                   FROM stats_order_history WHERE id IN (" . implode(',', array_map('intval', $wanted)) . ")");
+        while ($result && ($row = $result->fetchArray(SQLITE3_ASSOC))) {
+            $rows[$row['id']] = $row;
+        }
+        $archive->close();
+    }
+    
+    return $rows;
+}
+
+/**
+ * Search active and archived orders by customer name, display name or order ID
+ *
+ * Each word of the query is matched as a prefix, so "john d", "JOHN D" and
+ * "a1b2" all work. Active orders rank ahead of archived ones. Archived
+ * orders the retention CLI has moved out of the main file are read from
+ * the monthly archives.
+ */
+function searchOrders(string $query, int $limit = 10, bool $includeArchived = true): array {
+    $db = getDB();
+    
+    if (!$db->querySingle("SELECT COUNT(*) FROM sqlite_master WHERE name = 'order_search'")) {
+        throw new RuntimeException('Search index unavailable');
+    }
+    
+    $terms = preg_split('/[^\p{L}\p{N}]+/u', $query, -1, PREG_SPLIT_NO_EMPTY);
+    if (empty($terms)) {
+        throw new InvalidArgumentException('Search query is required');
+    }
+    $match = implode(' ', array_map(function ($term) {
+        return '"' . $term . '"*';
+    }, $terms));
+    
+    $sql = "
+        SELECT m.rank, m.source, m.rowid AS search_rowid,
+               COALESCE(o.id, h.id) AS id,
+               COALESCE(o.order_id, h.order_id) AS order_id,
+               COALESCE(o.customer_name, h.customer_name) AS customer_name,
+               COALESCE(o.platform, h.platform) AS platform,
+               COALESCE(o.status, 'picked_up') AS status,
+               o.shelf_location,
+               COALESCE(o.created_at, h.created_at) AS created_at,
+               COALESCE(o.ready_at, h.ready_at) AS ready_at,
+               h.picked_up_at
+        FROM (
+            SELECT rowid, source, bm25(order_search, 10.0, 5.0, 5.0) AS rank
+            FROM order_search
+            WHERE order_search MATCH :match" . ($includeArchived ? "" : " AND source = 'active'") . "
+            ORDER BY source = 'archived', rank
+            LIMIT :limit
+        ) m
+        LEFT JOIN orders o ON m.source = 'active' AND o.id = m.rowid
+        LEFT JOIN stats_order_history h ON m.source = 'archived' AND h.id = -m.rowid
+        ORDER BY m.source = 'archived', m.rank, created_at DESC
+    ";
+    
+    $stmt = $db->prepare($sql);
+    $stmt->bindValue(':match', $match, SQLITE3_TEXT);
+    $stmt->bindValue(':limit', $limit, SQLITE3_INTEGER);
+    $result = $stmt->execute();
+    
+    $rows = [];
+    while ($row = $result->fetchArray(SQLITE3_ASSOC)) {
+        $rows[] = $row;
+    }
+    
+    // Archived hits whose history row was compacted into an archive file
+    $compacted = [];
+    foreach ($rows as $row) {
+        if ($row['source'] === 'archived' && $row['id'] === null) {
+            $compacted[] = -$row['search_rowid'];
+        }
+    }
+    $archived = $compacted ? getArchivedHistory($compacted) : [];
+    
+    $orders = [];
+    foreach ($rows as $row) {
+        if ($row['source'] === 'archived' && $row['id'] === null) {
+            if (!isset($archived[-$row['search_rowid']])) {
+                continue;
+            }
+            $row = ['status' => 'picked_up', 'shelf_location' => null, 'source' => 'archived'] + $archived[-$row['search_rowid']];
+        }
+        $orders[] = [
+            'id' => $row['id'],
+            'order_id' => $row['order_id'],
+            'customer_name' => $row['customer_name'],
+            'display_name' => formatCustomerName($row['customer_name']),
+            'platform' => $row['platform'],
+            'status' => $row['status'],
+            'shelf_location' => $row['shelf_location'],
+            'created_at' => $row['created_at'],
+            'ready_at' => $row['ready_at'],
+            'picked_up_at' => $row['picked_up_at'],
+            'archived' => $row['source'] === 'archived'
+        ];
+    }
+    
+    return $orders;
+}
+
 /**
  * Get order statistics
  */
@@ -339,18 +462,317 @@ function getOrderStats(): array {
         $stats['by_platform'][$row['platform']] = $row['count'];
     }
     
-    // Today's completed orders
-    $result = $db->query("SELECT COUNT(*) as count FROM stats_order_history WHERE DATE(archived_at) = DATE('now')");
+    // Today's completed orders (range form so idx_history_archived applies)
+    $result = $db->query("SELECT COUNT(*) as count FROM stats_order_history WHERE archived_at >= DATE('now')");
     $stats['today_completed'] = $result->fetchArray(SQLITE3_ASSOC)['count'];
     
     // Average wait time (seconds)
-    $result = $db->query("SELECT AVG(wait_time_seconds) as avg FROM stats_order_history WHERE wait_time_seconds IS NOT NULL AND DATE(archived_at) = DATE('now')");
+    $result = $db->query("SELECT AVG(wait_time_seconds) as avg FROM stats_order_history WHERE wait_time_seconds IS NOT NULL AND archived_at >= DATE('now')");
     $row = $result->fetchArray(SQLITE3_ASSOC);
     $stats['avg_wait_time'] = $row['avg'] ? round($row['avg']) : 0;
     
     return $stats;
 }
 
+/**
+ * Get a change counter from app_meta
+ */
+function getMetaCounter(string $key): int {
+    $db = getDB();
+    $stmt = $db->prepare("SELECT value FROM app_meta WHERE key = :key");
+    $stmt->bindValue(':key', $key, SQLITE3_TEXT);
+    $row = $stmt->execute()->fetchArray(SQLITE3_ASSOC);
+    return $row ? (int)$row['value'] : 0;
+}
+
+/**
+ * Get the board version (changes whenever an active order is created, updated or removed)
+ */
+function getBoardVersion(): int {
+    return getMetaCounter('board_version');
+}
+
+/**
+ * Get dashboard counters (active, preparing, ready, completed today) in two queries
+ */
+function getBoardSummary(): array {
+    $db = getDB();
+    
+    $row = $db->query("
+        SELECT COUNT(*) AS active_orders,
+               COALESCE(SUM(status = 'preparing'), 0) AS preparing,
+               COALESCE(SUM(status = 'ready'), 0) AS ready
+        FROM orders
+    ")->fetchArray(SQLITE3_ASSOC);
+    
+    $row['today_completed'] = $db->querySingle("SELECT COUNT(*) FROM stats_order_history WHERE archived_at >= DATE('now')");
+    
+    return array_map('intval', $row);
+}
+
+/**
+ * Return a cached stats payload, recomputing it only when the version changes
+ */
+function cachedStats(string $key, string $version, callable $compute): array {
+    $db = getDB();
+    
+    $stmt = $db->prepare("SELECT version, payload FROM stats_cache WHERE cache_key = :key");
+    $stmt->bindValue(':key', $key, SQLITE3_TEXT);
+    $row = $stmt->execute()->fetchArray(SQLITE3_ASSOC);
+    if ($row && $row['version'] === $version) {
+        return json_decode($row['payload'], true);
+    }
+    
+    $payload = $compute();
+    
+    $stmt = $db->prepare("INSERT OR REPLACE INTO stats_cache (cache_key, version, payload) VALUES (:key, :version, :payload)");
+    $stmt->bindValue(':key', $key, SQLITE3_TEXT);
+    $stmt->bindValue(':version', $version, SQLITE3_TEXT);
+    $stmt->bindValue(':payload', json_encode($payload), SQLITE3_TEXT);
+    $stmt->execute();
+    
+    return $payload;
+}
+
+/**
+ * Get the 7-day chart series for the stats page
+ *
+ * Order history series are cached until history is written (or the day
+ * rolls over). API usage changes on every request, so it is cached for
+ * STATS_USAGE_CACHE_TTL seconds instead.
+ */
+function getStatsChartSeries(): array {
+    $db = getDB();
+    $today = date('Y-m-d');
+    
+    $history = cachedStats('history_7d', getMetaCounter('history_version') . ':' . $today, function () use ($db) {
+        $daily = [];
+        $result = $db->query("SELECT DATE(archived_at) as date, COUNT(*) as count, AVG(wait_time_seconds) as avg_wait
+                               FROM stats_order_history 
+                               WHERE archived_at >= date('now', '-7 days')
+                               GROUP BY DATE(archived_at)
+                               ORDER BY date DESC");
+        while ($row = $result->fetchArray(SQLITE3_ASSOC)) {
+            $daily[] = $row;
+        }
+        
+        $platforms = [];
+        $result = $db->query("SELECT platform, COUNT(*) as count 
+                               FROM stats_order_history 
+                               WHERE archived_at >= date('now', '-7 days')
+                               GROUP BY platform");
+        while ($row = $result->fetchArray(SQLITE3_ASSOC)) {
+            $platforms[$row['platform']] = $row['count'];
+        }
+        
+        return ['order_history' => $daily, 'platform_stats' => $platforms];
+    });
+    
+    $usage = cachedStats('api_usage_7d', $today . ':' . intdiv(time(), STATS_USAGE_CACHE_TTL), function () use ($db) {
+        $rows = [];
+        $result = $db->query("SELECT endpoint, SUM(requests) as total_requests, SUM(errors) as total_errors 
+                               FROM stats_api_usage 
+                               WHERE date >= date('now', '-7 days')
+                               GROUP BY endpoint 
+                               ORDER BY total_requests DESC");
+        while ($row = $result->fetchArray(SQLITE3_ASSOC)) {
+            $rows[] = $row;
+        }
+        return $rows;
+    });
+    
+    return $history + ['api_usage' => $usage];
+}
+
+/**
+ * Load the merged wait-time sketches for a metric
+ *
+ * Returns [bucket => count] histograms at each level estimateOrderEta()
+ * falls back through: 'hour' => [platform][hour], 'platform' => [platform]
+ * and 'all'. The levels are summed in SQL and kept in stats_cache until the
+ * board version changes (every sample is written by an order update or
+ * pickup), so a display request reads one cached row instead of the table.
+ */
+function getWaitSketches(string $metric): array {
+    $db = getDB();
+    
+    return cachedStats('wait_sketch_' . $metric, (string)getBoardVersion(), function () use ($db, $metric) {
+        $sketches = ['hour' => [], 'platform' => [], 'all' => []];
+        
+        $stmt = $db->prepare("SELECT platform, hour, bucket, count FROM stats_wait_sketch WHERE metric = :metric ORDER BY bucket");
+        $stmt->bindValue(':metric', $metric, SQLITE3_TEXT);
+        $result = $stmt->execute();
+        while ($row = $result->fetchArray(SQLITE3_ASSOC)) {
+            $sketches['hour'][$row['platform']][(int)$row['hour']][(int)$row['bucket']] = (float)$row['count'];
+        }
+        
+        $stmt = $db->prepare("SELECT platform, bucket, SUM(count) AS count FROM stats_wait_sketch
+                              WHERE metric = :metric GROUP BY platform, bucket ORDER BY bucket");
+        $stmt->bindValue(':metric', $metric, SQLITE3_TEXT);
+        $result = $stmt->execute();
+        while ($row = $result->fetchArray(SQLITE3_ASSOC)) {
+            $sketches['platform'][$row['platform']][(int)$row['bucket']] = (float)$row['count'];
+        }
+        
+        $stmt = $db->prepare("SELECT bucket, SUM(count) AS count FROM stats_wait_sketch
+                              WHERE metric = :metric GROUP BY bucket ORDER BY bucket");
+        $stmt->bindValue(':metric', $metric, SQLITE3_TEXT);
+        $result = $stmt->execute();
+        while ($row = $result->fetchArray(SQLITE3_ASSOC)) {
+            $sketches['all'][(int)$row['bucket']] = (float)$row['count'];
+        }
+        
+        return $sketches;
+    });
+}
+
+/**
+ * Largest duration in seconds that falls in a sketch bucket
+ */
+function waitSketchBucketUpper(int $bucket): float {
+    return $bucket > 0 ? pow(WAIT_SKETCH_GAMMA, $bucket) : 1.0;
+}
+
+/**
+ * Duration in seconds at quantile $q of a sketch, or null if it is empty
+ *
+ * With $above > 0 only durations longer than $above are considered, i.e. the
+ * quantile is conditioned on the wait having already lasted that long. If
+ * the quantile falls in the bucket $above is in, the bucket's upper bound is
+ * returned, so the result does not move while the wait stays in that bucket.
+ */
+function waitSketchQuantile(array $counts, float $q, float $above = 0): ?float {
+    ksort($counts);
+    
+    $buckets = [];
+    $mass = 0;
+    foreach ($counts as $bucket => $count) {
+        if (waitSketchBucketUpper($bucket) > $above) {
+            $buckets[$bucket] = $count;
+            $mass += $count;
+        }
+    }
+    if ($mass <= 0) {
+        return null;
+    }
+    
+    $rank = $q * $mass;
+    $seen = 0;
+    foreach ($buckets as $bucket => $count) {
+        $seen += $count;
+        if ($seen >= $rank) {
+            break;
+        }
+    }
+    
+    $value = $bucket > 0 ? 2 * pow(WAIT_SKETCH_GAMMA, $bucket) / (WAIT_SKETCH_GAMMA + 1) : 0.0;
+    return $value >= $above ? $value : waitSketchBucketUpper($bucket);
+}
+
+/**
+ * Sample count and p50/p75/p90 (whole seconds) of a sketch
+ */
+function summarizeWaitSketch(array $counts): array {
+    $summary = ['samples' => (int)round(array_sum($counts))];
+    foreach (['p50' => 0.5, 'p75' => 0.75, 'p90' => 0.9] as $name => $q) {
+        $value = waitSketchQuantile($counts, $q);
+        $summary[$name] = $value === null ? null : (int)round($value);
+    }
+    return $summary;
+}
+
+/**
+ * Local hour of day (as used by the sketch triggers) for a UTC timestamp
+ */
+function waitSketchHour(int $timestamp): int {
+    static $offset = null;
+    
+    if ($offset === null) {
+        $offset = (int)getDB()->querySingle("SELECT strftime('%s', 'now', 'localtime') - strftime('%s', 'now')");
+    }
+    
+    return (int)gmdate('G', $timestamp + $offset);
+}
+
+/**
+ * Estimate when an active order moves on
+ *
+ * PREPARING orders get the expected time until READY, READY orders the
+ * expected time until pickup. The estimate is the median of the order's
+ * platform/hour sketch conditioned on the time already waited, falling back
+ * to the platform across all hours, then the whole board, while a sketch has
+ * fewer than WAIT_SKETCH_MIN_SAMPLES samples.
+ *
+ * Callers estimating several orders pass ['prep' => ..., 'dwell' => ...]
+ * from getWaitSketches() as $sketches so they are loaded once.
+ *
+ * Returns metric, elapsed_seconds, eta_seconds, eta_at and basis
+ * ('hour', 'platform', 'all' or 'none' - eta_seconds is null for 'none').
+ * eta_at (UTC) only changes when the wait moves into another sketch bucket,
+ * which is why the display feed carries it instead of eta_seconds.
+ */
+function estimateOrderEta(array $order, ?int $now = null, ?array $sketches = null): array {
+    $now = $now ?? time();
+    
+    if ($order['status'] === STATUS_READY) {
+        $metric = 'dwell';
+        $stamp = $order['ready_at'] ?? $order['updated_at'] ?? $order['created_at'];
+    } else {
+        $metric = 'prep';
+        $stamp = $order['created_at'];
+    }
+    $started = $stamp ? strtotime($stamp . ' UTC') : $now;
+    $elapsed = max(0, $now - $started);
+    
+    $sketch = $sketches[$metric] ?? getWaitSketches($metric);
+    $platform = $order['platform'];
+    $basis = 'none';
+    $counts = [];
+    foreach ([
+        'hour' => $sketch['hour'][$platform][waitSketchHour($started)] ?? [],
+        'platform' => $sketch['platform'][$platform] ?? [],
+        'all' => $sketch['all']
+    ] as $candidate => $candidateCounts) {
+        if (array_sum($candidateCounts) >= WAIT_SKETCH_MIN_SAMPLES) {
+            $basis = $candidate;
+            $counts = $candidateCounts;
+            break;
+        }
+    }
+    
+    $eta = null;
+    $due = null;
+    if ($basis !== 'none') {
+        // Past every recorded duration: due when the longest one ended
+        $value = waitSketchQuantile($counts, 0.5, $elapsed) ?? waitSketchBucketUpper(max(array_keys($counts)));
+        $due = $started + (int)round($value);
+        $eta = max(0, $due - $now);
+    }
+    
+    return [
+        'metric' => $metric,
+        'elapsed_seconds' => $elapsed,
+        'eta_seconds' => $eta,
+        'eta_at' => $due === null ? null : gmdate('Y-m-d H:i:s', $due),
+        'basis' => $basis
+    ];
+}
+
+/**
+ * Prep and shelf dwell quantiles per platform, over all hours or just one
+ */
+function getWaitTimeQuantiles(?int $hour = null): array {
+    $quantiles = [];
+    foreach (['prep', 'dwell'] as $metric) {
+        $sketch = getWaitSketches($metric);
+        foreach (PLATFORMS as $platform) {
+            $counts = $hour === null ? ($sketch['platform'][$platform] ?? []) : ($sketch['hour'][$platform][$hour] ?? []);
+            $quantiles[$metric][$platform] = summarizeWaitSketch($counts);
+        }
+    }
+    return $quantiles;
+}
+
 /**
  * Track API usage
  */
@@ -0,0 +1,111 @@
+/**
+ * Ghost Kitchen Order Board - Admin Dashboard JavaScript
+ *
+ * Polls the board version and swaps in the stats, rows and pager only when
+ * the board has changed. Only the current page of orders is ever in the DOM.
+ */
+
+class AdminDashboard {
+    constructor(board) {
+        this.board = board;
+        this.feedUrl = board.dataset.feed;
+        this.version = parseInt(board.dataset.version, 10);
+        this.page = parseInt(board.dataset.page, 10) || 1;
+        this.refreshInterval = parseInt(board.dataset.refresh, 10) || 5000;
+        this.rows = document.getElementById('order-rows');
+        this.pager = document.getElementById('order-pager');
+        this.readyModal = document.getElementById('readyModal');
+        this.timer = null;
+
+        this.init();
+    }
+
+    init() {
+        // Pager links work without JS; with it, only the table is swapped
+        this.pager.addEventListener('click', (event) => {
+            const link = event.target.closest('a[data-page]');
+            if (!link) return;
+            event.preventDefault();
+            this.refresh(parseInt(link.dataset.page, 10), true);
+        });
+
+        // One modal for every row: fill it from the clicked Ready button
+        this.readyModal.addEventListener('show.bs.modal', (event) => {
+            const button = event.relatedTarget;
+            this.readyModal.querySelector('input[name="order_id"]').value = button.dataset.orderId;
+            this.readyModal.querySelector('.ready-display-name').textContent = button.dataset.displayName;
+            this.readyModal.querySelectorAll('input[name="shelf_location"]').forEach(input => {
+                input.checked = false;
+            });
+        });
+
+        // Check right away when the tab comes back into view
+        document.addEventListener('visibilitychange', () => {
+            if (!document.hidden) this.refresh(this.page);
+        });
+
+        this.schedule();
+    }
+
+    schedule() {
+        clearTimeout(this.timer);
+        this.timer = setTimeout(async () => {
+            if (!document.hidden) {
+                await this.refresh(this.page);
+            }
+            this.schedule();
+        }, this.refreshInterval);
+    }
+
+    async refresh(page, force = false) {
+        const params = new URLSearchParams({ page });
+        if (!force) {
+            params.set('since', this.version);
+        }
+
+        try {
+            const response = await fetch(`${this.feedUrl}?${params}`, {
+                credentials: 'same-origin',
+                headers: { 'Accept': 'application/json' }
+            });
+
+            if (response.status === 401) {
+                window.location.href = '/admin/login.php';
+                return;
+            }
+
+            const data = await response.json();
+            if (data.success && data.changed) {
+                this.render(data);
+            }
+        } catch (error) {
+            console.error('Failed to refresh orders:', error);
+        }
+    }
+
+    render(data) {
+        this.version = data.version;
+        this.page = data.page;
+
+        Object.entries(data.stats).forEach(([key, value]) => {
+            document.querySelectorAll(`[data-stat="${key}"]`).forEach(el => {
+                el.textContent = value;
+            });
+        });
+
+        this.rows.innerHTML = data.rows_html;
+        this.pager.innerHTML = data.pager_html;
+
+        const url = new URL(window.location.href);
+        url.searchParams.set('page', data.page);
+        window.history.replaceState(null, '', url);
+    }
+}
+
+// Initialize dashboard when DOM is ready
+document.addEventListener('DOMContentLoaded', () => {
+    const board = document.getElementById('order-board');
+    if (board) {
+        new AdminDashboard(board);
+    }
+});
@@ -7,6 +7,8 @@
 class OrderDisplay {
     constructor() {
         this.refreshInterval = 5000; // Will be updated from API
+        // Optional ?feed=URL to read from a display relay instead of this host
+        this.feedUrl = this.resolveFeedUrl(new URLSearchParams(window.location.search).get('feed'));
         this.ordersContainer = document.getElementById('orders-container');
         this.clockElement = document.getElementById('clock');
         this.statusDot = document.querySelector('.status-dot');
@@ -21,9 +23,28 @@ class OrderDisplay {
         this.startAutoRefresh();
     }
     
+    resolveFeedUrl(feed) {
+        // Only this host or a relay origin listed in ORDERBOARD_RELAY_ORIGINS may feed the board
+        const fallback = '/api/display.php';
+        if (!feed) return fallback;
+        
+        let url;
+        try {
+            url = new URL(feed, window.location.href);
+        } catch (error) {
+            return fallback;
+        }
+        const allowed = JSON.parse(document.body.dataset.relayOrigins || '[]');
+        if (url.origin === window.location.origin || allowed.includes(url.origin)) {
+            return url.href;
+        }
+        console.warn('Ignoring display feed from unlisted origin:', url.origin);
+        return fallback;
+    }
+    
     async fetchOrders() {
         try {
-            const response = await fetch('/api/display.php');
+            const response = await fetch(this.feedUrl);
             const data = await response.json();
             
             if (data.success) {
@@ -66,25 +87,36 @@ class OrderDisplay {
         const statusClass = order.status === 'ready' ? 'ready' : 'preparing';
         const statusText = order.status === 'ready' 
             ? `READY <span class="arrow">→</span>` 
-            : 'PREPARING';
+            : `PREPARING${this.formatEta(order.eta_at)}`;
         const shelfLocation = order.status === 'ready' && order.shelf 
             ? order.shelf 
             : '';
+        const platform = this.escapeHtml(order.platform);
         
         return `
-            <div class="order-row status-${statusClass}" data-order-id="${order.order_id}">
+            <div class="order-row status-${statusClass}" data-order-id="${this.escapeHtml(order.order_id)}">
                 <div class="order-name">${this.escapeHtml(order.name)}</div>
-                <div class="order-platform ${order.platform}">
-                    <img src="/img/${order.platform}-logo.svg" 
-                         alt="${this.getPlatformName(order.platform)}"
-                         onerror="this.style.display='none'; this.parentElement.innerHTML='${this.getPlatformName(order.platform).toUpperCase()}'">
+                <div class="order-platform ${platform}">
+                    <img src="/img/${encodeURIComponent(order.platform)}-logo.svg" 
+                         alt="${this.escapeHtml(this.getPlatformName(order.platform))}"
+                         onerror="this.style.display='none'; this.parentElement.textContent=this.alt.toUpperCase()">
                 </div>
                 <div class="order-status ${statusClass}">${statusText}</div>
-                <div class="order-shelf">${shelfLocation}</div>
+                <div class="order-shelf">${this.escapeHtml(shelfLocation)}</div>
             </div>
         `;
     }
     
+    formatEta(etaAt) {
+        // No estimate until the board has enough history
+        if (!etaAt) return '';
+        // eta_at is "YYYY-MM-DD HH:MM:SS" UTC; absolute so the feed stays cacheable
+        const seconds = (Date.parse(etaAt.replace(' ', 'T') + 'Z') - Date.now()) / 1000;
+        if (isNaN(seconds)) return '';
+        const minutes = Math.max(1, Math.round(seconds / 60));
+        return ` <span class="eta">~${minutes} MIN</span>`;
+    }
+    
     getPlatformName(platform) {
         const names = {
             'doordash': 'DoorDash',
@@ -95,9 +127,9 @@ class OrderDisplay {
     }
     
     escapeHtml(text) {
-        const div = document.createElement('div');
-        div.textContent = text;
-        return div.innerHTML;
+        // Also escapes quotes, since values are interpolated into attributes
+        const entities = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
+        return String(text ?? '').replace(/[&<>"']/g, c => entities[c]);
     }
     
     updateOrderCount(count) {
@@ -17,7 +17,9 @@ import argparse
 import json
 import os
 import sys
-from typing import Dict, Any
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
 from urllib.request import Request, urlopen
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
@@ -174,6 +176,25 @@ def get_order(args: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+def search_orders(args: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Search active and picked-up orders by customer name or order ID.
+    
+    Agent can use this when a driver gives a name ("John D") instead of an order ID.
+    """
+    if not args.get('query'):
+        return {"success": False, "error": "query is required"}
+    
+    params = {'q': args['query']}
+    if args.get('limit'):
+        params['limit'] = args['limit']
+    if args.get('active_only'):
+        params['include_archived'] = 0
+    
+    result = make_request('GET', 'search-orders.php', params=params)
+    return result
+
+
 def delete_order(args: Dict[str, Any]) -> Dict[str, Any]:
     """
     Remove an order from the board (marks as picked up).
@@ -203,6 +224,88 @@ def get_stats(args: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+def get_eta(args: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get wait-time quantiles and ETAs for active orders (or one order).
+    
+    Agent can use this to tell a driver how long until an order is ready.
+    """
+    params = {}
+    if args.get('order_id'):
+        params['order_id'] = args['order_id']
+    elif args.get('id'):
+        params['id'] = args['id']
+    if args.get('hour') is not None:
+        params['hour'] = args['hour']
+    
+    result = make_request('GET', 'eta.php', params=params)
+    return result
+
+
+def _status_since(order: Dict[str, Any]) -> Optional[float]:
+    """UNIX time at which an order entered its current status (timestamps are UTC)."""
+    if order.get('status') == 'ready':
+        stamp = order.get('ready_at') or order.get('updated_at') or order.get('created_at')
+    else:
+        stamp = order.get('created_at')
+    if not stamp:
+        return None
+    return datetime.fromisoformat(stamp).replace(tzinfo=timezone.utc).timestamp()
+
+
+def stuck_orders(args: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    List orders stuck in PREPARING or sitting READY longer than their threshold.
+    
+    Thresholds are in minutes per status, with optional per-platform overrides
+    keyed "platform:status". Same rules as orderboard_sdk.watcher.AgingWatcher.
+    """
+    thresholds = {
+        'preparing': float(args.get('preparing_minutes', 20)),
+        'ready': float(args.get('ready_minutes', 10))
+    }
+    if args.get('thresholds'):
+        try:
+            overrides = json.loads(args['thresholds'])
+        except json.JSONDecodeError:
+            return {"success": False, "error": "thresholds must be a JSON object, e.g. {\"doordash:ready\": 5}"}
+        if not isinstance(overrides, dict):
+            return {"success": False, "error": "thresholds must be a JSON object, e.g. {\"doordash:ready\": 5}"}
+        thresholds.update({key: float(value) for key, value in overrides.items()})
+    
+    params = {}
+    if args.get('platform'):
+        params['platform'] = args['platform']
+    
+    result = make_request('GET', 'list-orders.php', params=params)
+    if not result.get('success'):
+        return result
+    
+    now = time.time()
+    stuck = []
+    for order in result.get('orders', []):
+        status = order.get('status')
+        limit = thresholds.get(f"{order.get('platform')}:{status}", thresholds.get(status))
+        since = _status_since(order)
+        if limit is None or since is None:
+            continue
+        age = (now - since) / 60
+        if age >= limit:
+            stuck.append({
+                'order_id': order.get('order_id'),
+                'display_name': order.get('display_name'),
+                'platform': order.get('platform'),
+                'status': status,
+                'shelf_location': order.get('shelf_location'),
+                'age_minutes': round(age, 1),
+                'threshold_minutes': limit,
+                'overdue_minutes': round(age - limit, 1)
+            })
+    
+    stuck.sort(key=lambda o: o['overdue_minutes'], reverse=True)
+    return {"success": True, "orders": stuck, "count": len(stuck), "thresholds": thresholds}
+
+
 def get_description() -> Dict[str, Any]:
     """Return plugin description for SMCP --describe."""
     return {
@@ -269,6 +372,17 @@ def get_description() -> Dict[str, Any]:
                     {"name": "id", "type": "number", "description": "Database ID (alternative to order_id)", "required": False}
                 ]
             },
+            {
+                "name": "search-orders",
+                "description": "Search orders by customer name, display name (e.g. JOHN D) or order ID",
+                "parameters": [
+                    {"name": "api_key", "type": "string", "description": "Order Board API key (required for auth)", "required": True},
+                    {"name": "base_url", "type": "string", "description": "Order Board base URL (required; e.g. http://localhost:8000)", "required": True},
+                    {"name": "query", "type": "string", "description": "Name or order ID; each word matches as a prefix", "required": True},
+                    {"name": "limit", "type": "number", "description": "Max results to return (default 10, max 50)", "required": False},
+                    {"name": "active_only", "type": "boolean", "description": "Exclude picked-up orders", "required": False}
+                ]
+            },
             {
                 "name": "delete-order",
                 "description": "Remove order from board (mark as picked up)",
@@ -279,6 +393,29 @@ def get_description() -> Dict[str, Any]:
                     {"name": "id", "type": "number", "description": "Database ID (alternative to order_id)", "required": False}
                 ]
             },
+            {
+                "name": "stuck-orders",
+                "description": "List orders stuck in PREPARING or sitting READY longer than their threshold",
+                "parameters": [
+                    {"name": "api_key", "type": "string", "description": "Order Board API key (required for auth)", "required": True},
+                    {"name": "base_url", "type": "string", "description": "Order Board base URL (required; e.g. http://localhost:8000)", "required": True},
+                    {"name": "preparing_minutes", "type": "number", "description": "Minutes before a PREPARING order is stuck (default 20)", "required": False},
+                    {"name": "ready_minutes", "type": "number", "description": "Minutes before a READY order is stuck (default 10)", "required": False},
+                    {"name": "thresholds", "type": "string", "description": "JSON per-platform overrides in minutes, e.g. {\"doordash:ready\": 5}", "required": False},
+                    {"name": "platform", "type": "string", "description": "Only check this platform", "required": False}
+                ]
+            },
+            {
+                "name": "eta",
+                "description": "Estimate when orders will be ready or picked up, with prep and shelf wait-time quantiles",
+                "parameters": [
+                    {"name": "api_key", "type": "string", "description": "Order Board API key (required for auth)", "required": True},
+                    {"name": "base_url", "type": "string", "description": "Order Board base URL (required; e.g. http://localhost:8000)", "required": True},
+                    {"name": "order_id", "type": "string", "description": "Only estimate this order", "required": False},
+                    {"name": "id", "type": "number", "description": "Database ID (alternative to order_id)", "required": False},
+                    {"name": "hour", "type": "number", "description": "Report quantiles for this local hour (0-23)", "required": False}
+                ]
+            },
             {
                 "name": "stats",
                 "description": "Get order board statistics",
@@ -302,7 +439,10 @@ Available commands:
   mark-ready      Mark order as ready with shelf location
   list-orders     List all active orders
   get-order       Get a specific order
+  search-orders   Search orders by name or order ID
   delete-order    Remove order (mark as picked up)
+  stuck-orders    List orders waiting too long in their status
+  eta             Estimate when orders will be ready or picked up
   stats           Get order statistics
 
 Authentication:
@@ -313,7 +453,10 @@ Examples:
   python cli.py --api-key YOUR_KEY create-order --customer-name "John Doe" --platform doordash
   python cli.py --api-key YOUR_KEY mark-ready --order-id ORD-A1B2C3D4 --shelf-location B
   python cli.py --api-key YOUR_KEY list-orders --status ready
+  python cli.py --api-key YOUR_KEY search-orders --query "john d"
   python cli.py --api-key YOUR_KEY delete-order --order-id ORD-A1B2C3D4
+  python cli.py --api-key YOUR_KEY stuck-orders --ready-minutes 5
+  python cli.py --api-key YOUR_KEY eta --order-id ORD-A1B2C3D4
         """
     )
     
@@ -367,12 +510,34 @@ Examples:
     get_parser.add_argument('--order-id', help='Order ID')
     get_parser.add_argument('--id', type=int, help='Database ID')
 
+    # search-orders
+    search_parser = subparsers.add_parser('search-orders', help='Search orders by name or order ID')
+    add_auth_args(search_parser)
+    search_parser.add_argument('--query', required=True, help='Name or order ID')
+    search_parser.add_argument('--limit', type=int, help='Max results')
+    search_parser.add_argument('--active-only', action='store_true', default=None, help='Exclude picked-up orders')
+
     # delete-order
     delete_parser = subparsers.add_parser('delete-order', help='Remove order from board')
     add_auth_args(delete_parser)
     delete_parser.add_argument('--order-id', help='Order ID')
     delete_parser.add_argument('--id', type=int, help='Database ID')
 
+    # stuck-orders
+    stuck_parser = subparsers.add_parser('stuck-orders', help='List orders waiting too long')
+    add_auth_args(stuck_parser)
+    stuck_parser.add_argument('--preparing-minutes', type=float, default=20, help='Minutes before a PREPARING order is stuck (default 20)')
+    stuck_parser.add_argument('--ready-minutes', type=float, default=10, help='Minutes before a READY order is stuck (default 10)')
+    stuck_parser.add_argument('--thresholds', help='JSON per-platform overrides in minutes, e.g. \'{"doordash:ready": 5}\'')
+    stuck_parser.add_argument('--platform', choices=['doordash', 'ubereats', 'grubhub'], help='Only check this platform')
+
+    # eta
+    eta_parser = subparsers.add_parser('eta', help='Estimate when orders will be ready or picked up')
+    add_auth_args(eta_parser)
+    eta_parser.add_argument('--order-id', help='Only estimate this order')
+    eta_parser.add_argument('--id', type=int, help='Database ID')
+    eta_parser.add_argument('--hour', type=int, help='Report quantiles for this local hour (0-23)')
+
     # stats
     stats_parser = subparsers.add_parser('stats', help='Get statistics')
     add_auth_args(stats_parser)
@@ -418,8 +583,14 @@ Examples:
             result = list_orders(args_dict)
         elif args.command == 'get-order':
             result = get_order(args_dict)
+        elif args.command == 'search-orders':
+            result = search_orders(args_dict)
         elif args.command == 'delete-order':
             result = delete_order(args_dict)
+        elif args.command == 'stuck-orders':
+            result = stuck_orders(args_dict)
+        elif args.command == 'eta':
+            result = get_eta(args_dict)
         elif args.command == 'stats':
             result = get_stats(args_dict)
         else:
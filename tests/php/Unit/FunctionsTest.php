@@ -241,6 +241,57 @@ class FunctionsTest extends TestCase
         }
     }
 
+    public function testSearchOrdersByNameAndDisplayName(): void
+    {
+        $created = createOrder(['customer_name' => 'Quentin Zephyrson', 'platform' => 'doordash']);
+        $byName = searchOrders('zephyr');
+        $this->assertCount(1, $byName);
+        $this->assertSame($created['order_id'], $byName[0]['order_id']);
+        $this->assertSame('QUENTIN Z', $byName[0]['display_name']);
+        $this->assertFalse($byName[0]['archived']);
+
+        $byDisplay = searchOrders('QUENTIN Z');
+        $this->assertSame($created['order_id'], $byDisplay[0]['order_id']);
+    }
+
+    public function testSearchOrdersByOrderIdPrefix(): void
+    {
+        createOrder(['customer_name' => 'Prefix Search', 'platform' => 'ubereats', 'order_id' => 'ORD-5EA4C401']);
+        $found = searchOrders('5EA4');
+        $this->assertSame('ORD-5EA4C401', $found[0]['order_id']);
+    }
+
+    public function testSearchOrdersFollowsUpdatesAndArchive(): void
+    {
+        $created = createOrder(['customer_name' => 'Ursula Vantablack', 'platform' => 'grubhub']);
+        updateOrder($created['id'], ['customer_name' => 'Ursula Vermillion']);
+        $this->assertCount(0, searchOrders('vantablack'));
+        $this->assertCount(1, searchOrders('vermillion'));
+
+        deleteOrder($created['id']);
+        $archived = searchOrders('vermillion');
+        $this->assertCount(1, $archived);
+        $this->assertTrue($archived[0]['archived']);
+        $this->assertSame('picked_up', $archived[0]['status']);
+        $this->assertCount(0, searchOrders('vermillion', 10, false));
+    }
+
+    public function testSearchIndexSkipsRetryWhenFts5Unavailable(): void
+    {
+        $db = new SQLite3(':memory:');
+        $db->exec("CREATE TABLE app_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL DEFAULT 0)");
+        $db->exec("INSERT INTO app_meta (key, value) VALUES ('search_unavailable', " . SQLite3::version()['versionNumber'] . ")");
+        initializeSearchIndex($db);
+        $this->assertSame(0, $db->querySingle("SELECT COUNT(*) FROM sqlite_master WHERE name = 'order_search'"));
+        $db->close();
+    }
+
+    public function testSearchOrdersThrowsOnEmptyQuery(): void
+    {
+        $this->expectException(InvalidArgumentException::class);
+        searchOrders(' - ');
+    }
+
     public function testGetOrderStats(): void
     {
         $stats = getOrderStats();
@@ -252,6 +303,102 @@ class FunctionsTest extends TestCase
         $this->assertArrayHasKey('avg_wait_time', $stats);
     }
 
+    public function testBoardVersionChangesOnEveryWrite(): void
+    {
+        $before = getBoardVersion();
+        $created = createOrder(['customer_name' => 'Version Check', 'platform' => 'doordash']);
+        $afterCreate = getBoardVersion();
+        $this->assertGreaterThan($before, $afterCreate);
+
+        markOrderReady($created['id'], 'C');
+        $afterReady = getBoardVersion();
+        $this->assertGreaterThan($afterCreate, $afterReady);
+
+        $this->assertSame($afterReady, getBoardVersion());
+        deleteOrder($created['id']);
+        $this->assertGreaterThan($afterReady, getBoardVersion());
+    }
+
+    public function testGetBoardSummaryMatchesOrderStats(): void
+    {
+        createOrder(['customer_name' => 'Summary Check', 'platform' => 'ubereats']);
+        $summary = getBoardSummary();
+        $stats = getOrderStats();
+        $this->assertSame($stats['active_orders'], $summary['active_orders']);
+        $this->assertSame((int)($stats['preparing'] ?? 0), $summary['preparing']);
+        $this->assertSame((int)($stats['ready'] ?? 0), $summary['ready']);
+        $this->assertSame($stats['today_completed'], $summary['today_completed']);
+        $this->assertSame($summary['active_orders'], getDB()->querySingle("SELECT COUNT(*) FROM orders"));
+    }
+
+    public function testStatsChartSeriesCachedUntilHistoryWritten(): void
+    {
+        $created = createOrder(['customer_name' => 'Chart Check', 'platform' => 'grubhub']);
+        $before = getStatsChartSeries();
+        $this->assertArrayHasKey('order_history', $before);
+        $this->assertArrayHasKey('platform_stats', $before);
+        $this->assertArrayHasKey('api_usage', $before);
+
+        // Unrelated board writes don't touch the history series
+        markOrderReady($created['id'], 'A');
+        $this->assertSame($before['platform_stats'], getStatsChartSeries()['platform_stats']);
+
+        deleteOrder($created['id']);
+        $after = getStatsChartSeries();
+        $this->assertSame(($before['platform_stats']['grubhub'] ?? 0) + 1, $after['platform_stats']['grubhub']);
+    }
+
+    public function testWaitSketchQuantile(): void
+    {
+        $counts = [60 => 8.0, 68 => 2.0];  // ~300s and ~650s
+        $this->assertNull(waitSketchQuantile([], 0.5));
+        $this->assertEqualsWithDelta(300, waitSketchQuantile($counts, 0.5), 15);
+        $this->assertEqualsWithDelta(650, waitSketchQuantile($counts, 0.9), 35);
+        // Conditioned on having waited past the first bucket
+        $this->assertEqualsWithDelta(650, waitSketchQuantile($counts, 0.5, 400), 35);
+        $this->assertSame(['samples' => 0, 'p50' => null, 'p75' => null, 'p90' => null], summarizeWaitSketch([]));
+    }
+
+    public function testWaitSketchRecordsPrepAndDwell(): void
+    {
+        $before = getWaitTimeQuantiles();
+        $created = createOrder(['customer_name' => 'Sketch Check', 'platform' => 'grubhub']);
+        markOrderReady($created['id'], 'D');
+        $afterReady = getWaitTimeQuantiles();
+        $this->assertSame($before['prep']['grubhub']['samples'] + 1, $afterReady['prep']['grubhub']['samples']);
+        $this->assertSame($before['dwell']['grubhub']['samples'], $afterReady['dwell']['grubhub']['samples']);
+
+        deleteOrder($created['id']);
+        $this->assertSame($before['dwell']['grubhub']['samples'] + 1, getWaitTimeQuantiles()['dwell']['grubhub']['samples']);
+    }
+
+    public function testEstimateOrderEtaAndDisplayFeed(): void
+    {
+        $created = createOrder(['customer_name' => 'Eta Check', 'platform' => 'doordash']);
+        $eta = estimateOrderEta(getOrderById($created['id']));
+        $this->assertSame('prep', $eta['metric']);
+        $this->assertContains($eta['basis'], ['hour', 'platform', 'all', 'none']);
+        $this->assertSame($eta['basis'] === 'none', $eta['eta_seconds'] === null);
+
+        $display = getDisplayOrders();
+        $this->assertNotEmpty($display);
+        foreach ($display as $row) {
+            $this->assertArrayHasKey('eta_at', $row);
+            if ($row['status'] === 'ready') {
+                $this->assertNull($row['eta_at']);
+            }
+        }
+
+        // The merged sketches are served from stats_cache until the board changes
+        $version = getDB()->querySingle("SELECT version FROM stats_cache WHERE cache_key = 'wait_sketch_prep'");
+        $this->assertSame((string)getBoardVersion(), $version);
+        $this->assertSame(getWaitSketches('prep'), getWaitSketches('prep'));
+
+        markOrderReady($created['id'], 'E');
+        $this->assertSame('dwell', estimateOrderEta(getOrderById($created['id']))['metric']);
+        $this->assertNotSame($version, (string)getBoardVersion());
+    }
+
     public function testTrackApiUsage(): void
     {
         trackApiUsage('test-endpoint');
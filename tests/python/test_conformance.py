@@ -0,0 +1,410 @@
+"""
+API conformance tests for the Python SDK and SMCP plugin.
+
+Every test runs against the in-process fake (orderboard_sdk.fake). The same
+tests also run against a real server when BASE_URL and ORDERBOARD_API_KEY are
+set (e.g. BASE_URL=http://localhost:8000 after `cd public && php -S
+localhost:8000`); otherwise the real-server cases are skipped.
+
+    python -m unittest discover tests/python
+    python -m pytest tests/python
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+import unittest
+import uuid
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from orderboard_sdk import OrderBoardClient  # noqa: E402
+from orderboard_sdk.client import OrderBoardError  # noqa: E402
+from orderboard_sdk.fake import FakeOrderBoard  # noqa: E402
+from orderboard_sdk.watcher import AgingWatcher  # noqa: E402
+
+PLUGIN_CLI = os.path.join(ROOT, 'smcp_plugin', 'orderboard', 'cli.py')
+
+
+class ConformanceTests:
+    """Behaviour shared by the fake and the real server; mixed into a TestCase."""
+
+    base_url = None  # type: str
+    api_key = None  # type: str
+
+    def setUp(self):
+        self.client = OrderBoardClient(api_key=self.api_key, base_url=self.base_url, timeout=5)
+        self.tag = uuid.uuid4().hex[:8]
+        self.created = []
+
+    def tearDown(self):
+        for order_id in self.created:
+            try:
+                self.client.delete_order(order_id=order_id)
+            except OrderBoardError:
+                pass
+
+    def make_order(self, name='Conformance Tester', platform='doordash', **kwargs):
+        order = self.client.create_order(customer_name=name, platform=platform, **kwargs)
+        self.created.append(order['order_id'])
+        return order
+
+    def raw(self, method, endpoint, body=None, key=True):
+        """Send a request without the SDK; returns (status, decoded JSON or None)."""
+        headers = {'Content-Type': 'application/json'}
+        if key:
+            headers['X-API-Key'] = self.api_key
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        request = Request(f"{self.base_url}/api/{endpoint}", data=data, headers=headers, method=method)
+        try:
+            with urlopen(request, timeout=5) as response:
+                status, text = response.status, response.read().decode('utf-8')
+        except HTTPError as e:
+            status, text = e.code, e.read().decode('utf-8')
+        return status, (json.loads(text) if text.strip() else None)
+
+    def assertApiError(self, code, message, call, *args, **kwargs):
+        with self.assertRaises(OrderBoardError) as ctx:
+            call(*args, **kwargs)
+        self.assertEqual(ctx.exception.status_code, code)
+        self.assertEqual(str(ctx.exception), message)
+        self.assertEqual(ctx.exception.response, {'success': False, 'error': message})
+
+    # -- create ---------------------------------------------------------------
+
+    def test_create_formats_display_name(self):
+        cases = {
+            'John Doe': 'JOHN D',
+            'Madonna': 'MADONNA',
+            'Mary Jane Watson': 'MARY W',
+            '  Bob   McDonald  ': 'BOB M'
+        }
+        for name, expected in cases.items():
+            self.assertEqual(self.make_order(name)['display_name'], expected)
+
+    def test_create_normalizes_platform_and_shelf(self):
+        order = self.make_order(f'Case {self.tag}', platform='DoorDash', status='ready', shelf_location='b')
+        self.assertEqual(order['platform'], 'doordash')
+        self.assertEqual(order['status'], 'ready')
+        self.assertEqual(order['shelf_location'], 'B')
+        self.assertRegex(order['created_at'], r'^\d{4}-\d\d-\d\d \d\d:\d\d:\d\d$')
+
+    def test_create_generates_and_accepts_order_ids(self):
+        self.assertRegex(self.make_order()['order_id'], r'^ORD-[0-9A-F]{8}$')
+        custom = f'CONF-{self.tag}'
+        self.assertEqual(self.make_order(order_id=custom)['order_id'], custom)
+        self.assertApiError(500, 'Internal server error', self.client.create_order, 'Dup Licate', 'doordash', order_id=custom)
+
+    def test_create_validation_errors(self):
+        self.assertApiError(400, 'Missing required field: customer_name', self.client.create_order, '', 'doordash')
+        self.assertApiError(400, 'Missing required field: platform', self.client.create_order, 'No Platform', '')
+        self.assertApiError(400, 'Valid platform is required (doordash, ubereats, grubhub)', self.client.create_order, 'Bad Platform', 'seamless')
+        self.assertApiError(400, 'Invalid shelf location (A-F)', self.client.create_order, 'Bad Shelf', 'doordash', status='ready', shelf_location='Z')
+
+    # -- auth and methods ----------------------------------------------------
+
+    def test_requires_api_key(self):
+        status, body = self.raw('GET', 'list-orders.php', key=False)
+        self.assertEqual((status, body), (401, {'success': False, 'error': 'Invalid or missing API key'}))
+        bad = OrderBoardClient(api_key='gkob_not_a_key', base_url=self.base_url, timeout=5)
+        self.assertApiError(401, 'Invalid or missing API key', bad.get_stats)
+
+    def test_method_not_allowed(self):
+        for method, endpoint in (('GET', 'create-order.php'), ('GET', 'delete-order.php'), ('POST', 'list-orders.php'), ('POST', 'display.php')):
+            self.assertEqual(self.raw(method, endpoint), (405, {'success': False, 'error': 'Method not allowed'}))
+
+    def test_options_preflight(self):
+        request = Request(f"{self.base_url}/api/update-order.php", method='OPTIONS')
+        with urlopen(request, timeout=5) as response:
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.headers['Access-Control-Allow-Origin'], '*')
+            self.assertEqual(response.headers['Access-Control-Allow-Methods'], 'POST, PUT, OPTIONS')
+
+    # -- update --------------------------------------------------------------
+
+    def test_mark_ready_sets_shelf_and_ready_at(self):
+        order = self.make_order(f'Ready {self.tag}')
+        updated = self.client.mark_ready(order['order_id'], 'c')
+        self.assertEqual(updated['status'], 'ready')
+        self.assertEqual(updated['shelf_location'], 'C')
+        fetched = self.client.get_order(order_id=order['order_id'])
+        self.assertIsNotNone(fetched['ready_at'])
+
+    def test_update_by_id_changes_name(self):
+        order = self.make_order(f'Before {self.tag}')
+        updated = self.client.update_order(id=order['id'], customer_name='After Change')
+        self.assertEqual(updated['display_name'], 'AFTER C')
+        self.assertEqual(updated['order_id'], order['order_id'])
+
+    def test_update_validation_errors(self):
+        order = self.make_order()
+        self.assertApiError(400, 'Invalid status (preparing or ready)', self.client.update_order, order_id=order['order_id'], status='done')
+        self.assertApiError(400, 'Invalid shelf location (A-F)', self.client.update_order, order_id=order['order_id'], shelf_location='Q')
+        self.assertApiError(404, 'Order not found', self.client.update_order, order_id=f'MISSING-{self.tag}', status='ready')
+        self.assertEqual(self.raw('POST', 'update-order.php', {'status': 'ready'}), (400, {'success': False, 'error': 'Missing required field: id or order_id'}))
+
+    # -- list / get ----------------------------------------------------------
+
+    def test_list_orders_ready_first_then_newest(self):
+        first = self.make_order(f'First {self.tag}')
+        self.make_order(f'Second {self.tag}')
+        self.client.mark_ready(first['order_id'], 'A')
+
+        orders = self.client.list_orders(limit=100)
+        statuses = [o['status'] for o in orders]
+        self.assertEqual(statuses, sorted(statuses, key=lambda s: s != 'ready'))
+        for status in ('ready', 'preparing'):
+            stamps = [o['created_at'] for o in orders if o['status'] == status]
+            self.assertEqual(stamps, sorted(stamps, reverse=True))
+
+    def test_list_orders_filters_and_limit(self):
+        self.make_order(f'Grub {self.tag}', platform='grubhub')
+        self.make_order(f'Uber {self.tag}', platform='ubereats', status='ready', shelf_location='D')
+        self.assertTrue(all(o['platform'] == 'grubhub' for o in self.client.list_orders(platform='grubhub')))
+        self.assertTrue(all(o['status'] == 'ready' for o in self.client.list_orders(status='ready')))
+        self.assertEqual(len(self.client.list_orders(limit=1)), 1)
+        keys = set(self.client.list_orders(limit=1)[0])
+        self.assertEqual(keys, {'id', 'order_id', 'customer_name', 'display_name', 'platform', 'status',
+                                'shelf_location', 'notes', 'created_at', 'updated_at', 'ready_at'})
+
+    def test_get_order_by_id_and_order_id(self):
+        order = self.make_order(f'Lookup {self.tag}', notes='Extra napkins')
+        by_id = self.client.get_order(id=order['id'])
+        by_order_id = self.client.get_order(order_id=order['order_id'])
+        self.assertEqual(by_id, by_order_id)
+        self.assertEqual(by_id['notes'], 'Extra napkins')
+        self.assertApiError(404, 'Order not found', self.client.get_order, order_id=f'MISSING-{self.tag}')
+        self.assertEqual(self.raw('GET', 'get-order.php'), (400, {'success': False, 'error': 'Missing required parameter: id or order_id'}))
+
+    # -- delete --------------------------------------------------------------
+
+    def test_delete_archives_order(self):
+        order = self.make_order(f'Pickup {self.tag}')
+        removed = self.client.delete_order(order_id=order['order_id'])
+        self.assertEqual(removed, {'id': order['id'], 'order_id': order['order_id'], 'customer_name': order['customer_name']})
+        self.assertApiError(404, 'Order not found', self.client.get_order, order_id=order['order_id'])
+        self.assertApiError(404, 'Order not found', self.client.delete_order, order_id=order['order_id'])
+
+    # -- search --------------------------------------------------------------
+
+    def test_search_by_name_display_name_and_order_id(self):
+        order = self.make_order(f'Searchy Z{self.tag}')
+        for query in (f'searchy z{self.tag}', 'SEARCHY Z', f'z{self.tag[:4]}', order['order_id'][4:8].lower()):
+            ids = [o['order_id'] for o in self.client.search(query, limit=50)]
+            self.assertIn(order['order_id'], ids, query)
+
+    def test_search_includes_archived_after_active(self):
+        kept = self.make_order(f'Keeper Q{self.tag}')
+        gone = self.make_order(f'Leaver Q{self.tag}')
+        self.client.delete_order(order_id=gone['order_id'])
+
+        results = self.client.search(f'q{self.tag}')
+        self.assertEqual([o['order_id'] for o in results], [kept['order_id'], gone['order_id']])
+        self.assertFalse(results[0]['archived'])
+        self.assertTrue(results[1]['archived'])
+        self.assertEqual(results[1]['status'], 'picked_up')
+        self.assertIsNotNone(results[1]['picked_up_at'])
+
+        active_only = self.client.search(f'q{self.tag}', include_archived=False)
+        self.assertEqual([o['order_id'] for o in active_only], [kept['order_id']])
+
+    def test_search_validation_errors(self):
+        self.assertEqual(self.raw('GET', 'search-orders.php?q=%20'), (400, {'success': False, 'error': 'Missing required parameter: q'}))
+        self.assertApiError(400, 'Search query is required', self.client.search, ' - ')
+
+    # -- display / stats ------------------------------------------------------
+
+    def test_display_feed_is_public(self):
+        self.make_order(f'Display {self.tag}')
+        status, body = self.raw('GET', 'display.php', key=False)
+        self.assertEqual(status, 200)
+        self.assertTrue(body['success'])
+        self.assertIsInstance(body['refresh_interval'], int)
+        self.assertEqual(body['count'], len(body['orders']))
+        self.assertLessEqual(body['count'], 12)
+        self.assertEqual(set(body['orders'][0]), {'id', 'order_id', 'name', 'platform', 'status', 'shelf', 'created_at', 'eta_at'})
+
+    def test_stats_shape(self):
+        self.make_order(f'Stats {self.tag}', platform='ubereats')
+        stats = self.client.get_stats()
+        self.assertEqual(set(stats), {'active_orders', 'preparing', 'ready', 'by_platform', 'today_completed', 'avg_wait_time'})
+        self.assertEqual(stats['active_orders'], stats['preparing'] + stats['ready'])
+        self.assertEqual(sum(stats['by_platform'].values()), stats['active_orders'])
+
+    def test_eta_shape(self):
+        order = self.make_order(f'Eta {self.tag}', platform='grubhub')
+        eta = self.client.get_eta(order_id=order['order_id'])
+        self.assertIsNone(eta['hour'])
+        self.assertEqual(set(eta['wait_times']), {'prep', 'dwell'})
+        for platforms in eta['wait_times'].values():
+            self.assertEqual(set(platforms), {'doordash', 'ubereats', 'grubhub'})
+            for summary in platforms.values():
+                self.assertEqual(set(summary), {'samples', 'p50', 'p75', 'p90'})
+        [row] = eta['orders']
+        self.assertEqual(row['order_id'], order['order_id'])
+        self.assertEqual(row['metric'], 'prep')
+        self.assertIn(row['basis'], ('hour', 'platform', 'all', 'none'))
+        self.assertEqual(row['eta_seconds'] is None, row['basis'] == 'none')
+
+    def test_eta_validation_errors(self):
+        self.assertApiError(400, 'Invalid hour. Must be 0-23', self.client.get_eta, hour=24)
+        self.assertApiError(404, 'Order not found', self.client.get_eta, order_id=f'ORD-MISSING-{self.tag}')
+        self.assertEqual(self.client.get_eta(hour=7)['hour'], 7)
+
+    # -- SMCP plugin ---------------------------------------------------------
+
+    def plugin(self, *args):
+        command = [sys.executable, PLUGIN_CLI, args[0], '--api-key', self.api_key, '--base-url', self.base_url] + list(args[1:])
+        result = subprocess.run(command, capture_output=True, text=True, timeout=30)
+        return json.loads(result.stdout)
+
+    def test_plugin_round_trip(self):
+        created = self.plugin('create-order', '--customer-name', f'Plugin P{self.tag}', '--platform', 'grubhub')
+        self.assertTrue(created['success'])
+        self.created.append(created['order']['order_id'])
+        self.assertEqual(created['order']['display_name'], 'PLUGIN P')
+
+        found = self.plugin('search-orders', '--query', f'p{self.tag}')
+        self.assertEqual([o['order_id'] for o in found['orders']], [created['order']['order_id']])
+
+
+class FakeServerConformanceTest(ConformanceTests, unittest.TestCase):
+    """Conformance cases against orderboard_sdk.fake, one server for the class."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.board = FakeOrderBoard().start()
+        cls.base_url = cls.board.base_url
+        cls.api_key = cls.board.api_key
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.board.stop()
+
+
+class RealServerConformanceTest(ConformanceTests, unittest.TestCase):
+    """Conformance cases against BASE_URL; skipped unless ORDERBOARD_API_KEY is set and the server answers."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.base_url = (os.environ.get('BASE_URL') or '').rstrip('/')
+        cls.api_key = os.environ.get('ORDERBOARD_API_KEY')
+        if not cls.base_url or not cls.api_key:
+            raise unittest.SkipTest('Set BASE_URL and ORDERBOARD_API_KEY to run against a real server')
+        try:
+            urlopen(f"{cls.base_url}/api/display.php", timeout=2).close()
+        except (URLError, OSError):
+            raise unittest.SkipTest(f'Server not reachable at {cls.base_url} - start with: cd public && php -S localhost:8000')
+
+
+class FakeServerBehaviourTest(unittest.TestCase):
+    """Fake-only hooks that the real server has no equivalent for."""
+
+    def test_controlled_clock_drives_wait_time(self):
+        now = [1767225600.0]  # 2026-01-01 00:00:00 UTC
+        with FakeOrderBoard(clock=lambda: now[0]) as board:
+            client = board.client()
+            order = client.create_order('Clock Work', 'doordash')
+            self.assertEqual(order['created_at'], '2026-01-01 00:00:00')
+            now[0] += 60
+            client.mark_ready(order['order_id'], 'A')
+            now[0] += 90
+            client.delete_order(order_id=order['order_id'])
+            stats = client.get_stats()
+            self.assertEqual(stats['avg_wait_time'], 90)
+            self.assertEqual(stats['by_platform'], [])
+
+    def test_eta_learns_prep_times(self):
+        now = [1767225600.0]
+        with FakeOrderBoard(clock=lambda: now[0]) as board:
+            client = board.client()
+            cooked = [client.create_order(f'Cook {i}', 'ubereats')['order_id'] for i in range(10)]
+            now[0] += 300
+            for order_id in cooked:
+                client.mark_ready(order_id, 'B')
+            now[0] += 120
+            for order_id in cooked:
+                client.delete_order(order_id=order_id)
+
+            order = client.create_order('Waiting Person', 'ubereats')
+            now[0] += 60
+            [row] = client.get_eta(order_id=order['order_id'])['orders']
+            self.assertEqual((row['metric'], row['basis'], row['elapsed_seconds']), ('prep', 'hour', 60))
+            self.assertAlmostEqual(row['eta_seconds'], 240, delta=24)
+            self.assertEqual(client.get_display_orders()[0]['eta_at'], row['eta_at'])
+
+            # The display feed's eta_at holds still while the wait stays in one bucket
+            now[0] += 1
+            self.assertEqual(client.get_display_orders()[0]['eta_at'], row['eta_at'])
+
+            # Overdue orders are due now rather than negative
+            now[0] += 600
+            [overdue] = client.get_eta(order_id=order['order_id'])['orders']
+            self.assertEqual(overdue['eta_seconds'], 0)
+            now[0] += 5
+            self.assertEqual(client.get_eta(order_id=order['order_id'])['orders'][0]['eta_at'], overdue['eta_at'])
+
+            wait_times = client.get_eta()['wait_times']
+            self.assertEqual(wait_times['prep']['ubereats']['samples'], 10)
+            self.assertAlmostEqual(wait_times['dwell']['ubereats']['p50'], 120, delta=12)
+            self.assertEqual(wait_times['prep']['doordash'], {'samples': 0, 'p50': None, 'p75': None, 'p90': None})
+
+    def test_reset_and_usage_tracking(self):
+        board = FakeOrderBoard()
+        status, _, _ = board.handle('POST', '/api/create-order.php', {'X-API-Key': board.api_key}, b'{}')
+        self.assertEqual(status, 400)
+        self.assertEqual(list(board.api_usage.values()), [[2, 1]])
+        board.reset()
+        self.assertEqual(board.api_usage, {})
+
+    def test_rate_limit(self):
+        board = FakeOrderBoard(rate_limit=2)
+        headers = {'X-API-Key': board.api_key}
+        codes = [board.handle('GET', '/api/stats.php', headers)[0] for _ in range(3)]
+        self.assertEqual(codes, [200, 200, 429])
+
+    def test_stuck_orders_plugin_matches_aging_watcher(self):
+        # The plugin judges ages against the real clock, so the fake backdates orders instead
+        ago = [0.0]
+        with FakeOrderBoard(clock=lambda: time.time() - ago[0]) as board:
+            client = board.client()
+
+            def order(name, platform, created_min, ready_min=None):
+                ago[0] = created_min * 60
+                created = client.create_order(name, platform)
+                if ready_min is not None:
+                    ago[0] = ready_min * 60
+                    client.mark_ready(created['order_id'], 'A')
+                return created['order_id']
+
+            expected = {
+                order('Slow Cook', 'doordash', 25),
+                order('Late Dasher', 'doordash', 30, ready_min=7),   # doordash:ready override
+                order('Late Uber', 'ubereats', 30, ready_min=13),
+                order('Slow Grub', 'grubhub', 23),
+            }
+            order('On Time', 'doordash', 15)
+            order('Just Ready', 'ubereats', 7)
+            order('Uber Shelf', 'ubereats', 30, ready_min=7)       # plain ready threshold
+            order('Quick Ready', 'grubhub', 40, ready_min=2)       # prep deadline cancelled
+
+            watcher = AgingWatcher(client, thresholds={'preparing': 20 * 60, 'ready': 10 * 60, 'doordash:ready': 5 * 60})
+            watcher.refresh()
+            flagged = {alert.order['order_id'] for alert in watcher.tick(time.time())}
+
+            command = [sys.executable, PLUGIN_CLI, 'stuck-orders', '--api-key', board.api_key,
+                       '--base-url', board.base_url, '--thresholds', '{"doordash:ready": 5}']
+            result = json.loads(subprocess.run(command, capture_output=True, text=True, timeout=30).stdout)
+
+        self.assertTrue(result['success'])
+        self.assertEqual(flagged, expected)
+        self.assertEqual({o['order_id'] for o in result['orders']}, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
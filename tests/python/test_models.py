@@ -0,0 +1,161 @@
+"""
+Tests for orderboard_sdk.models and typed=True client results.
+
+    python -m pytest tests/python/test_models.py
+"""
+
+import math
+import os
+import sys
+import unittest
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from orderboard_sdk.fake import FakeOrderBoard  # noqa: E402
+from orderboard_sdk.models import Order, OrderFrame, parse_timestamp, _UNSET  # noqa: E402
+
+ROWS = [
+    {'id': 1, 'order_id': 'ORD-00000001', 'customer_name': 'Ann Lee', 'platform': 'doordash',
+     'status': 'preparing', 'shelf_location': None, 'created_at': '2026-01-01 12:00:00'},
+    {'id': 2, 'order_id': 'ORD-00000002', 'customer_name': 'Bob Ray', 'platform': 'ubereats',
+     'status': 'ready', 'shelf_location': 'A', 'created_at': '2026-01-01 12:05:00'},
+    {'id': 3, 'order_id': 'ORD-00000003', 'customer_name': 'Cy Day', 'platform': 'doordash',
+     'status': 'ready', 'shelf_location': 'B', 'created_at': None},
+    {'id': 4, 'order_id': 'ORD-00000004', 'customer_name': 'Di Fox', 'platform': 'grubhub',
+     'status': 'preparing', 'shelf_location': None, 'created_at': '2026-01-01 12:15:00'},
+]
+
+
+def epoch(stamp):
+    return datetime.strptime(stamp, '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc).timestamp()
+
+
+class OrderTest(unittest.TestCase):
+
+    def test_display_row_aliases(self):
+        order = Order.from_dict({'id': 7, 'name': 'JOHN D', 'shelf': 'C', 'platform': 'doordash',
+                                 'status': 'ready', 'eta_at': None, 'unknown': 1})
+        self.assertEqual((order.display_name, order.shelf_location), ('JOHN D', 'C'))
+        self.assertTrue(order.is_ready)
+        self.assertIsNone(order.eta_at)
+        self.assertNotIn('unknown', order.to_dict())
+
+        frame = OrderFrame([{'id': 7, 'name': 'JOHN D', 'shelf': 'C', 'status': 'ready'}])
+        self.assertEqual(frame.columns, ['id', 'display_name', 'status', 'shelf_location'])
+        self.assertEqual(frame[0].display_name, 'JOHN D')
+        self.assertEqual(frame.to_dicts(), [{'id': 7, 'display_name': 'JOHN D', 'status': 'ready', 'shelf_location': 'C'}])
+
+    def test_timestamps_are_parsed_lazily(self):
+        order = Order(created_at='2026-01-01 12:00:00', ready_at=None)
+        self.assertIs(order._created_at, _UNSET)
+        created = order.created_at
+        self.assertEqual(created, datetime(2026, 1, 1, 12, tzinfo=timezone.utc))
+        self.assertIs(order.created_at, created)
+        self.assertIsNone(order.ready_at)
+        self.assertIs(order._updated_at, _UNSET)
+        self.assertEqual(Order(eta_at='2026-01-01 12:04:00').eta_at, datetime(2026, 1, 1, 12, 4, tzinfo=timezone.utc))
+        self.assertEqual(order.to_dict()['created_at'], '2026-01-01 12:00:00')
+        self.assertEqual(parse_timestamp('2026-01-01T12:00:00+02:00').utcoffset().total_seconds(), 7200)
+
+    def test_interned_categories(self):
+        a = Order(platform=''.join(['door', 'dash']))
+        b = Order(platform=''.join(['door', 'dash']))
+        self.assertIs(a.platform, b.platform)
+
+
+class OrderFrameTest(unittest.TestCase):
+
+    def setUp(self):
+        self.frame = OrderFrame(ROWS)
+
+    def test_filter(self):
+        self.assertEqual(self.frame.filter(status='ready').column('id'), [2, 3])
+        self.assertEqual(self.frame.filter(status='ready', platform='doordash').column('id'), [3])
+        self.assertEqual(self.frame.filter(platform=['ubereats', 'grubhub']).column('id'), [2, 4])
+        self.assertEqual(self.frame.where(self.frame.mask('shelf_location', None)).column('id'), [1, 4])
+        self.assertEqual(len(self.frame.filter(platform='unknown')), 0)
+        self.assertEqual(self.frame.filter(predicate=lambda o: o.customer_name.startswith('B')).column('id'), [2])
+
+    def test_count_by_and_group_by(self):
+        self.assertEqual(self.frame.count_by('platform'), {'doordash': 2, 'ubereats': 1, 'grubhub': 1})
+        self.assertEqual(self.frame.filter(status='ready').count_by('status'), {'ready': 2})
+        groups = self.frame.group_by('status')
+        self.assertEqual(list(groups), ['preparing', 'ready'])
+        self.assertEqual(groups['preparing'].column('order_id'), ['ORD-00000001', 'ORD-00000004'])
+        self.assertEqual([o.id for o in groups['ready']], [2, 3])
+
+    def test_where_keeps_cached_epochs_aligned(self):
+        epochs = self.frame.epochs('created_at')
+        self.assertIs(self.frame.epochs('created_at'), epochs)
+        self.assertTrue(math.isnan(epochs[2]))
+
+        ready = self.frame.where([False, True, True, False])
+        self.assertEqual(list(ready.epochs('created_at'))[:1], [epoch('2026-01-01 12:05:00')])
+        self.assertTrue(math.isnan(ready.epochs('created_at')[1]))
+
+        for field, frame in self.frame.group_by('platform').items():
+            expected = [epoch(o['created_at']) if o['created_at'] else None
+                        for o in ROWS if o['platform'] == field]
+            got = [None if math.isnan(v) else v for v in frame.epochs('created_at')]
+            self.assertEqual(got, expected)
+
+        # Appending invalidates the cache so the column grows with the frame
+        self.frame.append({'id': 5, 'created_at': '2026-01-01 13:00:00'})
+        self.assertEqual(self.frame.epochs('created_at')[-1], epoch('2026-01-01 13:00:00'))
+        with self.assertRaises(KeyError):
+            self.frame.epochs('platform')
+
+    def test_indexing_round_trips(self):
+        self.assertEqual(self.frame[-1], Order.from_dict(ROWS[-1]))
+        self.assertEqual(OrderFrame(self.frame.to_dicts()).to_dicts(), self.frame.to_dicts())
+
+
+class TypedClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.board = FakeOrderBoard().start()
+        self.addCleanup(self.board.stop)
+        self.client = self.board.client(typed=True)
+
+    def test_typed_results(self):
+        created = self.client.create_order('John Doe', 'doordash')
+        self.assertIsInstance(created, Order)
+        self.assertEqual(created.display_name, 'JOHN D')
+        self.assertIsInstance(created.created_at, datetime)
+
+        ready = self.client.mark_ready(created.order_id, 'A')
+        self.assertEqual((ready.status, ready.shelf_location), ('ready', 'A'))
+        plain = self.board.client().get_order(id=created.id)
+        self.assertEqual(self.client.get_order(id=created.id), Order.from_dict(plain))
+
+        self.client.create_order('Jane Smith', 'ubereats')
+        orders = self.client.list_orders()
+        self.assertIsInstance(orders, OrderFrame)
+        self.assertEqual(orders.count_by('status'), {'ready': 1, 'preparing': 1})
+
+        display = self.client.get_display_orders()
+        self.assertIsInstance(display, OrderFrame)
+        self.assertEqual(sorted(display.column('display_name')), ['JANE S', 'JOHN D'])
+        self.assertEqual(display.filter(status='ready')[0].shelf_location, 'A')
+        self.assertIn('eta_at', display.columns)
+
+        results = self.client.search('john')
+        self.assertIsInstance(results, OrderFrame)
+        self.assertEqual(results.column('order_id'), [created.order_id])
+        self.assertEqual(results.column('archived'), [False])
+
+        # Typed results carry every field of the plain-dict default
+        plain = self.board.client()
+        for typed_rows, plain_rows in ((display, plain.get_display_orders()), (results, plain.search('john'))):
+            aliased = [{{'name': 'display_name', 'shelf': 'shelf_location'}.get(k, k): v for k, v in row.items()}
+                       for row in plain_rows]
+            self.assertEqual(typed_rows.to_dicts(), aliased)
+
+        self.client.delete_order(order_id=created.order_id)
+        self.assertTrue(self.client.search('john')[0].archived)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+Tests for orderboard_sdk.relay against the in-process fake.
+
+    python -m pytest tests/python/test_relay.py
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from orderboard_sdk.fake import FakeOrderBoard  # noqa: E402
+from orderboard_sdk.relay import DisplayRelay  # noqa: E402
+
+
+class RelayTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1767268800.0
+        self.board = FakeOrderBoard(clock=lambda: self.now).start()
+        self.addCleanup(self.board.stop)
+        self.client = self.board.client(timeout=5)
+        self.client.create_order('John Doe', 'doordash')
+
+    def serve(self, relay):
+        server = relay.make_server('127.0.0.1', 0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        def stop():
+            server.shutdown()
+            server.server_close()
+        self.addCleanup(stop)
+        host, port = server.server_address[:2]
+        return f'http://{host}:{port}/api/display.php'
+
+    def get(self, url, headers=None):
+        try:
+            with urlopen(Request(url, headers=headers or {}), timeout=5) as response:
+                return response.status, response.headers, response.read()
+        except HTTPError as e:
+            return e.code, e.headers, e.read()
+
+    def test_concurrent_requests_share_one_fetch(self):
+        relay = DisplayRelay(self.client, interval=60, prefetch=False)
+        fetch = self.client.get_display_orders
+
+        def slow_fetch():
+            time.sleep(0.2)
+            return fetch()
+        self.client.get_display_orders = slow_fetch
+
+        start = threading.Barrier(20)
+        results = []
+
+        def request():
+            start.wait()
+            results.append(relay.get_payload())
+        threads = [threading.Thread(target=request) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(relay.upstream_fetches, 1)
+        self.assertEqual(len({body for body, _ in results}), 1)
+        self.assertTrue(all(etag for _, etag in results))
+
+    def test_stale_caller_does_not_refetch_after_fetch_finished(self):
+        relay = DisplayRelay(self.client, interval=60, prefetch=False)
+        relay._start_fetch().wait(5)
+        # A request that saw the old payload as stale arrives after the fetch cleared _inflight
+        self.assertTrue(relay._start_fetch().is_set())
+        self.assertEqual(relay.upstream_fetches, 1)
+
+    def test_etag_is_stable_and_if_none_match_gets_304(self):
+        relay = DisplayRelay(self.client, interval=0.05, prefetch=False)
+        url = self.serve(relay)
+
+        status, headers, body = self.get(url)
+        self.assertEqual(status, 200)
+        etag = headers['ETag']
+        self.assertFalse(json.loads(body)['stale'])
+        self.assertEqual(json.loads(body)['orders'][0]['name'], 'JOHN D')
+
+        # Refetched after the interval, but the board is unchanged so the ETag is too
+        time.sleep(0.1)
+        status, headers, _ = self.get(url)
+        self.assertEqual((status, headers['ETag']), (200, etag))
+        self.assertGreaterEqual(relay.upstream_fetches, 2)
+
+        status, headers, body = self.get(url, {'If-None-Match': etag})
+        self.assertEqual((status, body), (304, b''))
+
+        self.client.create_order('Jane Smith', 'ubereats')
+        time.sleep(0.1)
+        status, headers, _ = self.get(url, {'If-None-Match': etag})
+        self.assertEqual(status, 200)
+        self.assertNotEqual(headers['ETag'], etag)
+
+    def test_etag_is_stable_while_orders_have_etas(self):
+        cooked = [self.client.create_order(f'Cook {i}', 'doordash')['order_id'] for i in range(10)]
+        self.now += 300
+        for order_id in cooked:
+            self.client.mark_ready(order_id, 'C')
+            self.client.delete_order(order_id=order_id)
+        self.client.create_order('Waiting Guest', 'doordash')
+
+        relay = DisplayRelay(self.client, interval=0.05, prefetch=False)
+        url = self.serve(relay)
+        etags = set()
+        for _ in range(4):
+            self.now += 5
+            status, headers, body = self.get(url)
+            self.assertEqual(status, 200)
+            self.assertTrue(all(order['eta_at'] for order in json.loads(body)['orders'] if order['status'] == 'preparing'))
+            etags.add(headers['ETag'])
+            time.sleep(0.1)
+        self.assertGreaterEqual(relay.upstream_fetches, 4)
+        self.assertEqual(len(etags), 1)
+
+    def test_stale_body_without_etag_when_upstream_is_down(self):
+        relay = DisplayRelay(self.client, interval=0.05, max_wait=0.5, prefetch=False)
+        url = self.serve(relay)
+        self.assertEqual(self.get(url)[0], 200)
+
+        self.board.stop()
+        time.sleep(0.1)
+        status, headers, body = self.get(url)
+        self.assertEqual(status, 200)
+        self.assertIsNone(headers['ETag'])
+        self.assertTrue(json.loads(body)['stale'])
+        self.assertEqual(len(json.loads(body)['orders']), 1)
+        self.assertIn('Connection error', relay.last_error)
+
+    def test_502_before_first_successful_fetch(self):
+        self.board.stop()
+        relay = DisplayRelay(self.client, interval=5, prefetch=False)
+        status, _, body = self.get(self.serve(relay))
+        self.assertEqual(status, 502)
+        self.assertFalse(json.loads(body)['success'])
+        self.assertIn('Connection error', json.loads(body)['error'])
+        self.assertEqual(relay.upstream_fetches, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+"""
+Tests for orderboard_sdk.retention on a scratch SQLite file.
+
+    python -m pytest tests/python/test_retention.py
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from orderboard_sdk.retention import HISTORY_SCHEMA, USAGE_SCHEMA, Retention  # noqa: E402
+
+# The history half of initializeSearchIndex() (display_name left out)
+SEARCH_SCHEMA = [
+    "CREATE VIRTUAL TABLE order_search USING fts5(order_id, customer_name, source UNINDEXED, prefix = '1 2 3')",
+    """
+    CREATE TRIGGER history_search_insert AFTER INSERT ON stats_order_history BEGIN
+        INSERT INTO order_search (rowid, order_id, customer_name, source) VALUES (-NEW.id, NEW.order_id, NEW.customer_name, 'archived');
+    END
+    """,
+    """
+    CREATE TRIGGER history_search_delete AFTER DELETE ON stats_order_history BEGIN
+        DELETE FROM order_search WHERE rowid = -OLD.id;
+    END
+    """
+]
+
+
+def has_fts5():
+    try:
+        sqlite3.connect(':memory:').execute("CREATE VIRTUAL TABLE t USING fts5(x)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+# (order_id, platform, days ago, wait_time_seconds)
+HISTORY = [
+    ('ORD-OLD00001', 'doordash', 60, 100),
+    ('ORD-OLD00002', 'doordash', 60, None),
+    ('ORD-OLD00003', 'ubereats', 59, 40),
+    ('ORD-OLD00004', 'doordash', 40, 300),
+    ('ORD-NEW00001', 'doordash', 1, 50),
+]
+
+
+class RetentionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.dir, 'orderboard.db')
+        db = sqlite3.connect(self.db_path)
+        db.execute(HISTORY_SCHEMA.format(prefix=''))
+        db.execute(USAGE_SCHEMA.format(prefix=''))
+        db.execute("CREATE TABLE api_rate_limits (rate_key TEXT PRIMARY KEY, window_start INTEGER NOT NULL, count INTEGER NOT NULL)")
+        if has_fts5():
+            for sql in SEARCH_SCHEMA:
+                db.execute(sql)
+        for order_id, platform, days, wait in HISTORY:
+            db.execute(
+                "INSERT INTO stats_order_history (order_id, customer_name, platform, created_at, wait_time_seconds, archived_at) "
+                "VALUES (?, 'Guest', ?, DATETIME('now', ?), ?, DATETIME('now', ?))",
+                (order_id, platform, f'-{days} days', wait, f'-{days} days')
+            )
+        db.execute("INSERT INTO stats_api_usage (endpoint, requests, errors, date) VALUES ('stats', 9, 2, DATE('now', '-100 days'))")
+        db.execute("INSERT INTO stats_api_usage (endpoint, requests, errors, date) VALUES ('stats', 4, 0, DATE('now'))")
+        db.execute("INSERT INTO api_rate_limits VALUES ('old', CAST(strftime('%s', 'now') AS INTEGER) - 3600, 5)")
+        db.execute("INSERT INTO api_rate_limits VALUES ('new', CAST(strftime('%s', 'now') AS INTEGER), 1)")
+        db.commit()
+        self.original = db.execute("SELECT * FROM stats_order_history ORDER BY archived_at, id").fetchall()
+        db.close()
+        self.retention = Retention(self.db_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def query(self, path, sql):
+        db = sqlite3.connect(path)
+        try:
+            return db.execute(sql).fetchall()
+        finally:
+            db.close()
+
+    def test_compact_moves_old_rows_into_monthly_archives(self):
+        dry = self.retention.compact(dry_run=True)
+        self.assertEqual((dry['history']['archived'], dry['api_usage']['archived'], dry['rate_limits']['pruned']), (4, 1, 1))
+        self.assertEqual(self.retention.archives(), [])
+
+        report = self.retention.compact()
+        self.assertEqual(report['history']['archived'], 4)
+        self.assertEqual(report['api_usage']['archived'], 1)
+        self.assertEqual(report['rate_limits']['pruned'], 1)
+
+        self.assertEqual(self.query(self.db_path, "SELECT order_id FROM stats_order_history"), [('ORD-NEW00001',)])
+        self.assertEqual(self.query(self.db_path, "SELECT requests FROM stats_api_usage"), [(4,)])
+        self.assertEqual(self.query(self.db_path, "SELECT rate_key FROM api_rate_limits"), [('new',)])
+
+        months = self.retention.archives()
+        self.assertEqual(sorted(set(report['history']['months']) | set(report['api_usage']['months'])), months)
+        archived = []
+        for month in months:
+            path = self.retention.archive_path(month)
+            rows = self.query(path, "SELECT order_id, strftime('%Y-%m', archived_at) FROM stats_order_history")
+            self.assertTrue(all(row_month == month for _, row_month in rows))
+            archived += [order_id for order_id, _ in rows]
+            archived_usage = self.query(path, "SELECT requests, errors FROM stats_api_usage")
+            if archived_usage:
+                self.assertEqual(archived_usage, [(9, 2)])
+        self.assertEqual(sorted(archived), ['ORD-OLD00001', 'ORD-OLD00002', 'ORD-OLD00003', 'ORD-OLD00004'])
+
+    def test_daily_totals(self):
+        self.retention.compact()
+        daily = self.query(
+            self.db_path,
+            "SELECT platform, orders, waited_orders, total_wait_seconds, max_wait_seconds "
+            "FROM stats_order_daily ORDER BY date, platform"
+        )
+        self.assertEqual(daily, [
+            ('doordash', 2, 1, 100, 100),
+            ('ubereats', 1, 1, 40, 40),
+            ('doordash', 1, 1, 300, 300),
+        ])
+
+    def test_second_run_is_idempotent(self):
+        self.retention.compact()
+        daily = self.query(self.db_path, "SELECT * FROM stats_order_daily ORDER BY date, platform")
+        archives = {month: self.query(self.retention.archive_path(month), "SELECT * FROM stats_order_history")
+                    for month in self.retention.archives()}
+
+        report = self.retention.compact()
+        self.assertEqual((report['history']['archived'], report['api_usage']['archived']), (0, 0))
+        self.assertEqual(report['rate_limits']['pruned'], 0)
+        self.assertEqual(self.query(self.db_path, "SELECT * FROM stats_order_daily ORDER BY date, platform"), daily)
+        self.assertEqual({month: self.query(self.retention.archive_path(month), "SELECT * FROM stats_order_history")
+                          for month in self.retention.archives()}, archives)
+
+    def test_history_merges_archives_with_main_file(self):
+        self.retention.compact()
+        rows = list(self.retention.history())
+        self.assertEqual([tuple(row.values()) for row in rows], self.original)
+
+        # Bounds apply to archived and live rows alike
+        start = self.original[3][8][:10]
+        self.assertEqual([row['order_id'] for row in self.retention.history(start=start)], ['ORD-OLD00004', 'ORD-NEW00001'])
+        self.assertEqual([row['order_id'] for row in self.retention.history(end=start)],
+                         ['ORD-OLD00001', 'ORD-OLD00002', 'ORD-OLD00003'])
+
+    @unittest.skipUnless(has_fts5(), 'SQLite without FTS5')
+    def test_archived_orders_stay_searchable(self):
+        search = "SELECT rowid FROM order_search WHERE order_search MATCH 'guest*' ORDER BY rowid"
+        before = self.query(self.db_path, search)
+        self.assertEqual(len(before), 5)
+        self.retention.compact()
+        self.assertEqual(self.query(self.db_path, search), before)
+        names = [row[0] for row in self.query(self.db_path, "SELECT name FROM sqlite_master WHERE type = 'trigger'")]
+        self.assertIn('history_search_delete', names)
+
+        # Deleting history outside retention still drops the search row
+        db = sqlite3.connect(self.db_path)
+        db.execute("DELETE FROM stats_order_history")
+        db.commit()
+        db.close()
+        self.assertEqual(len(self.query(self.db_path, search)), 4)
+
+    def test_report_does_not_write(self):
+        with open(self.db_path, 'rb') as f:
+            before = f.read()
+        report = self.retention.report()
+        self.assertEqual(report['rows']['stats_order_history'], 5)
+        self.assertEqual(report['rows']['stats_order_daily'], 0)
+        with open(self.db_path, 'rb') as f:
+            self.assertEqual(f.read(), before)
+        self.assertFalse(os.path.exists(self.db_path + '-wal'))
+        self.assertNotIn(('stats_order_daily',), self.query(self.db_path, "SELECT name FROM sqlite_master"))
+
+    def test_history_days_below_chart_window_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, 'at least 7'):
+            Retention(self.db_path, history_days=6)
+        Retention(self.db_path, history_days=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
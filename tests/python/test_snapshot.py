@@ -0,0 +1,220 @@
+"""
+Tests for orderboard_sdk.snapshot: export/import round trips on a scratch
+SQLite file, and replay against the in-process fake.
+
+    python -m pytest tests/python/test_snapshot.py
+"""
+
+import gzip
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from orderboard_sdk.fake import FakeOrderBoard  # noqa: E402
+from orderboard_sdk.retention import HISTORY_SCHEMA, USAGE_SCHEMA  # noqa: E402
+from orderboard_sdk.snapshot import Snapshot, Replayer, read_snapshot  # noqa: E402
+
+# The subset of initializeDatabase() the snapshot tables and their triggers need
+SCHEMA = [
+    """
+    CREATE TABLE orders (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        order_id TEXT UNIQUE NOT NULL,
+        customer_name TEXT NOT NULL,
+        platform TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'preparing',
+        shelf_location TEXT,
+        notes TEXT,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        ready_at DATETIME,
+        picked_up_at DATETIME
+    )
+    """,
+    HISTORY_SCHEMA.format(prefix=''),
+    USAGE_SCHEMA.format(prefix=''),
+    "CREATE TABLE app_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL DEFAULT 0)",
+    "INSERT INTO app_meta (key, value) VALUES ('board_version', 0), ('history_version', 0)",
+    """
+    CREATE TRIGGER orders_version_insert AFTER INSERT ON orders BEGIN
+        UPDATE app_meta SET value = value + 1 WHERE key = 'board_version';
+    END
+    """,
+    "CREATE INDEX idx_history_archived ON stats_order_history(archived_at)",
+    "CREATE TABLE stats_wait_sketch (metric TEXT, platform TEXT, hour INTEGER, bucket INTEGER, count REAL)",
+    """
+    CREATE TRIGGER wait_sketch_dwell AFTER INSERT ON stats_order_history BEGIN
+        INSERT INTO stats_wait_sketch VALUES ('dwell', NEW.platform, 0, 0, 1);
+    END
+    """
+]
+
+
+def history_row(i):
+    created = f'2026-01-01 12:{i:02d}:00'
+    return (f'ORD-{i:08X}', f'Guest {i}', 'doordash', created,
+            f'2026-01-01 12:{i:02d}:30', f'2026-01-01 12:{i:02d}:50', 20, f'2026-01-01 12:{i:02d}:50')
+
+
+class SnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.source = self.make_db('source.db')
+        db = sqlite3.connect(self.source)
+        db.executemany(
+            "INSERT INTO stats_order_history (order_id, customer_name, platform, created_at, ready_at, picked_up_at, wait_time_seconds, archived_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [history_row(i) for i in range(40)]
+        )
+        db.execute("INSERT INTO orders (order_id, customer_name, platform) VALUES ('ORD-LIVE0001', 'Live Guest', 'ubereats')")
+        db.execute("INSERT INTO stats_api_usage (endpoint, requests, errors, date) VALUES ('stats', 7, 1, '2026-01-01')")
+        db.commit()
+        db.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def make_db(self, name):
+        path = os.path.join(self.dir, name)
+        db = sqlite3.connect(path)
+        for sql in SCHEMA:
+            db.execute(sql)
+        db.commit()
+        db.close()
+        return path
+
+    def test_export_import_round_trip(self):
+        path = os.path.join(self.dir, 'board.ndjson.gz')
+        counts = Snapshot(self.source).export(path)
+        self.assertEqual(counts, {'orders': 1, 'stats_order_history': 40, 'stats_api_usage': 1})
+        with gzip.open(path, 'rt') as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(lines[0]['tables'], ['orders', 'stats_order_history', 'stats_api_usage'])
+        self.assertEqual(lines[-1], {'end': True, 'counts': counts})
+
+        target = self.make_db('target.db')
+        report = Snapshot(target, batch_size=15).load(path)
+        self.assertEqual(report['inserted'], counts)
+
+        db = sqlite3.connect(target)
+        self.assertEqual(
+            db.execute("SELECT * FROM stats_order_history ORDER BY id").fetchall(),
+            sqlite3.connect(self.source).execute("SELECT * FROM stats_order_history ORDER BY id").fetchall()
+        )
+        # Indexes and version triggers are back, the derived sketch is left for the app to rebuild
+        names = {row[0] for row in db.execute("SELECT name FROM sqlite_master")}
+        self.assertIn('idx_history_archived', names)
+        self.assertIn('orders_version_insert', names)
+        self.assertNotIn('stats_wait_sketch', names)
+        self.assertNotIn('wait_sketch_dwell', names)
+        self.assertEqual(db.execute("SELECT value FROM app_meta WHERE key = 'board_version'").fetchone()[0], 1)
+        db.close()
+
+        # Re-importing skips rows that are already there; --replace loads them again
+        self.assertEqual(Snapshot(target).load(path)['skipped'], counts)
+        self.assertEqual(Snapshot(target).load(path, replace=True)['inserted'], counts)
+
+    def test_round_trip_with_empty_table(self):
+        db = sqlite3.connect(self.source)
+        db.execute("DELETE FROM stats_api_usage")
+        db.commit()
+        db.close()
+
+        path = os.path.join(self.dir, 'board.ndjson')
+        counts = Snapshot(self.source).export(path)
+        self.assertEqual(counts['stats_api_usage'], 0)
+        report = Snapshot(self.make_db('target.db')).load(path)
+        self.assertEqual(report['inserted'], {'orders': 1, 'stats_order_history': 40})
+
+    def test_truncated_snapshot_is_rejected(self):
+        path = os.path.join(self.dir, 'board.ndjson')
+        Snapshot(self.source).export(path)
+        with open(path) as f:
+            lines = f.readlines()
+        with open(path, 'w') as f:
+            f.writelines(lines[:-1])
+
+        target = self.make_db('target.db')
+        with self.assertRaisesRegex(ValueError, 'truncated'):
+            Snapshot(target).load(path)
+        # Indexes are rebuilt even when the load stops part way
+        names = {row[0] for row in sqlite3.connect(target).execute("SELECT name FROM sqlite_master")}
+        self.assertIn('idx_history_archived', names)
+
+    def test_malformed_records_are_rejected(self):
+        path = os.path.join(self.dir, 'board.ndjson')
+        Snapshot(self.source).export(path)
+        with open(path) as f:
+            lines = f.readlines()
+        for bad in ('[1, 2]\n', '"orders"\n', '{"row": {}}\n', '{"table": "orders"}\n',
+                    '{"table": 1, "row": {}}\n', '{"table": "orders", "row": [1]}\n', '{not json\n'):
+            with self.subTest(line=bad):
+                with self.assertRaisesRegex(ValueError, 'line 3'):
+                    list(read_snapshot(lines[:2] + [bad] + lines[2:]))
+
+    def test_replace_with_truncated_snapshot_keeps_existing_rows(self):
+        path = os.path.join(self.dir, 'board.ndjson')
+        Snapshot(self.source).export(path)
+        with open(path) as f:
+            lines = f.readlines()
+        with open(path, 'w') as f:
+            f.writelines(lines[:-1])
+
+        # Load into a copy of the source, which already has every row
+        with self.assertRaisesRegex(ValueError, 'truncated'):
+            Snapshot(self.source).load(path, replace=True)
+        db = sqlite3.connect(self.source)
+        self.assertEqual(db.execute("SELECT COUNT(*) FROM orders").fetchone()[0], 1)
+        self.assertEqual(db.execute("SELECT COUNT(*) FROM stats_order_history").fetchone()[0], 40)
+        names = {row[0] for row in db.execute("SELECT name FROM sqlite_master")}
+        self.assertTrue({'idx_history_archived', 'orders_version_insert', 'stats_wait_sketch'} <= names)
+        db.close()
+
+    def test_failed_batch_is_rolled_back(self):
+        path = os.path.join(self.dir, 'board.ndjson')
+        Snapshot(self.source).export(path)
+        with open(path) as f:
+            lines = f.readlines()
+        with open(path, 'w') as f:
+            f.writelines(lines[:-1])
+
+        target = self.make_db('target.db')
+        with self.assertRaisesRegex(ValueError, 'truncated'):
+            Snapshot(target, batch_size=15).load(path)
+        db = sqlite3.connect(target)
+        # Two full batches (the order + 29 history rows) were committed; the last one was rolled back
+        self.assertEqual(db.execute("SELECT COUNT(*) FROM orders").fetchone()[0], 1)
+        self.assertEqual(db.execute("SELECT COUNT(*) FROM stats_order_history").fetchone()[0], 29)
+        self.assertEqual(db.execute("SELECT COUNT(*) FROM stats_api_usage").fetchone()[0], 0)
+        db.close()
+
+    def test_replay_compresses_time(self):
+        path = os.path.join(self.dir, 'board.ndjson')
+        Snapshot(self.source).export(path)
+        now = [0.0]
+        slept = []
+
+        def sleep(seconds):
+            slept.append(seconds)
+            now[0] += seconds
+
+        with FakeOrderBoard() as board, open(path) as source:
+            replayer = Replayer(board.client(), speed=60, clock=lambda: now[0], sleep=sleep)
+            report = replayer.replay(read_snapshot(source), limit=5)
+            self.assertEqual((report['orders'], report['requests'], report['errors']), (5, 15, 0))
+            # 4m50s of history (first create to last pickup) in under 5 seconds at 60x
+            self.assertAlmostEqual(sum(slept), (4 * 60 + 50) / 60, places=6)
+            self.assertEqual(board.client().get_stats()['today_completed'], 5)
+            self.assertEqual(board.client().get_eta()['wait_times']['dwell']['doordash']['samples'], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Tests for orderboard_sdk.watcher against the in-process fake, driven by the
+fake's clock.
+
+    python -m pytest tests/python/test_watcher.py
+"""
+
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from orderboard_sdk.fake import FakeOrderBoard  # noqa: E402
+from orderboard_sdk.watcher import AgingWatcher  # noqa: E402
+
+T0 = 1767268800.0  # 2026-01-01 12:00:00 UTC
+
+
+class AgingWatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = T0
+        self.board = FakeOrderBoard(clock=lambda: self.now).start()
+        self.addCleanup(self.board.stop)
+        self.client = self.board.client()
+        self.alerts = []
+
+    def watcher(self, thresholds, repeat=None):
+        return AgingWatcher(self.client, thresholds=thresholds, on_expire=self.alerts.append, repeat=repeat)
+
+    def test_status_change_cancels_old_deadline(self):
+        watcher = self.watcher({'preparing': 100, 'ready': 300})
+        order = self.client.create_order('John Doe', 'doordash')
+        watcher.refresh()
+        self.assertEqual(watcher.next_deadline(), T0 + 100)
+
+        self.now = T0 + 50
+        self.client.mark_ready(order['order_id'], 'A')
+        watcher.refresh()
+        self.assertEqual(watcher.tick(T0 + 150), [])
+        self.assertEqual(watcher.next_deadline(), T0 + 350)
+
+        alerts = watcher.tick(T0 + 350)
+        self.assertEqual([(a.order['order_id'], a.status, a.threshold, a.age) for a in alerts],
+                         [(order['order_id'], 'ready', 300, 300)])
+        self.assertEqual(self.alerts, alerts)
+
+        # Picked up: the order leaves the board and nothing else fires
+        self.client.delete_order(order_id=order['order_id'])
+        watcher.refresh()
+        self.assertIsNone(watcher.next_deadline())
+
+    def test_platform_status_key_overrides_status_threshold(self):
+        watcher = self.watcher({'ready': 600, 'doordash:ready': 60})
+        for name, platform in (('Dash Guest', 'doordash'), ('Uber Guest', 'ubereats')):
+            created = self.client.create_order(name, platform)
+            self.client.mark_ready(created['order_id'], 'B')
+        watcher.refresh()
+
+        self.assertEqual([a.order['platform'] for a in watcher.tick(T0 + 60)], ['doordash'])
+        self.assertEqual(watcher.tick(T0 + 599), [])
+        self.assertEqual([(a.order['platform'], a.threshold) for a in watcher.tick(T0 + 600)], [('ubereats', 600)])
+
+    def test_repeat_realerts_while_stuck(self):
+        watcher = self.watcher({'preparing': 100}, repeat=30)
+        self.client.create_order('John Doe', 'doordash')
+        watcher.refresh()
+
+        self.assertEqual([a.age for a in watcher.tick(T0 + 100)], [100])
+        self.assertEqual(watcher.tick(T0 + 129), [])
+        self.assertEqual([a.age for a in watcher.tick(T0 + 130)], [130])
+        # A late tick alerts once and schedules the next repeat on the original cadence
+        self.assertEqual([a.age for a in watcher.tick(T0 + 200)], [200])
+        self.assertEqual(watcher.next_deadline(), T0 + 220)
+
+        # Unchanged orders keep their schedule across refreshes
+        watcher.refresh()
+        self.assertEqual(watcher.next_deadline(), T0 + 220)
+        self.assertEqual(len(self.alerts), 3)
+
+    def test_heap_compacts_after_many_cancellations(self):
+        watcher = self.watcher({'preparing': 100, 'ready': 100})
+        orders = [self.client.create_order(f'Guest {i}', 'grubhub') for i in range(10)]
+        watcher.refresh()
+
+        for i in range(50):
+            self.now = T0 + i + 1
+            for order in orders:
+                self.client.update_order(order_id=order['order_id'], status='ready' if i % 2 == 0 else 'preparing')
+            watcher.refresh()
+            self.assertLessEqual(len(watcher._heap), 2 * len(orders) + 64)
+
+        # Only the latest deadline per order is live
+        self.assertEqual(len(watcher.tick(T0 + 10_000)), len(orders))
+        self.assertIsNone(watcher.next_deadline())
+
+
+if __name__ == '__main__':
+    unittest.main()